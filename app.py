@@ -1,27 +1,80 @@
 import smtplib
-import ssl
-from email.message import EmailMessage
+import threading
+import time
 from collections import defaultdict
+from functools import wraps
+from itertools import islice
 import os
-from flask import Flask, jsonify, render_template, request, session
+import click
+from flask import Flask, Request, Response, g, jsonify, make_response, render_template, request, session
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, func, inspect, or_, tuple_, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import joinedload, selectinload
 from werkzeug.utils import secure_filename
-import requests
+import heapq
 import json
-import whisper
 import warnings
+import zipfile
+from datetime import date, datetime, timedelta
+from importlib import metadata
 import dotenv
+from jobs import JobQueue, FINISHED_STAGES, new_job_id
+from transcription import SAMPLE_RATE, ChunkedTranscriber
+from model_manager import WhisperModelManager, WHISPER_MODEL_SIZES
+from ollama_client import OllamaClient
+from task_extraction import extract_tasks_from_chunks, extract_tasks_map_reduce, iter_chunks, match_tasks
+from result_cache import ResultCache, content_hash, file_digest
+from pagination import cursor_value, decode_cursor, encode_cursor, keyset_page, parse_int, parse_limit, wants_page
+from mailer import OutboxWorker, RateLimiter, SMTPTransport, backoff_delay, build_message, is_transient
+from reminders import ReminderSchedule, ReminderScheduler, build_digest, parse_lead_days
+from recurrence import FREQUENCIES, last_start, occurrences
+from db_config import database_uri, engine_options, install_sqlite_pragmas
+from dates import parse_date, parse_datetime, parse_time, split_deadline
+from migrations import MigrationError, run_migrations
+from ingest import IncomingUpload, UploadTooLarge, cleanup_uploads, file_extension, iter_archive, iter_input_files, load_pcm, prepare_audio, store_stream, upload_key
+from documents import iter_document, read_document
+from change_feed import ChangeFeed
+from response_cache import ResponseCache
+from name_resolver import EmployeeResolver
+import search_index
+from search_index import match_expression, search_meetings, search_tasks
+from metrics import CONTENT_TYPE, Registry, begin_timings, bind_timings, collect_timings, end_timings, record_count, record_time
 dotenv.load_dotenv()
 warnings.filterwarnings("ignore", message="FP16 is not supported on CPU*")
 
 app = Flask(__name__)
-db = SQLAlchemy(app)
 
 app.config['SECRET_KEY'] = os.getenv('UNIQUE_KEY', 'default_secret_key')
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///multibrain.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = database_uri()
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'])
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+db = SQLAlchemy(app)
+with app.app_context():
+    install_sqlite_pragmas(db.engine)
 EMAIL_ADDRESS = os.getenv("EMAIL_ADDRESS")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+SMTP_HOST = os.getenv('SMTP_HOST', 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '465'))
+SMTP_SSL = os.getenv('SMTP_SSL', '1') == '1'
+SMTP_STARTTLS = os.getenv('SMTP_STARTTLS', '0') == '1'
+EMAIL_BATCH_SIZE = int(os.getenv('EMAIL_BATCH_SIZE', '50'))
+EMAIL_RATE_PER_SECOND = float(os.getenv('EMAIL_RATE_PER_SECOND', '2'))
+EMAIL_MAX_ATTEMPTS = int(os.getenv('EMAIL_MAX_ATTEMPTS', '5'))
+EMAIL_POLL_SECONDS = float(os.getenv('EMAIL_POLL_SECONDS', '30'))
+REMINDERS_ENABLED = os.getenv('REMINDERS_ENABLED', '1') == '1'
+BACKGROUND_WORKERS = os.getenv('BACKGROUND_WORKERS', '1') == '1'
+REMINDER_LEAD_DAYS = parse_lead_days(os.getenv('REMINDER_LEAD_DAYS', '3,1,0'))
+REMINDER_HOUR = int(os.getenv('REMINDER_HOUR', '9'))
+REMINDER_OVERDUE_EVERY_DAYS = int(os.getenv('REMINDER_OVERDUE_EVERY_DAYS', '1'))
+REMINDER_OVERDUE_DAYS = int(os.getenv('REMINDER_OVERDUE_DAYS', '14'))
+REMINDER_POLL_SECONDS = float(os.getenv('REMINDER_POLL_SECONDS', '300'))
+EVENT_DEFAULT_MINUTES = int(os.getenv('EVENT_DEFAULT_MINUTES', '60'))
+AUTO_ASSIGN_CREATE_EVENTS = os.getenv('AUTO_ASSIGN_CREATE_EVENTS', '0') == '1'
+# Bounding event length lets a range query start its index scan this far
+# before the window instead of at the beginning of time.
+EVENT_MAX_DURATION = timedelta(days=31)
+EVENTS_MAX_OCCURRENCES = 5000
 
 OLLAMA_PROMPT_TEMPLATE = """
 You are given a meeting transcript:
@@ -50,52 +103,434 @@ Extract ONLY the actionable tasks and return them as valid JSON in this exact sh
 - Action items must be realistic based on professional meetings.
 - Ignore fictional or literary content.
 """
-whisper_model = whisper.load_model("base", device="cpu")
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'base')
+WHISPER_IDLE_SECONDS = float(os.getenv('WHISPER_IDLE_SECONDS', '0'))
+whisper_models = WhisperModelManager(
+    default_size=WHISPER_MODEL,
+    device="cpu",
+    idle_timeout=WHISPER_IDLE_SECONDS
+)
+if os.getenv('WHISPER_PRELOAD') == '1':
+    whisper_models.preload()
+
+TRANSCRIBE_WORKERS = int(os.getenv('TRANSCRIBE_WORKERS', os.cpu_count() or 1))
+TRANSCRIBE_SEGMENT_SECONDS = float(os.getenv('TRANSCRIBE_SEGMENT_SECONDS', '60'))
+TRANSCRIBE_MIN_CHUNKED_SECONDS = float(os.getenv('TRANSCRIBE_MIN_CHUNKED_SECONDS', '120'))
 
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 ALLOWED_EXTENSIONS = {'mp3', 'wav', 'txt', 'pdf', 'docx'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
+MAX_UPLOAD_BYTES = int(float(os.getenv('MAX_UPLOAD_MB', '500')) * 1024 * 1024)
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES + 1024 * 1024 if MAX_UPLOAD_BYTES else None
+UPLOAD_RETENTION_DAYS = float(os.getenv('UPLOAD_RETENTION_DAYS', '30'))
+UPLOAD_MAX_STORAGE_BYTES = int(float(os.getenv('UPLOAD_MAX_STORAGE_MB', '0')) * 1024 * 1024)
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '2'))
+BATCH_WORKERS = int(os.getenv('BATCH_WORKERS', '4'))
+BATCH_MAX_UPLOAD_BYTES = int(float(os.getenv('BATCH_MAX_UPLOAD_MB', '5000')) * 1024 * 1024)
+AUTO_ASSIGN_MIN_CONFIDENCE = float(os.getenv('AUTO_ASSIGN_MIN_CONFIDENCE', '0.8'))
+AUTO_ASSIGN_MIN_AI_CONFIDENCE = float(os.getenv('AUTO_ASSIGN_MIN_AI_CONFIDENCE', '0.7'))
+
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # A zip of recorded meetings can be larger than any single recording.
+        if self.path == '/batches' and file_extension(filename or '') == 'zip':
+            return IncomingUpload(UPLOAD_FOLDER, BATCH_MAX_UPLOAD_BYTES)
+        return IncomingUpload(UPLOAD_FOLDER, MAX_UPLOAD_BYTES)
+
+app.request_class = UploadRequest
+
+OLLAMA_URL = os.getenv('OLLAMA_URL', 'http://localhost:11434')
+OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'llama2:latest')
+ANALYSIS_CHUNK_TOKENS = int(os.getenv('ANALYSIS_CHUNK_TOKENS', '1500'))
+ANALYSIS_PARALLELISM = int(os.getenv('ANALYSIS_PARALLELISM', '2'))
+# Stored on each meeting; meetings analysed with another prompt, model or
+# chunk size are stale and can be re-analysed from their transcript.
+ANALYSIS_FINGERPRINT = content_hash(OLLAMA_PROMPT_TEMPLATE, f'{OLLAMA_MODEL}:{ANALYSIS_CHUNK_TOKENS}')
+REANALYSIS_WORKERS = int(os.getenv('REANALYSIS_WORKERS', '2'))
+REANALYSIS_MATCH_THRESHOLD = float(os.getenv('REANALYSIS_MATCH_THRESHOLD', '0.6'))
+# Ollama calls in flight across all jobs; more jobs only queue for a slot.
+LLM_CONCURRENCY = int(os.getenv('LLM_CONCURRENCY', str(JOB_WORKERS * ANALYSIS_PARALLELISM)))
+llm_slots = threading.BoundedSemaphore(max(1, LLM_CONCURRENCY))
+
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', '1') == '1'
+TOKEN_BUCKETS = (64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+metrics = Registry()
+stage_seconds = metrics.histogram('multibrain_stage_seconds', 'Time spent in each upload pipeline stage.', ['stage'])
+http_request_seconds = metrics.histogram(
+    'multibrain_http_request_seconds', 'HTTP request latency by endpoint.', ['method', 'endpoint', 'status']
+)
+db_query_seconds = metrics.histogram('multibrain_db_query_seconds', 'SQL statement execution time.', ['operation'])
+audio_duration_seconds = metrics.histogram(
+    'multibrain_audio_duration_seconds', 'Length of transcribed recordings.',
+    buckets=(30, 60, 300, 600, 1200, 1800, 3600, 7200)
+)
+transcription_rtf = metrics.histogram(
+    'multibrain_transcription_real_time_factor', 'Transcription time divided by recording length.', ['model'],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 1.5, 2, 3, 5)
+)
+ollama_request_seconds = metrics.histogram('multibrain_ollama_request_seconds', 'Duration of one Ollama generate call.', ['model'])
+ollama_first_token_seconds = metrics.histogram(
+    'multibrain_ollama_first_token_seconds', 'Time until Ollama streams its first token.', ['model']
+)
+ollama_prompt_tokens = metrics.histogram('multibrain_ollama_prompt_tokens', 'Prompt tokens per Ollama call.', ['model'], TOKEN_BUCKETS)
+ollama_response_tokens = metrics.histogram(
+    'multibrain_ollama_response_tokens', 'Generated tokens per Ollama call.', ['model'], TOKEN_BUCKETS
+)
+job_seconds = metrics.histogram('multibrain_job_seconds', 'Total processing time of an upload.', ['file_type', 'result'])
+smtp_seconds = metrics.histogram('multibrain_smtp_seconds', 'SMTP connection setup and per-message send time.', ['operation'])
+emails_total = metrics.counter('multibrain_emails_total', 'Outbox delivery attempts by result.', ['result'])
+reminder_tasks_total = metrics.counter(
+    'multibrain_reminder_tasks_total', 'Task reminders that came due, by whether anyone could be emailed.', ['result']
+)
+reminder_digests_total = metrics.counter('multibrain_reminder_digests_total', 'Reminder digests queued for sending.')
+metrics.gauge('multibrain_job_queue_depth', 'Uploads queued or being processed.', ['queue'],
+              callback=lambda: {(name,): queue.depth() for name, queue in job_queues.items()})
+metrics.gauge('multibrain_job_workers', 'Uploads processed in parallel.', ['queue'],
+              callback=lambda: {(name,): queue.max_workers for name, queue in job_queues.items()})
+metrics.gauge('multibrain_stream_subscribers', 'Open /stream connections.', callback=lambda: change_feed.stats()['subscribers'])
+metrics.counter('multibrain_cache_hits_total', 'Result cache hits.', ['cache'],
+                callback=lambda: {(name,): cache.hits for name, cache in result_caches.items()})
+metrics.counter('multibrain_cache_misses_total', 'Result cache misses.', ['cache'],
+                callback=lambda: {(name,): cache.misses for name, cache in result_caches.items()})
+
+def stage(name):
+    return stage_seconds.timer(breakdown=name, stage=name)
+
+def record_ollama_stats(stats):
+    ollama_request_seconds.observe(stats['seconds'], model=OLLAMA_MODEL)
+    record_time('ollama', stats['seconds'])
+    if stats['first_token_seconds'] is not None:
+        ollama_first_token_seconds.observe(stats['first_token_seconds'], model=OLLAMA_MODEL)
+    stage_seconds.observe(stats['parse_seconds'], stage='json_parse')
+    record_time('json_parse', stats['parse_seconds'])
+    for name, histogram in (('prompt_tokens', ollama_prompt_tokens), ('response_tokens', ollama_response_tokens)):
+        if stats.get(name) is not None:
+            histogram.observe(stats[name], model=OLLAMA_MODEL)
+            record_count(name, stats[name])
+
+ollama = OllamaClient(
+    base_url=OLLAMA_URL,
+    model=OLLAMA_MODEL,
+    timeout=120,
+    pool_size=max(1, LLM_CONCURRENCY),
+    on_stats=record_ollama_stats
+)
+
+os.makedirs(app.instance_path, exist_ok=True)
+CACHE_DB_PATH = os.getenv('CACHE_DB_PATH', os.path.join(app.instance_path, 'cache.db'))
+CACHE_MAX_MB = float(os.getenv('CACHE_MAX_MB', '256'))
+transcription_cache = ResultCache(CACHE_DB_PATH, 'transcription', max_bytes=int(CACHE_MAX_MB * 1024 * 1024))
+analysis_cache = ResultCache(CACHE_DB_PATH, 'analysis', max_bytes=int(CACHE_MAX_MB * 1024 * 1024))
+HTTP_CACHE_MAX_MB = float(os.getenv('HTTP_CACHE_MAX_MB', '16'))
+response_cache = ResponseCache(max_bytes=int(HTTP_CACHE_MAX_MB * 1024 * 1024))
+result_caches = {cache.name: cache for cache in (transcription_cache, analysis_cache, response_cache)}
+
+STREAM_HEARTBEAT_SECONDS = float(os.getenv('STREAM_HEARTBEAT_SECONDS', '15'))
+STREAM_HISTORY = int(os.getenv('STREAM_HISTORY', '1000'))
+change_feed = ChangeFeed(history=STREAM_HISTORY)
+
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_started'] = time.perf_counter()
+
+def observe_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop('query_started', time.perf_counter())
+    operation = statement.lstrip()[:6].lower()
+    if operation not in ('select', 'insert', 'update', 'delete'):
+        operation = 'other'
+    db_query_seconds.observe(elapsed, operation=operation)
+    record_time('db', elapsed)
+    record_count('db_queries')
+
+def start_commit_timer(db_session):
+    db_session.info['commit_started'] = time.perf_counter()
+
+def observe_commit(db_session):
+    started = db_session.info.pop('commit_started', None)
+    if started is not None:
+        elapsed = time.perf_counter() - started
+        stage_seconds.observe(elapsed, stage='db_commit')
+        record_time('db_commit', elapsed)
+
+def discard_commit_timer(db_session):
+    db_session.info.pop('commit_started', None)
+
+def start_request_timings():
+    g.timings, g.timings_token = begin_timings()
+
+def finish_request_timings(response):
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    timings = g.timings
+    elapsed = time.perf_counter() - timings.started
+    http_request_seconds.observe(elapsed, method=request.method, endpoint=endpoint, status=response.status_code)
+    server_timing = timings.server_timing()
+    response.headers['Server-Timing'] = f'app;dur={elapsed * 1000:.2f}' + (f', {server_timing}' if server_timing else '')
+    if request.args.get('timings') == '1' and response.is_json and not response.direct_passthrough:
+        data = response.get_json(silent=True)
+        if isinstance(data, dict):
+            data['timings'] = timings.to_dict()
+            response.set_data(json.dumps(data))
+            # The body no longer matches the cached ETag.
+            response.headers.pop('ETag', None)
+    return response
+
+def end_request_timings(error):
+    token = g.pop('timings_token', None)
+    if token is not None:
+        end_timings(token)
+
+# Registered before the session hooks below so commit time includes their
+# flush and version bump.
+if METRICS_ENABLED:
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', start_query_timer)
+        event.listen(db.engine, 'after_cursor_execute', observe_query)
+    event.listen(db.session, 'before_commit', start_commit_timer)
+    event.listen(db.session, 'after_commit', observe_commit)
+    event.listen(db.session, 'after_rollback', discard_commit_timer)
+    app.before_request(start_request_timings)
+    app.after_request(finish_request_timings)
+    app.teardown_request(end_request_timings)
+
+def queue_change(event_type, data):
+    db.session.info.setdefault('changes', []).append((event_type, data))
+
+@event.listens_for(db.session, 'after_commit')
+def publish_changes(db_session):
+    for event_type, data in db_session.info.pop('changes', []):
+        change_feed.publish(event_type, data)
+
+@event.listens_for(db.session, 'after_rollback')
+def discard_changes(db_session):
+    db_session.info.pop('changes', None)
+
+def package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+WHISPER_VERSION = package_version('openai-whisper')
+
+def quote_texts(values):
+    return [value if isinstance(value, str) else json.dumps(value) for value in values or [] if value is not None]
 
 class Meeting(db.Model):
     __tablename__ = 'meetings'
     id = db.Column(db.Integer, primary_key=True)
     file_name = db.Column(db.String(255))
     transcript = db.Column(db.Text)
+    analysis_fingerprint = db.Column(db.String(64), nullable=True, index=True)
     
     tasks = db.relationship('Task', backref='meeting', lazy=True)
 
 class Task(db.Model):
     __tablename__ = 'tasks'
     id = db.Column(db.Integer, primary_key=True)
-    meeting_id = db.Column(db.Integer, db.ForeignKey('meetings.id'), nullable=False)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meetings.id'), nullable=False, index=True)
     description = db.Column(db.Text)
     ai_assignee = db.Column(db.String(120), nullable=True)
     ai_assignee_confidence = db.Column(db.Float, nullable=True)
-    deadline = db.Column(db.String(120), nullable=True) 
-    source_quotes = db.Column(db.Text, nullable=True)
+    deadline = db.Column(db.Date, nullable=True, index=True)
+    deadline_text = db.Column(db.Text, nullable=True)
     assigned_employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'))
-    status = db.Column(db.String(20), nullable=False, default='pending')
+    status = db.Column(db.String(20), nullable=False, default='pending', index=True)
+    # When this task is next due a reminder; NULL once nothing is left to
+    # send. The index is the scheduler's queue.
+    next_reminder_at = db.Column(db.DateTime, nullable=True, index=True)
+
+    quotes = db.relationship('TaskQuote', order_by='TaskQuote.position', cascade='all, delete-orphan', lazy=True)
+
+    __table_args__ = (
+        db.Index('ix_tasks_assigned_employee_id_status', 'assigned_employee_id', 'status'),
+    )
+
+    @property
+    def source_quotes(self):
+        return [quote.text for quote in self.quotes]
+
+    @source_quotes.setter
+    def source_quotes(self, values):
+        self.quotes = [TaskQuote(position=position, text=value) for position, value in enumerate(quote_texts(values))]
+
+    @property
+    def deadline_label(self):
+        if self.deadline:
+            return self.deadline.isoformat()
+        return self.deadline_text
+
+    def set_deadline(self, value):
+        self.deadline, self.deadline_text = split_deadline(value, reminder_scheduler.clock().date())
+
+class TaskQuote(db.Model):
+    __tablename__ = 'task_quotes'
+    id = db.Column(db.Integer, primary_key=True)
+    task_id = db.Column(db.Integer, db.ForeignKey('tasks.id'), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.Text, nullable=False)
 
 class Event(db.Model):
     __tablename__ = 'events'
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
-    date = db.Column(db.String(50), nullable=False)
-    time = db.Column(db.String(50), nullable=False)
+    starts_at = db.Column(db.DateTime, nullable=False)
+    ends_at = db.Column(db.DateTime, nullable=False)
     category = db.Column(db.String(20), nullable=False, default='meeting')
     description = db.Column(db.Text, nullable=True)
+    # A repeating event is one row; its occurrences are worked out for the
+    # window being read. recurrence_until is the latest an occurrence can
+    # start, NULL for no end.
+    recurrence = db.Column(db.String(10), nullable=True)
+    recurrence_interval = db.Column(db.Integer, nullable=False, default=1)
+    recurrence_until = db.Column(db.DateTime, nullable=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meetings.id'), nullable=True, index=True)
+
+    __table_args__ = (
+        # One-off events are read with recurrence IS NULL and a starts_at
+        # range; the few series with recurrence IS NOT NULL.
+        db.Index('ix_events_recurrence_starts_at', 'recurrence', 'starts_at'),
+    )
 
-    def to_dict(self):
+    def to_dict(self, starts_at=None):
+        starts_at = starts_at or self.starts_at
+        ends_at = starts_at + (self.ends_at - self.starts_at)
+        recurrence = None
+        if self.recurrence:
+            recurrence = {
+                'frequency': self.recurrence,
+                'interval': self.recurrence_interval,
+                'until': self.recurrence_until.isoformat(timespec='minutes') if self.recurrence_until else None,
+            }
         return {
             'id': self.id,
             'title': self.title,
-            'date': self.date,
-            'time': self.time,
+            'date': starts_at.date().isoformat(),
+            'time': starts_at.time().isoformat(timespec='minutes'),
+            'starts_at': starts_at.isoformat(timespec='minutes'),
+            'ends_at': ends_at.isoformat(timespec='minutes'),
             'category': self.category,
-            'description': self.description
+            'description': self.description,
+            'recurrence': recurrence,
+            'meeting_id': self.meeting_id,
         }
 
+class Job(db.Model):
+    __tablename__ = 'jobs'
+    id = db.Column(db.String(32), primary_key=True)
+    file_name = db.Column(db.String(255))
+    file_path = db.Column(db.String(512))
+    file_type = db.Column(db.String(20))
+    content_hash = db.Column(db.String(64), nullable=True, index=True)
+    model_size = db.Column(db.String(20), nullable=True)
+    stage = db.Column(db.String(20), nullable=False, default='queued')
+    progress = db.Column(db.Float, nullable=False, default=0.0)
+    error = db.Column(db.Text, nullable=True)
+    result = db.Column(db.Text, nullable=True)
+    meeting_id = db.Column(db.Integer, db.ForeignKey('meetings.id'), nullable=True)
+    batch_id = db.Column(db.String(32), db.ForeignKey('batches.id'), nullable=True, index=True)
+    # JSON: the calendar event to create for the meeting, if one was asked for.
+    event_options = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        data = {
+            'id': self.id,
+            'file_name': self.file_name,
+            'file_type': self.file_type,
+            'stage': self.stage,
+            'progress': self.progress,
+            'error': self.error,
+            'meeting_id': self.meeting_id,
+            'batch_id': self.batch_id,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+        if self.result:
+            data.update(json.loads(self.result))
+        return data
+
+    def to_event(self, **extra):
+        return dict({
+            'id': self.id,
+            'stage': self.stage,
+            'progress': self.progress,
+            'error': self.error,
+            'meeting_id': self.meeting_id,
+        }, **extra)
+
+class Batch(db.Model):
+    __tablename__ = 'batches'
+    id = db.Column(db.String(32), primary_key=True)
+    source = db.Column(db.String(512))
+    notify = db.Column(db.Boolean, nullable=False, default=False)
+    skipped = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    @property
+    def skipped_files(self):
+        return json.loads(self.skipped or '[]')
+
+    def to_dict(self, include_files=True):
+        rows = db.session.query(
+            Job.id, Job.file_name, Job.file_type, Job.stage, Job.progress, Job.error, Job.meeting_id, Job.updated_at
+        ).filter(Job.batch_id == self.id).order_by(Job.created_at, Job.id).all()
+        counts = defaultdict(int)
+        for row in rows:
+            counts[row.stage] += 1
+        finished = [row.updated_at for row in rows if row.stage in FINISHED_STAGES and row.updated_at]
+        unfinished = len(rows) - counts['done'] - counts['failed']
+        end = datetime.utcnow() if unfinished or not finished else max(finished)
+        hours = max((end - self.created_at).total_seconds(), 1) / 3600
+        data = {
+            'id': self.id,
+            'source': self.source,
+            'notify': self.notify,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'finished': unfinished == 0,
+            'files': len(rows),
+            'stages': dict(counts),
+            'skipped': len(self.skipped_files),
+            'meetings_per_hour': round(counts['done'] / hours, 1),
+        }
+        if include_files:
+            data['jobs'] = [
+                {
+                    'id': row.id,
+                    'file_name': row.file_name,
+                    'file_type': row.file_type,
+                    'stage': row.stage,
+                    'progress': row.progress,
+                    'error': row.error,
+                    'meeting_id': row.meeting_id,
+                }
+                for row in rows
+            ]
+            data['skipped_files'] = self.skipped_files
+        return data
+
+class OutboxEmail(db.Model):
+    __tablename__ = 'outbox_emails'
+    id = db.Column(db.Integer, primary_key=True)
+    to_address = db.Column(db.String(255), nullable=False)
+    subject = db.Column(db.String(255), nullable=False)
+    body = db.Column(db.Text, nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='pending')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    last_error = db.Column(db.Text, nullable=True)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.Index('ix_outbox_emails_status_next_attempt_at', 'status', 'next_attempt_at'),
+    )
+
+class ResourceVersion(db.Model):
+    __tablename__ = 'resource_versions'
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False)
+
 class Employee(db.Model):
     __tablename__ = 'employees'
     id = db.Column(db.Integer, primary_key=True)
@@ -106,19 +541,20 @@ class Employee(db.Model):
     avatar = db.Column(db.String(255), nullable=True)
 
     tasks = db.relationship('Task', backref='assigned_employee', lazy=True)
+    aliases = db.relationship('EmployeeAlias', lazy=True, cascade='all, delete-orphan')
 
-    def to_dict_with_stats(self):
-        pending = 0
-        completed = 0
+    @property
+    def alias_names(self):
+        return [alias.alias for alias in self.aliases]
+
+    @alias_names.setter
+    def alias_names(self, values):
+        self.aliases = [EmployeeAlias(alias=value.strip()) for value in values if value and value.strip()]
+
+    def to_dict_with_stats(self, stats=None):
+        if stats is None:
+            stats = employee_task_counts([self.id]).get(self.id, {})
 
-        for t in self.tasks:
-            if t.status == 'pending':
-                pending += 1
-            elif t.status == 'complete':
-                completed += 1
-            else:
-                print(f"Warning: Task with unknown status '{t.status}' for task ID {t.id}")
-        
         return {
             'id': self.id,
             'name': self.name,
@@ -126,32 +562,626 @@ class Employee(db.Model):
             'position': self.position,
             'email': self.email,
             'avatar': self.avatar,
-            'total_pending_tasks': pending,
-            'total_completed_tasks': completed,
+            'total_pending_tasks': stats.get('pending', 0),
+            'total_completed_tasks': stats.get('complete', 0),
         }
 
-def send_email(to_address, subject, body):
-    msg = EmailMessage()
-    msg['From'] = EMAIL_ADDRESS
-    msg['To'] = to_address
-    msg['Subject'] = subject
-    msg.set_content(body)
+class EmployeeAlias(db.Model):
+    __tablename__ = 'employee_aliases'
+    id = db.Column(db.Integer, primary_key=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False, index=True)
+    alias = db.Column(db.String(255), nullable=False)
+
+def employee_task_counts(employee_ids=None):
+    query = db.session.query(
+        Task.assigned_employee_id, Task.status, func.count(Task.id)
+    ).filter(Task.assigned_employee_id.isnot(None))
+    if employee_ids is not None:
+        query = query.filter(Task.assigned_employee_id.in_(employee_ids))
+
+    counts = defaultdict(dict)
+    for employee_id, status, total in query.group_by(Task.assigned_employee_id, Task.status):
+        counts[employee_id][status] = total
+    return counts
+
+def parse_date_arg(args, name):
+    try:
+        return parse_date(args[name])
+    except ValueError:
+        raise ValueError(f'{name} must be a date (YYYY-MM-DD)')
+
+def filter_tasks(query, args):
+    status = args.get('status')
+    if status:
+        if status not in ['pending', 'complete']:
+            raise ValueError('Invalid status filter')
+        query = query.filter(Task.status == status)
+
+    meeting_id = parse_int(args, 'meeting_id')
+    if meeting_id is not None:
+        query = query.filter(Task.meeting_id == meeting_id)
+
+    assigned_employee_id = args.get('assigned_employee_id')
+    if assigned_employee_id == 'none':
+        query = query.filter(Task.assigned_employee_id.is_(None))
+    elif assigned_employee_id:
+        query = query.filter(Task.assigned_employee_id == parse_int(args, 'assigned_employee_id'))
+
+    if args.get('deadline_from'):
+        query = query.filter(Task.deadline >= parse_date_arg(args, 'deadline_from'))
+    if args.get('deadline_to'):
+        query = query.filter(Task.deadline <= parse_date_arg(args, 'deadline_to'))
+    return query
+
+def list_response(query, order_columns, key, serialize):
+    if not wants_page(request.args):
+        return jsonify([serialize(row) for row in query.order_by(*order_columns).all()]), 200
+
+    rows, next_cursor = keyset_page(
+        query,
+        order_columns,
+        key,
+        after=request.args.get('after'),
+        limit=parse_limit(request.args.get('limit'))
+    )
+    return jsonify({'items': [serialize(row) for row in rows], 'next_cursor': next_cursor}), 200
+
+# Which cached resource a write to each table invalidates. Meeting file
+# names are part of every task listing.
+VERSIONED_TABLES = {
+    'tasks': 'tasks',
+    'task_quotes': 'tasks',
+    'meetings': 'tasks',
+    'employees': 'employees',
+    'employee_aliases': 'employees',
+    'events': 'events',
+}
+
+def touch_resource(db_session, table_name):
+    resource = VERSIONED_TABLES.get(table_name)
+    if resource:
+        db_session.info.setdefault('touched', set()).add(resource)
+
+@event.listens_for(db.session, 'before_flush')
+def track_flushed_writes(db_session, flush_context, instances):
+    for obj in list(db_session.new) + list(db_session.dirty) + list(db_session.deleted):
+        touch_resource(db_session, obj.__table__.name)
+
+@event.listens_for(db.session, 'do_orm_execute')
+def track_bulk_writes(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        touch_resource(orm_execute_state.session, orm_execute_state.bind_mapper.local_table.name)
+
+@event.listens_for(db.session, 'before_commit')
+def bump_resource_versions(db_session):
+    db_session.flush()
+    names = sorted(db_session.info.pop('touched', ()))
+    if not names:
+        return
+    # The version is bumped in the same transaction as the write, so every
+    # process serving the database sees the change.
+    result = db_session.execute(
+        update(ResourceVersion)
+        .where(ResourceVersion.name.in_(names))
+        .values(version=ResourceVersion.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount < len(names):
+        existing = {name for name, in db_session.query(ResourceVersion.name).filter(ResourceVersion.name.in_(names))}
+        # Start from the clock so a recreated table never repeats a version.
+        start = int(time.time() * 1000)
+        db_session.add_all(ResourceVersion(name=name, version=start) for name in names if name not in existing)
+        db_session.flush()
+
+@event.listens_for(db.session, 'after_rollback')
+def discard_touched_resources(db_session):
+    db_session.info.pop('touched', None)
+
+employee_resolver = EmployeeResolver()
+
+@event.listens_for(db.session, 'after_flush')
+def track_employee_changes(db_session, flush_context):
+    employee_ids = set()
+    for obj in list(db_session.new) + list(db_session.dirty) + list(db_session.deleted):
+        if isinstance(obj, Employee):
+            employee_ids.add(obj.id)
+        elif isinstance(obj, EmployeeAlias):
+            employee_ids.add(obj.employee_id)
+    if employee_ids:
+        db_session.info.setdefault('employees_changed', set()).update(employee_ids)
+
+@event.listens_for(db.session, 'after_commit')
+def mark_employees_stale(db_session):
+    employee_ids = db_session.info.pop('employees_changed', None)
+    if employee_ids:
+        employee_resolver.mark_stale(employee_ids)
+
+@event.listens_for(db.session, 'after_rollback')
+def discard_employee_changes(db_session):
+    db_session.info.pop('employees_changed', None)
+
+def load_resolver_rows(employee_ids=None):
+    query = Employee.query.options(selectinload(Employee.aliases))
+    if employee_ids is not None:
+        query = query.filter(Employee.id.in_(employee_ids))
+    return [(e.id, e.name, e.email, e.alias_names) for e in query]
+
+def refresh_employee_resolver():
+    with employee_resolver.refresh_lock:
+        stale, local_changes = employee_resolver.take_stale()
+        version = resource_versions(('employees',))[0]
+        loaded = employee_resolver.version
+        # Commits from this process say exactly which employees changed; if
+        # the version moved by more than that, another process wrote too.
+        if loaded is None or version - loaded != local_changes:
+            employee_resolver.replace_all(load_resolver_rows())
+        elif stale:
+            rows = load_resolver_rows(stale)
+            for row in rows:
+                employee_resolver.upsert(*row)
+            for employee_id in stale - {row[0] for row in rows}:
+                employee_resolver.remove(employee_id)
+        employee_resolver.version = version
+    return employee_resolver
+
+def resolve_assignee(name):
+    if not name:
+        return None
+    match = employee_resolver.resolve(name)
+    if match.confidence >= AUTO_ASSIGN_MIN_CONFIDENCE:
+        return match.employee_id
+    return None
+
+def ai_assignee_is_confident(confidence):
+    try:
+        return float(confidence) >= AUTO_ASSIGN_MIN_AI_CONFIDENCE
+    except (TypeError, ValueError):
+        return False
+
+def ai_assignee_id(name, confidence):
+    # The model has to be sure whom it meant as well as the name matching an
+    # employee; otherwise the assignee stays a suggestion to confirm.
+    return resolve_assignee(name) if ai_assignee_is_confident(confidence) else None
+
+def resource_versions(names):
+    versions = dict(db.session.query(ResourceVersion.name, ResourceVersion.version).filter(ResourceVersion.name.in_(names)))
+    return tuple(versions.get(name, 0) for name in names)
+
+def cached_response(*resources):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            key = (request.path, tuple(sorted(request.args.items(multi=True))), resource_versions(resources))
+            entry = response_cache.get(key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                entry = response_cache.set(key, response.get_data(), response.mimetype)
+
+            response = Response(entry.body, mimetype=entry.mimetype)
+            response.set_etag(entry.etag)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.make_conditional(request)
+            if response.status_code == 304:
+                response_cache.record_not_modified()
+            return response
+        return wrapper
+    return decorator
+
+BULK_ID_CHUNK = 500
+
+def existing_ids(column, ids):
+    ids = list(ids)
+    found = set()
+    for start in range(0, len(ids), BULK_ID_CHUNK):
+        chunk = ids[start:start + BULK_ID_CHUNK]
+        found.update(row[0] for row in db.session.query(column).filter(column.in_(chunk)))
+    return found
+
+def task_states(ids):
+    ids = list(ids)
+    states = {}
+    for start in range(0, len(ids), BULK_ID_CHUNK):
+        chunk = ids[start:start + BULK_ID_CHUNK]
+        rows = db.session.query(Task.id, Task.assigned_employee_id, Task.status, Task.deadline).filter(Task.id.in_(chunk))
+        states.update((task_id, (employee_id, status, deadline)) for task_id, employee_id, status, deadline in rows)
+    return states
+
+def queue_task_changes(event_type, changes):
+    for start in range(0, len(changes), BULK_ID_CHUNK):
+        queue_change(event_type, {'tasks': changes[start:start + BULK_ID_CHUNK]})
+
+def parse_bulk_items(data, key, value_name):
+    items = data.get(key)
+    if isinstance(items, dict):
+        return list(items.items())
+    if isinstance(items, list) and all(isinstance(item, dict) for item in items):
+        return [(item.get('task_id'), item.get(value_name)) for item in items]
+    raise ValueError(f'Invalid {key} format')
+
+def apply_bulk_assignments(pairs):
+    results = []
+    for raw_task_id, raw_employee_id in pairs:
+        try:
+            results.append({'task_id': int(raw_task_id), 'employee_id': int(raw_employee_id)})
+        except (TypeError, ValueError):
+            results.append({'task_id': raw_task_id, 'employee_id': raw_employee_id,
+                            'result': 'skipped', 'reason': 'invalid id'})
+
+    pending = [result for result in results if 'result' not in result]
+    states = task_states({result['task_id'] for result in pending})
+    employee_ids = existing_ids(Employee.id, {result['employee_id'] for result in pending})
+
+    updates = {}
+    changes = {}
+    for result in pending:
+        if result['task_id'] not in states:
+            result.update(result='skipped', reason='task not found')
+        elif result['employee_id'] not in employee_ids:
+            result.update(result='skipped', reason='employee not found')
+        else:
+            result['result'] = 'applied'
+            task_id = result['task_id']
+            previous_employee_id, status, _ = states[task_id]
+            updates[task_id] = {'id': task_id, 'assigned_employee_id': result['employee_id']}
+            changes[task_id] = {
+                'id': task_id,
+                'assigned_employee_id': result['employee_id'],
+                'previous_employee_id': previous_employee_id,
+                'status': status,
+            }
+
+    if updates:
+        db.session.execute(update(Task), list(updates.values()))
+    queue_task_changes('task.assigned', [
+        change for change in changes.values() if change['assigned_employee_id'] != change['previous_employee_id']
+    ])
+    return results
+
+def apply_bulk_statuses(pairs):
+    results = []
+    for raw_task_id, status in pairs:
+        try:
+            result = {'task_id': int(raw_task_id), 'status': status}
+        except (TypeError, ValueError):
+            result = {'task_id': raw_task_id, 'status': status, 'result': 'skipped', 'reason': 'invalid id'}
+        else:
+            if status not in ['pending', 'complete']:
+                result.update(result='skipped', reason='invalid status')
+        results.append(result)
+
+    pending = [result for result in results if 'result' not in result]
+    states = task_states({result['task_id'] for result in pending})
+
+    updates = {}
+    changes = {}
+    now = reminder_scheduler.clock()
+    for result in pending:
+        if result['task_id'] not in states:
+            result.update(result='skipped', reason='task not found')
+        else:
+            result['result'] = 'applied'
+            task_id = result['task_id']
+            employee_id, previous_status, deadline = states[task_id]
+            updates[task_id] = {
+                'id': task_id,
+                'status': result['status'],
+                'next_reminder_at': reminder_at(deadline, result['status'], now),
+            }
+            changes[task_id] = {
+                'id': task_id,
+                'status': result['status'],
+                'previous_status': previous_status,
+                'assigned_employee_id': employee_id,
+            }
+
+    if updates:
+        db.session.execute(update(Task), list(updates.values()))
+    queue_task_changes('task.status', [
+        change for change in changes.values() if change['status'] != change['previous_status']
+    ])
+    return results
+
+# The full-text index is created and dropped with the tables it covers,
+# so create_all() (fresh databases, benchmarks) always gets it.
+@event.listens_for(db.metadata, 'after_create')
+def create_search_index(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        search_index.install(connection)
+
+@event.listens_for(db.metadata, 'before_drop')
+def drop_search_index(target, connection, **kw):
+    if connection.dialect.name == 'sqlite':
+        search_index.uninstall(connection)
+
+def migrate_database():
+    applied = run_migrations(db.engine.url, db.create_all)
+    if applied:
+        print("Applied migrations:", ", ".join(applied))
+
+@app.cli.command('migrate')
+def migrate_command():
+    migrate_database()
+
+mail_transport = SMTPTransport(
+    SMTP_HOST,
+    SMTP_PORT,
+    username=EMAIL_ADDRESS if EMAIL_PASSWORD else None,
+    password=EMAIL_PASSWORD,
+    use_ssl=SMTP_SSL,
+    starttls=SMTP_STARTTLS
+)
+email_rate_limiter = RateLimiter(EMAIL_RATE_PER_SECOND)
+
+def queue_email(to_address, subject, body):
+    email = OutboxEmail(to_address=to_address, subject=subject, body=body)
+    db.session.add(email)
+    return email
+
+def record_email_failure(email, error):
+    email.attempts += 1
+    email.last_error = str(error)[:1000]
+    if is_transient(error) and email.attempts < EMAIL_MAX_ATTEMPTS:
+        email.next_attempt_at = datetime.utcnow() + timedelta(seconds=backoff_delay(email.attempts))
+    else:
+        email.status = 'failed'
+    emails_total.inc(result='failed' if email.status == 'failed' else 'retry')
+    print(f"Error sending email {email.id} to {email.to_address} (attempt {email.attempts}): {error}")
+
+# Consecutive batches that couldn't reach the mail server, for backoff.
+outbox_connection_failures = 0
 
-    stmp_server = "smtp.gmail.com"
-    port = 465
+def drain_outbox():
+    global outbox_connection_failures
+    with app.app_context():
+        batch = OutboxEmail.query.filter(
+            OutboxEmail.status == 'pending',
+            OutboxEmail.next_attempt_at <= datetime.utcnow()
+        ).order_by(OutboxEmail.next_attempt_at, OutboxEmail.id).limit(EMAIL_BATCH_SIZE).all()
+        if not batch:
+            return 0
+
+        sent = 0
+        current = None
+        try:
+            connect_started = time.perf_counter()
+            with mail_transport.session() as server:
+                smtp_seconds.observe(time.perf_counter() - connect_started, operation='connect')
+                outbox_connection_failures = 0
+                for email in batch:
+                    current = email
+                    email_rate_limiter.wait()
+                    try:
+                        with smtp_seconds.timer(operation='send'):
+                            server.send_message(build_message(EMAIL_ADDRESS, email.to_address, email.subject, email.body))
+                    except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                        record_email_failure(email, e)
+                    else:
+                        email.status = 'sent'
+                        email.sent_at = datetime.utcnow()
+                        emails_total.inc(result='sent')
+                        sent += 1
+                    db.session.commit()
+                    current = None
+        except Exception as e:
+            db.session.rollback()
+            if not is_transient(e):
+                for email in batch:
+                    if email.status == 'pending':
+                        record_email_failure(email, e)
+            else:
+                # The connection failed, not the messages: only the one being
+                # sent counts an attempt, the rest wait without using theirs.
+                outbox_connection_failures += 1
+                retry_at = datetime.utcnow() + timedelta(seconds=backoff_delay(outbox_connection_failures))
+                if current is not None:
+                    record_email_failure(current, e)
+                for email in batch:
+                    if email.status == 'pending' and email is not current:
+                        email.last_error = str(e)[:1000]
+                        email.next_attempt_at = retry_at
+                print(f"Mail server connection failed, retrying the outbox at {retry_at:%H:%M:%S}: {e}")
+            db.session.commit()
+
+        return sent
+
+outbox_worker = OutboxWorker(drain_outbox, poll_seconds=EMAIL_POLL_SECONDS)
 
-    context = ssl.create_default_context()
+reminder_schedule = ReminderSchedule(
+    REMINDER_LEAD_DAYS,
+    hour=REMINDER_HOUR,
+    overdue_every=REMINDER_OVERDUE_EVERY_DAYS,
+    overdue_days=REMINDER_OVERDUE_DAYS
+)
 
-    with smtplib.SMTP_SSL(stmp_server, port, context=context) as server:
-        server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-        server.send_message(msg)
+def reminder_at(deadline, status, now):
+    if status not in (None, 'pending'):
+        return None
+    return reminder_schedule.next_after(deadline, now)
+
+@event.listens_for(db.session, 'before_flush')
+def schedule_task_reminders(db_session, flush_context, instances):
+    now = None
+    for obj in list(db_session.new) + list(db_session.dirty):
+        if not isinstance(obj, Task):
+            continue
+        state = inspect(obj)
+        if obj in db_session.new or state.attrs.deadline.history.has_changes() or state.attrs.status.history.has_changes():
+            now = now or reminder_scheduler.clock()
+            obj.next_reminder_at = reminder_at(obj.deadline, obj.status, now)
+
+def next_reminder_due():
+    with app.app_context():
+        try:
+            return db.session.query(func.min(Task.next_reminder_at)).scalar()
+        finally:
+            db.session.remove()
+
+def send_due_reminders(now):
+    # One pass over the tasks whose reminder time has come, found through
+    # the next_reminder_at index, so a tick costs the same with ten open
+    # tasks or fifty thousand. Each person gets one digest for all of them.
+    with app.app_context():
+        rows = db.session.query(
+            Task.id, Task.description, Task.deadline, Task.status, Task.assigned_employee_id,
+            Task.ai_assignee, Task.ai_assignee_confidence
+        ).filter(Task.next_reminder_at <= now).order_by(Task.next_reminder_at, Task.id).all()
+        if not rows:
+            return 0
+
+        refresh_employee_resolver()
+        updates = []
+        tasks_by_employee_id = defaultdict(list)
+        resolved = {}
+        unassigned = 0
+        for row in rows:
+            # Tasks completed by a bulk update still hold their old slot;
+            # they leave the queue here instead of being reminded.
+            remind = row.status == 'pending' and row.deadline is not None
+            updates.append({'id': row.id, 'next_reminder_at': reminder_at(row.deadline, row.status, now)})
+            if not remind:
+                continue
+            employee_id = row.assigned_employee_id
+            if employee_id is None and ai_assignee_is_confident(row.ai_assignee_confidence):
+                # The same few names come up on many tasks; match each once.
+                if row.ai_assignee not in resolved:
+                    resolved[row.ai_assignee] = resolve_assignee(row.ai_assignee)
+                employee_id = resolved[row.ai_assignee]
+            if employee_id:
+                tasks_by_employee_id[employee_id].append((row.description, row.deadline))
+            else:
+                unassigned += 1
+
+        for start in range(0, len(updates), BULK_ID_CHUNK):
+            db.session.execute(update(Task), updates[start:start + BULK_ID_CHUNK])
+
+        queued = 0
+        reminded = 0
+        employee_ids = list(tasks_by_employee_id)
+        for start in range(0, len(employee_ids), BULK_ID_CHUNK):
+            chunk = employee_ids[start:start + BULK_ID_CHUNK]
+            for emp in Employee.query.filter(Employee.id.in_(chunk)):
+                if not emp.email:
+                    continue
+                subject, body = build_digest(emp.name, tasks_by_employee_id[emp.id], now.date())
+                queue_email(to_address=emp.email, subject=subject, body=body)
+                queued += 1
+                reminded += len(tasks_by_employee_id[emp.id])
+        db.session.commit()
+
+        due = sum(len(tasks) for tasks in tasks_by_employee_id.values()) + unassigned
+        reminder_tasks_total.inc(reminded, result='sent')
+        reminder_tasks_total.inc(due - reminded, result='no_recipient')
+        reminder_digests_total.inc(queued)
+        if queued:
+            outbox_worker.wake()
+        return queued
+
+def reschedule_reminders(now):
+    # For after changing the REMINDER_ settings: every open task with a
+    # deadline gets its next reminder worked out again.
+    scheduled = 0
+    last_id = 0
+    while True:
+        rows = db.session.query(Task.id, Task.deadline).filter(
+            Task.id > last_id, Task.status == 'pending', Task.deadline.isnot(None)
+        ).order_by(Task.id).limit(BULK_ID_CHUNK).all()
+        if not rows:
+            break
+        updates = [{'id': task_id, 'next_reminder_at': reminder_schedule.next_after(deadline, now)} for task_id, deadline in rows]
+        db.session.execute(update(Task), updates)
+        scheduled += sum(1 for row in updates if row['next_reminder_at'])
+        last_id = rows[-1].id
+    db.session.query(Task).filter(Task.status != 'pending', Task.next_reminder_at.isnot(None)).update(
+        {'next_reminder_at': None}, synchronize_session=False
+    )
+    db.session.commit()
+    return scheduled
+
+reminder_scheduler = ReminderScheduler(send_due_reminders, next_reminder_due, poll_seconds=REMINDER_POLL_SECONDS)
+
+@app.route('/admin/reminders', methods=['GET'])
+def get_reminder_status():
+    now = reminder_scheduler.clock()
+    upcoming = db.session.query(func.min(Task.next_reminder_at)).scalar()
+    return jsonify({
+        'enabled': REMINDERS_ENABLED,
+        'lead_days': reminder_schedule.lead_days,
+        'hour': REMINDER_HOUR,
+        'overdue_every_days': REMINDER_OVERDUE_EVERY_DAYS,
+        'overdue_days': REMINDER_OVERDUE_DAYS,
+        'scheduled': Task.query.filter(Task.next_reminder_at.isnot(None)).count(),
+        'due': Task.query.filter(Task.next_reminder_at <= now).count(),
+        'next_reminder_at': upcoming.isoformat() if upcoming else None,
+    }), 200
+
+@app.cli.command('reminders')
+@click.option('--now', 'at', help='Act as if it were this time (YYYY-MM-DD HH:MM), e.g. to preview a morning.')
+@click.option('--reschedule', is_flag=True, help='Recompute every open task\'s next reminder first.')
+def reminders_command(at, reschedule):
+    migrate_database()
+    now = datetime.fromisoformat(at) if at else reminder_scheduler.clock()
+    if reschedule:
+        print(f"Rescheduled {reschedule_reminders(now)} tasks")
+    queued = send_due_reminders(now)
+    print(f"Queued {queued} reminder digests")
+    # The outbox worker woken by send_due_reminders() delivers them; wait
+    # until it has tried everything that is due.
+    while OutboxEmail.query.filter(
+        OutboxEmail.status == 'pending', OutboxEmail.next_attempt_at <= datetime.utcnow()
+    ).count():
+        time.sleep(1)
+        db.session.commit()
 
 def allowed_filename(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def transcribe_audio(file_path):
-    result = whisper_model.transcribe(file_path)
-    return result.get('text', '').strip()
+transcribers = {}
+transcribers_lock = threading.Lock()
+
+def get_transcriber(model_size=None):
+    model_size = whisper_models.resolve_size(model_size)
+    # Jobs run on several threads; two first uploads for the same size must
+    # not each start a process pool with its own Whisper copies.
+    with transcribers_lock:
+        if model_size not in transcribers:
+            def transcribe_single(audio):
+                result = whisper_models.get(model_size).transcribe(audio)
+                return result.get('text', '').strip()
+
+            transcriber = ChunkedTranscriber(
+                model_name=model_size,
+                workers=TRANSCRIBE_WORKERS,
+                segment_seconds=TRANSCRIBE_SEGMENT_SECONDS,
+                min_chunked_seconds=TRANSCRIBE_MIN_CHUNKED_SECONDS,
+                local_transcribe=transcribe_single
+            )
+            # WHISPER_IDLE_SECONDS stops the worker processes too, not just
+            # the in-process model.
+            whisper_models.register_idle_closer(transcriber.close_if_idle)
+            transcribers[model_size] = transcriber
+        return transcribers[model_size]
+
+def transcribe_audio(file_path, model_size=None, digest=None):
+    model_size = whisper_models.resolve_size(model_size)
+    key = content_hash(digest or file_digest(file_path), f'whisper:{model_size}:{WHISPER_VERSION}')
+    cached = transcription_cache.get(key)
+    if cached is not None:
+        print("Transcription cache hit:", file_path)
+        return cached['text']
+
+    with stage('audio_decode'):
+        audio = load_pcm(prepare_audio(file_path))
+    started = time.perf_counter()
+    with stage('transcription'):
+        text = get_transcriber(model_size).transcribe_array(audio)
+    audio_seconds = len(audio) / SAMPLE_RATE
+    if audio_seconds > 0:
+        audio_duration_seconds.observe(audio_seconds)
+        transcription_rtf.observe((time.perf_counter() - started) / audio_seconds, model=model_size)
+    transcription_cache.set(key, {'text': text})
+    return text
 
 def is_audio_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'mp3', 'wav'}
@@ -159,47 +1189,84 @@ def is_audio_file(filename):
 def is_text_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'txt', 'pdf', 'docx'}
 
-def analyse_transcipt(text):
+def analyse_chunk(text, on_task=None):
     prompt = OLLAMA_PROMPT_TEMPLATE.format(transcript=text)
-
-    response = requests.post(
-        "http://localhost:11434/api/generate",
-        json={
-            "model": "llama2:latest",
-            "prompt": prompt,
-            "stream": False  
-        },
-        timeout = 120
+    with stage('llm_wait'):
+        llm_slots.acquire()
+    try:
+        return ollama.extract_tasks(prompt, on_task=on_task)
+    finally:
+        llm_slots.release()
+
+def analysis_key(source):
+    return content_hash(source, OLLAMA_PROMPT_TEMPLATE, f'{OLLAMA_MODEL}:{ANALYSIS_CHUNK_TOKENS}')
+
+def cached_analysis(key, on_task=None):
+    cached = analysis_cache.get(key)
+    if cached is not None:
+        print("Analysis cache hit")
+        if on_task is not None:
+            for t in cached.get('tasks', []):
+                on_task(dict(t))
+    return cached
+
+def analyse_transcipt(text, on_task=None):
+    key = analysis_key(text)
+    cached = cached_analysis(key, on_task)
+    if cached is not None:
+        return cached
+
+    parsed = extract_tasks_map_reduce(
+        text,
+        bind_timings(analyse_chunk),
+        max_tokens=ANALYSIS_CHUNK_TOKENS,
+        parallelism=ANALYSIS_PARALLELISM,
+        on_task=on_task
     )
 
-    response.raise_for_status()
-    raw = response.json()
-
     print("Completed response")
 
-    model_text = raw.get("response", "")
-    try:
-        parsed = json.loads(model_text)
-    except json.JSONDecodeError:
-        raise ValueError("Model did not return valid JSON")
-
+    analysis_cache.set(key, parsed)
     return parsed
 
-def send_task_emails_for_meeting(meeting, tasks):
-    employees = Employee.query.all()
-    employees_by_name = {e.name.lower(): e for e in employees}
+def analyse_document(file_path, digest=None, on_task=None):
+    key = analysis_key(f'document:{digest or file_digest(file_path)}')
+    cached = cached_analysis(key, on_task)
+    if cached is not None:
+        return read_document(file_path), cached
 
-    tasks_by_employee = defaultdict(list)
+    pieces = []
 
-    for task in tasks:
-        if not task.ai_assignee:
-            continue
+    def read_pieces():
+        for piece in iter_document(file_path):
+            pieces.append(piece)
+            yield piece
 
-        emp = employees_by_name.get(task.ai_assignee.lower())
-        if not emp or not emp.email:
-            continue
+    parsed = extract_tasks_from_chunks(
+        iter_chunks(read_pieces(), ANALYSIS_CHUNK_TOKENS),
+        bind_timings(analyse_chunk),
+        parallelism=ANALYSIS_PARALLELISM,
+        on_task=on_task
+    )
+
+    print("Completed response")
 
-        tasks_by_employee[emp].append(task)
+    analysis_cache.set(key, parsed)
+    return '\n\n'.join(pieces), parsed
+
+def send_task_emails_for_meeting(meeting, tasks):
+    refresh_employee_resolver()
+    tasks_by_employee_id = defaultdict(list)
+    for task in tasks:
+        employee_id = task.assigned_employee_id or ai_assignee_id(task.ai_assignee, task.ai_assignee_confidence)
+        if employee_id:
+            tasks_by_employee_id[employee_id].append(task)
+
+    tasks_by_employee = {}
+    if tasks_by_employee_id:
+        for emp in Employee.query.filter(Employee.id.in_(list(tasks_by_employee_id))):
+            if emp.email:
+                tasks_by_employee[emp] = tasks_by_employee_id[emp.id]
 
     for emp, emp_tasks in tasks_by_employee.items():
         lines = [
@@ -210,7 +1277,7 @@ def send_task_emails_for_meeting(meeting, tasks):
         ]
         for t in emp_tasks:
             lines.append(
-                f"- {t.description} (Deadline: {t.deadline or 'Not specified'})"
+                f"- {t.description} (Deadline: {t.deadline_label or 'Not specified'})"
             )
         lines.append("")
         lines.append("Please make sure to complete these on time.")
@@ -220,12 +1287,16 @@ def send_task_emails_for_meeting(meeting, tasks):
 
         body = "\n".join(lines)
 
-        send_email(
+        queue_email(
             to_address=emp.email,
             subject="Meeting Task Reminder",
             body=body
         )
 
+    db.session.commit()
+    if tasks_by_employee:
+        outbox_worker.wake()
+
 @app.route('/', methods=['GET'])
 def dashboard():
     return render_template('dash.html')
@@ -259,23 +1330,19 @@ def add_new_task():
 
     new_task = Task(
         description=description,
-        deadline=deadline,
         assigned_employee_id=assigned_employee_id,
         status='pending',
         meeting_id=1
     )
+    new_task.set_deadline(deadline)
     
     db.session.add(new_task)
     try:
+        db.session.flush()
+        task_data = task_to_dict(new_task)
+        queue_change('task.created', task_data)
         db.session.commit()
-        return jsonify({
-            'id': new_task.id,
-            'description': new_task.description,
-            'deadline': new_task.deadline,
-            'status': new_task.status,
-            'assigned_employee_id': new_task.assigned_employee_id,
-            'meeting_file_name': new_task.meeting.file_name if new_task.meeting else None
-        }), 201
+        return jsonify(task_data), 201
     except Exception as e:
         db.session.rollback()
         print(f"Error adding new task: {e}")
@@ -293,6 +1360,13 @@ def update_task_status(task_id):
     if new_status not in ['pending', 'complete']:
         return jsonify({'success': False, 'message': 'Invalid status provided'}), 400
     
+    if task.status != new_status:
+        queue_task_changes('task.status', [{
+            'id': task.id,
+            'status': new_status,
+            'previous_status': task.status,
+            'assigned_employee_id': task.assigned_employee_id,
+        }])
     task.status = new_status
     try:
         db.session.commit()
@@ -300,7 +1374,7 @@ def update_task_status(task_id):
             'id': task.id,
             'description': task.description,
             'status': task.status,
-            'deadline': task.deadline,
+            'deadline': task.deadline_label,
             'assigned_employee_id': task.assigned_employee_id
         }), 200
     except Exception as e:
@@ -308,59 +1382,537 @@ def update_task_status(task_id):
         print(f"Error updating task status: {e}")
         return jsonify({'success': False, 'message': 'Failed to update task status in database'}), 500
 
+def task_to_dict(task):
+    employee_name = None
+    if task.assigned_employee:
+        employee_name = task.assigned_employee.name
+
+    return {
+        'id': task.id,
+        'description': task.description,
+        'ai_assignee': task.ai_assignee,
+        'ai_assignee_confidence': task.ai_assignee_confidence,
+        'deadline': task.deadline_label,
+        'source_quotes': task.source_quotes,
+        'assigned_employee_id': task.assigned_employee_id,
+        'assigned_employee_name': employee_name,
+        'status': task.status,
+        'meeting_id': task.meeting_id,
+        'meeting_file_name': task.meeting.file_name if task.meeting else None
+    }
+
 @app.route('/tasks', methods=['GET'])
+@cached_response('tasks', 'employees')
 def get_all_tasks():
-    tasks = Task.query.all()
-    tasks_data = []
-    for task in tasks:
-        employee_name = None
-        if task.assigned_employee_id:
-            employee = Employee.query.get(task.assigned_employee_id)
-            if employee:
-                employee_name = employee.name
+    query = Task.query.options(
+        joinedload(Task.assigned_employee),
+        joinedload(Task.meeting).load_only(Meeting.id, Meeting.file_name),
+        joinedload(Task.quotes)
+    )
+    try:
+        query = filter_tasks(query, request.args)
+        return list_response(query, [Task.id], lambda task: [task.id], task_to_dict)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
 
-        tasks_data.append({
-            'id': task.id,
-            'description': task.description,
-            'ai_assignee': task.ai_assignee,
-            'ai_assignee_confidence': task.ai_assignee_confidence,
-            'deadline': task.deadline,
-            'source_quotes': json.loads(task.source_quotes or '[]'),
-            'assigned_employee_id': task.assigned_employee_id,
-            'assigned_employee_name': employee_name,
-            'status': task.status,
-            'meeting_id': task.meeting_id,
-            'meeting_file_name': task.meeting.file_name if task.meeting else None
-        })
-    return jsonify(tasks_data), 200
+def task_to_response(task):
+    return {
+        'id': task.id,
+        'description': task.description,
+        'deadline': task.deadline_label,
+        'ai_assignee': task.ai_assignee,
+        'ai_assignee_confidence': task.ai_assignee_confidence,
+        'source_quotes': task.source_quotes,
+        'assigned_employee_id': task.assigned_employee_id
+    }
+
+def apply_ai_task(task, t):
+    task.description = t.get('description')
+    task.ai_assignee = t.get('assignee')
+    task.ai_assignee_confidence = t.get('assignee_confidence')
+    task.set_deadline(t.get('deadline'))
+    task.source_quotes = t.get('source_quotes', [])
+    if task.assigned_employee_id is None:
+        task.assigned_employee_id = ai_assignee_id(task.ai_assignee, task.ai_assignee_confidence)
+    return task
+
+def build_task(meeting_id, t):
+    return apply_ai_task(Task(meeting_id=meeting_id), t)
+
+def set_job_stage(job, stage, progress):
+    job.stage = stage
+    job.progress = progress
+    queue_change('job.progress', job.to_event())
+    db.session.commit()
+    print(f"Job {job.id}: {stage} ({int(progress * 100)}%)")
+
+def meeting_event_options(form):
+    # Form fields of an upload asking for the meeting to go on the calendar.
+    if form.get('createEvent', '1' if AUTO_ASSIGN_CREATE_EVENTS else '0') != '1':
+        return None
+    starts_at = parse_datetime(form['eventStart']) if form.get('eventStart') else datetime.now().replace(second=0, microsecond=0)
+    try:
+        minutes = int(form.get('eventDuration') or EVENT_DEFAULT_MINUTES)
+    except ValueError:
+        raise ValueError('eventDuration must be a number of minutes')
+    if minutes < 1 or timedelta(minutes=minutes) > EVENT_MAX_DURATION:
+        raise ValueError(f'eventDuration must be between 1 minute and {EVENT_MAX_DURATION.days} days')
+    return {
+        'title': form.get('eventTitle') or None,
+        'starts_at': starts_at.isoformat(),
+        'duration_minutes': minutes,
+    }
+
+def create_meeting_event(job, meeting, task_count):
+    # Added in the same commit as the meeting's tasks, so a retried job
+    # finds it and doesn't add another.
+    if not job.event_options or Event.query.filter(Event.meeting_id == meeting.id).first():
+        return None
+    options = json.loads(job.event_options)
+    starts_at = datetime.fromisoformat(options['starts_at'])
+    event = Event(
+        title=options['title'] or f"Meeting: {meeting.file_name.rsplit('.', 1)[0]}",
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(minutes=options['duration_minutes']),
+        category='meeting',
+        description=f"{task_count} tasks extracted from {meeting.file_name}",
+        meeting_id=meeting.id
+    )
+    db.session.add(event)
+    db.session.flush()
+    queue_change('event.created', event.to_dict())
+    return event
+
+def discard_partial_meeting(job):
+    meeting = db.session.get(Meeting, job.meeting_id)
+    if meeting:
+        for task in list(meeting.tasks):
+            db.session.delete(task)
+        db.session.delete(meeting)
+    job.meeting_id = None
+    job.result = None
+    db.session.commit()
+
+def run_upload_job(job_id):
+    with app.app_context(), collect_timings() as timings:
+        job = db.session.get(Job, job_id)
+        if job is None or job.stage in FINISHED_STAGES:
+            return
+
+        try:
+            refresh_employee_resolver()
+            if job.meeting_id and job.stage in ('persisting', 'emailing'):
+                meeting = db.session.get(Meeting, job.meeting_id)
+                saved_tasks = list(meeting.tasks)
+                transcript_text = meeting.transcript
+                analysis_json = json.loads(job.result or '{}').get('analysis')
+            else:
+                if job.meeting_id:
+                    discard_partial_meeting(job)
+
+                if job.file_type == 'recording':
+                    set_job_stage(job, 'transcribing', 0.1)
+                    transcript_text = transcribe_audio(job.file_path, job.model_size, job.content_hash)
+                    set_job_stage(job, 'analysing', 0.5)
+                else:
+                    set_job_stage(job, 'analysing', 0.2)
+                    transcript_text = None
+
+                # Uploads save tasks as they stream in so the page can show
+                # them; batch imports write the meeting and all its tasks in
+                # one transaction once the analysis is complete.
+                streaming = job.batch_id is None
+                meeting = None
+                if streaming:
+                    meeting = Meeting(
+                        file_name=job.file_name,
+                        transcript=transcript_text,
+                        analysis_fingerprint=ANALYSIS_FINGERPRINT
+                    )
+                    db.session.add(meeting)
+                    db.session.flush()
+                    job.meeting_id = meeting.id
+                    queue_change('job.progress', job.to_event())
+                    db.session.commit()
+
+                saved_tasks = []
+
+                def save_streamed_task(t):
+                    task = build_task(meeting.id, t)
+                    db.session.add(task)
+                    db.session.flush()
+                    saved_tasks.append(task)
+                    job.result = json.dumps({'tasks': [task_to_response(task) for task in saved_tasks]})
+                    queue_change('task.created', task_to_dict(task))
+                    queue_change('job.progress', job.to_event(tasks_found=len(saved_tasks)))
+                    db.session.commit()
+
+                on_task = save_streamed_task if streaming else None
+                with stage('analysis'):
+                    if job.file_type == 'recording':
+                        analysis_json = analyse_transcipt(transcript_text, on_task=on_task)
+                    else:
+                        transcript_text, analysis_json = analyse_document(
+                            job.file_path, job.content_hash, on_task=on_task
+                        )
+                if meeting is None:
+                    meeting = Meeting(
+                        file_name=job.file_name,
+                        transcript=transcript_text,
+                        analysis_fingerprint=ANALYSIS_FINGERPRINT
+                    )
+                    db.session.add(meeting)
+                    db.session.flush()
+                    job.meeting_id = meeting.id
+                else:
+                    meeting.transcript = transcript_text
+                print("Analysis JSON:", analysis_json)
+
+                job.stage = 'persisting'
+                job.progress = 0.8
+                tasks_from_ai = analysis_json.get('tasks', [])
+                for task, t in zip(saved_tasks, tasks_from_ai):
+                    apply_ai_task(task, t)
+                new_tasks = []
+                for t in tasks_from_ai[len(saved_tasks):]:
+                    task = build_task(meeting.id, t)
+                    db.session.add(task)
+                    new_tasks.append(task)
+                saved_tasks.extend(new_tasks)
+                db.session.flush()
+                for task in new_tasks:
+                    queue_change('task.created', task_to_dict(task))
+                create_meeting_event(job, meeting, len(saved_tasks))
+                job.result = json.dumps({
+                    'analysis': analysis_json,
+                    'tasks': [task_to_response(task) for task in saved_tasks]
+                })
+                queue_change('job.progress', job.to_event(tasks_found=len(saved_tasks)))
+                db.session.commit()
+
+            set_job_stage(job, 'emailing', 0.9)
+            if job.batch_id is None or db.session.get(Batch, job.batch_id).notify:
+                try:
+                    with stage('email_queue'):
+                        send_task_emails_for_meeting(meeting, saved_tasks)
+                except Exception as e:
+                    print("Error sending task emails:", e)
+
+            job.result = json.dumps({
+                'transcript': transcript_text,
+                'analysis': analysis_json,
+                'tasks': [task_to_response(task) for task in saved_tasks],
+                'timings': timings.to_dict()
+            })
+            set_job_stage(job, 'done', 1.0)
+        except Exception as e:
+            db.session.rollback()
+            job = db.session.get(Job, job_id)
+            print(f"Job {job_id} failed during {job.stage}: {e}")
+            job.error = f'Error during {job.stage}: {str(e)}'
+            if job.meeting_id and job.stage in ('transcribing', 'analysing'):
+                discard_partial_meeting(job)
+            set_job_stage(job, 'failed', job.progress)
+
+        job_seconds.observe(time.perf_counter() - timings.started, file_type=job.file_type, result=job.stage)
+        prune_uploads()
+
+def prune_uploads():
+    unfinished = Job.query.filter(Job.stage.notin_(FINISHED_STAGES)).with_entities(Job.file_path).all()
+    removed, freed = cleanup_uploads(
+        UPLOAD_FOLDER,
+        max_age_seconds=UPLOAD_RETENTION_DAYS * 86400,
+        max_bytes=UPLOAD_MAX_STORAGE_BYTES,
+        keep={upload_key(file_path) for file_path, in unfinished if file_path}
+    )
+    if removed:
+        print(f"Removed {removed} old uploads ({freed / (1024 * 1024):.1f} MB)")
+
+def has_ai_assignment(task):
+    # Assignments made by hand differ from what the suggested assignee
+    # resolves to; those are the user's and re-analysis leaves them alone.
+    return task.assigned_employee_id is None or task.assigned_employee_id == resolve_assignee(task.ai_assignee)
+
+def reapply_ai_task(task, t):
+    follow_ai = has_ai_assignment(task)
+    deadline, deadline_text = split_deadline(t.get('deadline'), reminder_scheduler.clock().date())
+    if deadline_text and deadline_text == task.deadline_text and task.deadline:
+        # "By Friday" meant the Friday after the meeting, not after this run.
+        deadline = task.deadline
+    values = {
+        'description': t.get('description'),
+        'ai_assignee': t.get('assignee'),
+        'ai_assignee_confidence': t.get('assignee_confidence'),
+        'deadline': deadline,
+        'deadline_text': deadline_text,
+    }
+    changed = False
+    for name, value in values.items():
+        if getattr(task, name) != value:
+            setattr(task, name, value)
+            changed = True
+    quotes = quote_texts(t.get('source_quotes'))
+    if task.source_quotes != quotes:
+        task.source_quotes = quotes
+        changed = True
+
+    previous_employee_id = task.assigned_employee_id
+    if follow_ai:
+        task.assigned_employee_id = ai_assignee_id(task.ai_assignee, task.ai_assignee_confidence)
+    return changed, previous_employee_id
+
+def update_meeting_tasks(meeting, tasks_from_ai):
+    # Only tasks whose AI fields changed are written. Statuses and manual
+    # assignments are kept, and a task the new analysis no longer finds is
+    # only deleted if nobody has touched it.
+    existing = list(meeting.tasks)
+    pairs = match_tasks(
+        [{'description': task.description, 'source_quotes': task.source_quotes} for task in existing],
+        tasks_from_ai,
+        threshold=REANALYSIS_MATCH_THRESHOLD
+    )
+    summary = {'created': 0, 'updated': 0, 'unchanged': 0, 'deleted': 0, 'kept': 0}
+    updated = []
+    assigned = []
+    for i, j in pairs:
+        task = existing[i]
+        changed, previous_employee_id = reapply_ai_task(task, tasks_from_ai[j])
+        if task.assigned_employee_id != previous_employee_id:
+            assigned.append({
+                'id': task.id,
+                'assigned_employee_id': task.assigned_employee_id,
+                'previous_employee_id': previous_employee_id,
+                'status': task.status,
+            })
+        changed = changed or task.assigned_employee_id != previous_employee_id
+        if changed:
+            updated.append(task)
+        summary['updated' if changed else 'unchanged'] += 1
+
+    matched_existing = {i for i, _ in pairs}
+    matched_new = {j for _, j in pairs}
+    deleted = []
+    for i, task in enumerate(existing):
+        if i in matched_existing:
+            continue
+        if task.status != 'pending' or not has_ai_assignment(task):
+            summary['kept'] += 1
+            continue
+        deleted.append({'id': task.id, 'assigned_employee_id': task.assigned_employee_id, 'status': task.status})
+        db.session.delete(task)
+    created = []
+    for j, t in enumerate(tasks_from_ai):
+        if j not in matched_new:
+            task = build_task(meeting.id, t)
+            db.session.add(task)
+            created.append(task)
+    db.session.flush()
+
+    summary.update(created=len(created), deleted=len(deleted))
+    for task in created:
+        queue_change('task.created', task_to_dict(task))
+    for task in updated:
+        queue_change('task.updated', task_to_dict(task))
+    queue_task_changes('task.assigned', assigned)
+    queue_task_changes('task.deleted', deleted)
+    return summary
+
+def run_reanalysis_job(job_id):
+    with app.app_context(), collect_timings() as timings:
+        job = db.session.get(Job, job_id)
+        if job is None or job.stage in FINISHED_STAGES:
+            return
+
+        try:
+            refresh_employee_resolver()
+            meeting = db.session.get(Meeting, job.meeting_id)
+            if meeting is None or not meeting.transcript:
+                raise ValueError('Meeting has no stored transcript')
+
+            set_job_stage(job, 'analysing', 0.2)
+            with stage('analysis'):
+                analysis_json = analyse_transcipt(meeting.transcript)
+
+            job.stage = 'persisting'
+            job.progress = 0.8
+            summary = update_meeting_tasks(meeting, analysis_json.get('tasks', []))
+            meeting.analysis_fingerprint = ANALYSIS_FINGERPRINT
+            job.result = json.dumps({'analysis': analysis_json, 'changes': summary, 'timings': timings.to_dict()})
+            # The task changes, the new fingerprint and the finished job
+            # are committed together.
+            set_job_stage(job, 'done', 1.0)
+        except Exception as e:
+            db.session.rollback()
+            job = db.session.get(Job, job_id)
+            print(f"Job {job_id} failed during {job.stage}: {e}")
+            job.error = f'Error during {job.stage}: {str(e)}'
+            set_job_stage(job, 'failed', job.progress)
+
+        job_seconds.observe(time.perf_counter() - timings.started, file_type=job.file_type, result=job.stage)
+
+job_queue = JobQueue(run_upload_job, max_workers=JOB_WORKERS)
+# Batch imports get their own workers so a backlog of hundreds of meetings
+# never delays a single upload from the page.
+batch_queue = JobQueue(run_upload_job, max_workers=BATCH_WORKERS)
+reanalysis_queue = JobQueue(run_reanalysis_job, max_workers=REANALYSIS_WORKERS)
+job_queues = {'uploads': job_queue, 'batches': batch_queue, 'reanalysis': reanalysis_queue}
+
+def queue_for(job):
+    if job.file_type == 'reanalysis':
+        return reanalysis_queue
+    return batch_queue if job.batch_id else job_queue
+
+def resume_unfinished_jobs():
+    jobs = Job.query.filter(Job.stage.notin_(FINISHED_STAGES)).order_by(Job.created_at).all()
+    for job in jobs:
+        print(f"Resuming job {job.id} from stage {job.stage}")
+        queue_for(job).submit(job.id)
+
+background_workers_lock = threading.Lock()
+background_workers_pid = None
+background_workers_claim = None
+
+def claim_background_workers():
+    # One process per machine resumes jobs and sends reminders; with several
+    # gunicorn workers the rest would do it all again. The lock goes away
+    # with the process, so a replacement worker takes over.
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    claim = open(os.path.join(UPLOAD_FOLDER, '.background.lock'), 'w')
+    try:
+        fcntl.flock(claim, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        claim.close()
+        return None
+    return claim
+
+def start_background_workers():
+    global background_workers_pid, background_workers_claim
+    if not BACKGROUND_WORKERS or background_workers_pid == os.getpid():
+        return
+    with background_workers_lock:
+        if background_workers_pid == os.getpid():
+            return
+        background_workers_pid = os.getpid()
+        background_workers_claim = claim_background_workers()
+        if background_workers_claim is None:
+            return
+        with app.app_context():
+            prune_uploads()
+            resume_unfinished_jobs()
+        outbox_worker.start()
+        if REMINDERS_ENABLED:
+            reminder_scheduler.start()
+
+@app.before_request
+def start_background_workers_when_served():
+    # `flask run` and other servers that don't call start_background_workers()
+    # themselves; the test client sets no SERVER_SOFTWARE.
+    if request.environ.get('SERVER_SOFTWARE'):
+        start_background_workers()
+
+def file_type_for(filename):
+    if is_audio_file(filename):
+        return 'recording'
+    if is_text_file(filename):
+        return 'transcript'
+    return None
+
+def stored_copy(open_file, extension):
+    def store():
+        with open_file() as stream:
+            return store_stream(UPLOAD_FOLDER, stream, extension, MAX_UPLOAD_BYTES)
+    return store
+
+def stored_upload(upload, extension):
+    def store():
+        upload.store(extension)
+        return upload
+    return store
+
+def ingested_hashes(hashes):
+    # Failed jobs don't count, so a resumed import retries them.
+    hashes = list(hashes)
+    found = set()
+    for start in range(0, len(hashes), BULK_ID_CHUNK):
+        chunk = hashes[start:start + BULK_ID_CHUNK]
+        found.update(
+            content_hash for content_hash, in
+            db.session.query(Job.content_hash).filter(Job.content_hash.in_(chunk), Job.stage != 'failed')
+        )
+    return found
+
+def create_batch(entries, source, notify=False, resume=True, model_size=None):
+    batch = Batch(id=new_job_id(), source=source[:512], notify=notify)
+    skipped = []
+    stored = []
+    for name, store in entries:
+        file_type = file_type_for(name)
+        if file_type is None:
+            skipped.append({'file_name': name, 'reason': 'File type not supported'})
+            continue
+        try:
+            upload = store()
+        except UploadTooLarge as e:
+            skipped.append({'file_name': name, 'reason': e.description})
+            continue
+        stored.append((name, file_type, upload))
+
+    already_ingested = ingested_hashes(upload.hexdigest() for _, _, upload in stored) if resume else set()
+    first_seen = {}
+    jobs = []
+    for name, file_type, upload in stored:
+        digest = upload.hexdigest()
+        if digest in already_ingested:
+            skipped.append({'file_name': name, 'reason': 'Already ingested'})
+            continue
+        if digest in first_seen:
+            skipped.append({'file_name': name, 'reason': f'Same content as {first_seen[digest]}'})
+            continue
+        first_seen[digest] = name
+        jobs.append(Job(
+            id=new_job_id(),
+            file_name=secure_filename(name) or name,
+            file_path=upload.stored_path,
+            file_type=file_type,
+            content_hash=digest,
+            model_size=model_size,
+            stage='queued',
+            progress=0.0,
+            batch_id=batch.id
+        ))
+
+    batch.skipped = json.dumps(skipped)
+    db.session.add(batch)
+    db.session.add_all(jobs)
+    db.session.commit()
+    for job in jobs:
+        batch_queue.submit(job.id)
+    return batch
 
 @app.route('/auto_assign', methods=['POST'])
 def upload_file():
-    if 'file' not in request.files:
+    # The body is streamed to disk while the form is parsed.
+    with stage('upload_receive'):
+        files = request.files
+    if 'file' not in files:
         return jsonify({'success': False, 'message': 'No file in request'}), 400
     
-    file = request.files['file']
+    file = files['file']
 
     if file.filename == '': 
         return jsonify({'success': False, 'message': 'No file selected'}), 400
     
     if not allowed_filename(file.filename):
         return jsonify({'success': False, 'message': 'File type not supported'}), 400
-    
-    filename = secure_filename(file.filename)
-    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(file_path)
-
-    print("Saved file:", file_path, "size:", os.path.getsize(file_path))
 
     file_type = request.form.get('fileType')
 
     if file_type is None or file_type == '':
         return jsonify({'success': False, 'message': 'No file type selected'}), 400
 
-    transcript_text = None
-    analysis_json = None
-
     print("loaded file type:", file_type)
 
     if file_type == 'transcript':
@@ -370,105 +1922,357 @@ def upload_file():
                 'success': False,
                 'message': 'You selected "transcript" but file is not a text type'
             }), 400
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            transcript_text = f.read()
-        
-        try:
-            analysis_json = analyse_transcipt(transcript_text)
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'message': f'Error during analysis: {str(e)}'
-            }), 500
     elif file_type == 'recording':
         file_info = 'Recording File'
-
         if not is_audio_file(file.filename):
             return jsonify({
                 'success': False,
                 'message': 'You selected "recording" but file is not an audio type'
             }), 400
-        
-        try:
-            transcript_text = transcribe_audio(file_path)
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'message': f'Error during transcription: {str(e)}'
-            }), 500
-
-        try:
-            analysis_json = analyse_transcipt(transcript_text)
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'message': f'Error during analysis: {str(e)}'
-            }), 500
-        print("Analysis JSON:", analysis_json)
-        
     else:
         return jsonify({'success': False, 'message': 'Invalid fileType value'}), 400
-    
-    meeting = Meeting(
-        file_name=filename,
-        transcript=transcript_text
-    )
-    db.session.add(meeting)
-    db.session.flush()
-
-    session['current_meeting_id'] = meeting.id
 
-    tasks_from_ai = analysis_json.get('tasks', [])
-    saved_tasks = []
+    model_size = request.form.get('model') or None
+    if model_size is not None and model_size not in WHISPER_MODEL_SIZES:
+        return jsonify({'success': False, 'message': 'Invalid model value'}), 400
 
-    for t in tasks_from_ai:
-        task = Task(
-            meeting_id=meeting.id,
-            description=t.get('description'),
-            ai_assignee=t.get('assignee'),
-            ai_assignee_confidence=t.get('assignee_confidence'),
-            deadline=t.get('deadline'),
-            source_quotes=json.dumps(t.get('source_quotes', []))
-        )
-        db.session.add(task)
-        saved_tasks.append(task)
+    try:
+        event_options = meeting_event_options(request.form)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     
-    db.session.commit()
+    filename = secure_filename(file.filename)
+    upload = file.stream
+    with stage('upload_store'):
+        file_path = upload.store(filename.rsplit('.', 1)[1].lower())
 
-    tasks_response = [
-        {
-            'id': task.id,
-            'description': task.description,
-            'deadline': task.deadline,
-            'ai_assignee': task.ai_assignee,
-            'ai_assignee_confidence': task.ai_assignee_confidence,
-            'source_quotes': json.loads(task.source_quotes or '[]'),
-            'assigned_employee_id': task.assigned_employee_id
-        }
-        for task in saved_tasks
-    ]
+    print("Saved file:", file_path, "size:", upload.size)
 
-    try:
-        send_task_emails_for_meeting(meeting, saved_tasks)
-    except Exception as e:
-        print("Error sending task emails:", e)
+    job = Job(
+        id=new_job_id(),
+        file_name=filename,
+        file_path=file_path,
+        file_type=file_type,
+        content_hash=upload.hexdigest(),
+        model_size=model_size,
+        event_options=json.dumps(event_options) if event_options else None,
+        stage='queued',
+        progress=0.0
+    )
+    db.session.add(job)
+    db.session.commit()
+
+    job_queue.submit(job.id)
 
     return jsonify({
         'success': True,
-        'message': 'File uploaded successfully',
+        'message': 'File uploaded successfully, processing started',
         'filename': filename,
         'saved_path': file_path,
         'file_type': file_info,
-        'transcript': transcript_text,
-        'analysis': analysis_json,
-        'tasks': tasks_response
+        'job_id': job.id,
+        'status_url': f'/jobs/{job.id}'
+    }), 202
+
+@app.errorhandler(413)
+def upload_too_large(e):
+    return jsonify({'success': False, 'message': e.description}), 413
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = db.session.get(Job, job_id)
+    if not job:
+        return jsonify({'success': False, 'message': 'Job not found'}), 404
+
+    if job.stage == 'done' and job.meeting_id:
+        session['current_meeting_id'] = job.meeting_id
+
+    return jsonify(job.to_dict()), 200
+
+def uploaded_entries(files, archives):
+    for file in files:
+        extension = file_extension(file.filename)
+        if extension == 'zip':
+            path = file.stream.store('zip')
+            archives.append(path)
+            for name, open_member in iter_archive(path, ALLOWED_EXTENSIONS):
+                yield name, stored_copy(open_member, file_extension(name))
+        else:
+            yield file.filename, stored_upload(file.stream, extension)
+
+@app.route('/batches', methods=['POST'])
+def upload_batch():
+    request.max_content_length = BATCH_MAX_UPLOAD_BYTES or None
+    files = [file for file in request.files.getlist('file') if file.filename]
+    if not files:
+        return jsonify({'success': False, 'message': 'No files in request'}), 400
+
+    model_size = request.form.get('model') or None
+    if model_size is not None and model_size not in WHISPER_MODEL_SIZES:
+        return jsonify({'success': False, 'message': 'Invalid model value'}), 400
+
+    archives = []
+    try:
+        batch = create_batch(
+            uploaded_entries(files, archives),
+            source=', '.join(file.filename for file in files),
+            notify=request.form.get('notify') == '1',
+            resume=request.form.get('resume', '1') != '0',
+            model_size=model_size
+        )
+    except zipfile.BadZipFile as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': f'Invalid zip archive: {e}'}), 400
+    finally:
+        for path in archives:
+            os.remove(path)
+
+    data = batch.to_dict()
+    data.update({'success': True, 'status_url': f'/batches/{batch.id}'})
+    return jsonify(data), 202
+
+@app.route('/batches/<batch_id>', methods=['GET'])
+def get_batch(batch_id):
+    batch = db.session.get(Batch, batch_id)
+    if not batch:
+        return jsonify({'success': False, 'message': 'Batch not found'}), 404
+    return jsonify(batch.to_dict()), 200
+
+@app.cli.command('ingest')
+@click.argument('paths', nargs=-1, required=True, type=click.Path(exists=True))
+@click.option('--resume/--no-resume', default=True, help='Skip files whose content was already ingested.')
+@click.option('--notify', is_flag=True, help='Email assignees about the imported tasks.')
+@click.option('--model', type=click.Choice(WHISPER_MODEL_SIZES), default=None, help='Whisper model for recordings.')
+def ingest_command(paths, resume, notify, model):
+    migrate_database()
+    entries = (
+        (name, stored_copy(open_file, file_extension(name)))
+        for name, open_file in iter_input_files(paths, ALLOWED_EXTENSIONS)
+    )
+    batch = create_batch(entries, ', '.join(paths), notify=notify, resume=resume, model_size=model)
+    status = wait_for_batch(batch, 'files')
+    print(f"Done: {status['stages'].get('done', 0)} ingested, {status['stages'].get('failed', 0)} failed, "
+          f"{status['skipped']} skipped, {status['meetings_per_hour']:.0f} meetings/hour")
+
+def wait_for_batch(batch, noun):
+    status = batch.to_dict(include_files=False)
+    print(f"Batch {batch.id}: {status['files']} {noun} queued, {status['skipped']} skipped")
+    for skipped in batch.skipped_files:
+        print(f"  skipped {skipped['file_name']}: {skipped['reason']}")
+
+    while not status['finished']:
+        time.sleep(2)
+        # End the read transaction so the next poll sees the workers' commits.
+        db.session.commit()
+        status = batch.to_dict(include_files=False)
+        stages = ', '.join(f'{count} {stage}' for stage, count in sorted(status['stages'].items()))
+        print(f"  {stages} ({status['meetings_per_hour']:.0f} meetings/hour)")
+
+    status = batch.to_dict()
+    for job in status['jobs']:
+        if job['stage'] == 'failed':
+            print(f"  failed {job['file_name']}: {job['error']}")
+    return status
+
+def stale_meetings():
+    return Meeting.query.filter(or_(
+        Meeting.analysis_fingerprint.is_(None),
+        Meeting.analysis_fingerprint != ANALYSIS_FINGERPRINT
+    ))
+
+def create_reanalysis_batch(meeting_ids=None):
+    query = stale_meetings().with_entities(
+        Meeting.id, Meeting.file_name, func.coalesce(func.length(Meeting.transcript), 0)
+    )
+    if meeting_ids is not None:
+        query = query.filter(Meeting.id.in_(meeting_ids))
+    # A meeting still being uploaded or already queued for re-analysis is
+    # left to that job.
+    busy = db.session.query(Job.meeting_id).filter(Job.meeting_id.isnot(None), Job.stage.notin_(FINISHED_STAGES))
+    query = query.filter(Meeting.id.notin_(busy)).order_by(Meeting.id)
+
+    batch = Batch(id=new_job_id(), source='reanalysis', notify=False)
+    skipped = []
+    jobs = []
+    for meeting_id, file_name, transcript_length in query:
+        if not transcript_length:
+            skipped.append({'file_name': file_name, 'meeting_id': meeting_id, 'reason': 'No stored transcript'})
+            continue
+        jobs.append(Job(
+            id=new_job_id(),
+            file_name=file_name,
+            file_type='reanalysis',
+            stage='queued',
+            progress=0.0,
+            meeting_id=meeting_id,
+            batch_id=batch.id
+        ))
+    if not jobs and not skipped:
+        return None
+
+    batch.skipped = json.dumps(skipped)
+    db.session.add(batch)
+    db.session.add_all(jobs)
+    db.session.commit()
+    for job in jobs:
+        reanalysis_queue.submit(job.id)
+    return batch
+
+@app.route('/meetings/reanalyse', methods=['POST'])
+def reanalyse_meetings():
+    data = request.get_json(silent=True) or {}
+    meeting_ids = data.get('meeting_ids')
+    if meeting_ids is not None:
+        if not isinstance(meeting_ids, list) or not all(isinstance(value, int) for value in meeting_ids):
+            return jsonify({'success': False, 'message': 'meeting_ids must be a list of integers'}), 400
+
+    batch = create_reanalysis_batch(meeting_ids)
+    if batch is None:
+        return jsonify({'success': True, 'message': 'All meetings are up to date', 'fingerprint': ANALYSIS_FINGERPRINT}), 200
+
+    data = batch.to_dict()
+    data.update({'success': True, 'fingerprint': ANALYSIS_FINGERPRINT, 'status_url': f'/batches/{batch.id}'})
+    return jsonify(data), 202
+
+@app.route('/admin/analysis', methods=['GET'])
+def get_analysis_status():
+    return jsonify({
+        'model': OLLAMA_MODEL,
+        'chunk_tokens': ANALYSIS_CHUNK_TOKENS,
+        'fingerprint': ANALYSIS_FINGERPRINT,
+        'meetings': Meeting.query.count(),
+        'stale_meetings': stale_meetings().count(),
     }), 200
 
+@app.cli.command('reanalyse')
+@click.option('--meeting', 'meeting_ids', type=int, multiple=True, help='Only this meeting (repeatable).')
+def reanalyse_command(meeting_ids):
+    migrate_database()
+    batch = create_reanalysis_batch(list(meeting_ids) or None)
+    if batch is None:
+        print("All meetings are up to date")
+        return
+
+    status = wait_for_batch(batch, 'meetings')
+    changes = defaultdict(int)
+    for job in Job.query.filter(Job.batch_id == batch.id, Job.stage == 'done'):
+        for name, count in json.loads(job.result).get('changes', {}).items():
+            changes[name] += count
+    print(f"Done: {status['stages'].get('done', 0)} re-analysed, {status['stages'].get('failed', 0)} failed, "
+          f"{status['meetings_per_hour']:.0f} meetings/hour")
+    print("Tasks: " + ', '.join(f'{count} {name}' for name, count in changes.items()))
+
+@app.route('/stream', methods=['GET'])
+def stream_changes():
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    response = Response(
+        change_feed.stream(last_event_id, heartbeat_seconds=STREAM_HEARTBEAT_SECONDS),
+        mimetype='text/event-stream'
+    )
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/metrics', methods=['GET'])
+def get_metrics():
+    if not METRICS_ENABLED:
+        return jsonify({'success': False, 'message': 'Metrics are disabled'}), 404
+    return Response(metrics.render(), content_type=CONTENT_TYPE)
+
+@app.route('/admin/cache', methods=['GET'])
+def get_cache_stats():
+    return jsonify([cache.stats() for cache in result_caches.values()]), 200
+
+@app.route('/admin/cache/<name>', methods=['DELETE'])
+def invalidate_cache(name):
+    cache = result_caches.get(name)
+    if not cache:
+        return jsonify({'success': False, 'message': 'Unknown cache'}), 404
+
+    removed = cache.invalidate(request.args.get('key'))
+    return jsonify({'success': True, 'removed': removed, 'cache': cache.stats()}), 200
+
+SEARCH_TYPES = ('all', 'tasks', 'meetings')
+SEARCH_MATCHES = ('all', 'any')
+SEARCH_PAGE_SIZE = 20
+
+def search_page(hits, next_key, serialize):
+    return {
+        'items': [serialize(hit) for hit in hits],
+        'next_cursor': encode_cursor(next_key) if next_key else None
+    }
+
+@app.route('/search', methods=['GET'])
+@cached_response('tasks', 'employees')
+def search():
+    if db.engine.dialect.name != 'sqlite':
+        return jsonify({'success': False, 'message': 'Search needs a SQLite database'}), 501
+
+    query = request.args.get('q', '')
+    if match_expression(query) is None:
+        return jsonify({'success': False, 'message': 'Search query is required'}), 400
+    search_type = request.args.get('type', 'all')
+    if search_type not in SEARCH_TYPES:
+        return jsonify({'success': False, 'message': f"type must be one of {', '.join(SEARCH_TYPES)}"}), 400
+    match = request.args.get('match', 'all')
+    if match not in SEARCH_MATCHES:
+        return jsonify({'success': False, 'message': f"match must be one of {', '.join(SEARCH_MATCHES)}"}), 400
+    try:
+        limit = parse_limit(request.args.get('limit'), default=SEARCH_PAGE_SIZE)
+        after = decode_cursor(request.args['after'], 2) if request.args.get('after') else None
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    if after and search_type == 'all':
+        return jsonify({'success': False, 'message': 'Pass type=tasks or type=meetings with after'}), 400
+
+    try:
+        response = search_results(query, search_type, match, limit, after)
+        # A question like "who promised the Q3 report" rarely has every word
+        # in one task; rather than nothing, show what matches any of them.
+        if match == 'all' and after is None and len(match_expression(query).split()) > 1 and not any(
+            response[name]['items'] for name in ('tasks', 'meetings') if name in response
+        ):
+            response = search_results(query, search_type, 'any', limit, after)
+    except OperationalError as e:
+        db.session.rollback()
+        print("Search failed:", e)
+        return jsonify({'success': False, 'message': 'Search index is not available'}), 503
+    return jsonify(response), 200
+
+def search_results(query, search_type, match, limit, after):
+    expression = match_expression(query, any_term=match == 'any')
+    response = {'query': query, 'match': match}
+    if search_type in ('all', 'tasks'):
+        hits, next_key = search_tasks(db.session, expression, limit, after)
+        tasks = {
+            task.id: task
+            for task in Task.query.options(
+                joinedload(Task.assigned_employee),
+                joinedload(Task.meeting).load_only(Meeting.id, Meeting.file_name),
+                joinedload(Task.quotes)
+            ).filter(Task.id.in_([hit['id'] for hit in hits]))
+        }
+        hits = [hit for hit in hits if hit['id'] in tasks]
+        response['tasks'] = search_page(hits, next_key, lambda hit: dict(
+            task_to_dict(tasks[hit['id']]),
+            score=-hit['score'],
+            highlight={'description': hit['description'], 'source_quotes': hit['quotes']}
+        ))
+    if search_type in ('all', 'meetings'):
+        hits, next_key = search_meetings(db.session, expression, limit, after)
+        response['meetings'] = search_page(hits, next_key, lambda hit: {
+            'id': hit['id'],
+            'score': -hit['score'],
+            'highlight': {'file_name': hit['file_name'], 'transcript': hit['snippet']}
+        })
+    return response
+
 @app.route('/employees', methods=['GET'])
+@cached_response('employees', 'tasks')
 def get_employees():
     employees = Employee.query.all()
-    return jsonify([e.to_dict_with_stats() for e in employees]), 200
+    counts = employee_task_counts()
+    return jsonify([e.to_dict_with_stats(counts.get(e.id, {})) for e in employees]), 200
 
 
 @app.route('/employees', methods=['POST'])
@@ -488,62 +2292,113 @@ def employees():
     except Exception as e:
         return jsonify({'success': False, 'message': 'Missing required employee field'}), 400
 
+    aliases = data.get('aliases') or []
+    if isinstance(aliases, str):
+        aliases = aliases.split(',')
+    if not isinstance(aliases, list):
+        return jsonify({'success': False, 'message': 'Invalid aliases format'}), 400
+
     new_employee = Employee(name=name, role=role, position=position, email=email)
+    new_employee.alias_names = aliases
 
     db.session.add(new_employee)
+    db.session.flush()
+    employee_data = new_employee.to_dict_with_stats({})
+    queue_change('employee.created', employee_data)
+    db.session.commit()
+
+    return jsonify(employee_data), 201
+
+@app.route('/employees/<int:employee_id>/aliases', methods=['PUT'])
+def update_employee_aliases(employee_id):
+    employee = db.session.get(Employee, employee_id)
+    if not employee:
+        return jsonify({'success': False, 'message': 'Employee not found'}), 404
+
+    data = request.json or {}
+    aliases = data.get('aliases')
+    if not isinstance(aliases, list) or not all(isinstance(alias, str) for alias in aliases):
+        return jsonify({'success': False, 'message': 'aliases must be a list of names'}), 400
+
+    employee.alias_names = aliases
     db.session.commit()
+    return jsonify({'id': employee.id, 'name': employee.name, 'aliases': employee.alias_names}), 200
+
+@app.route('/employees/resolve', methods=['GET'])
+def resolve_employee_name():
+    name = request.args.get('name', '')
+    match = refresh_employee_resolver().resolve(name)
+    return jsonify({
+        'name': name,
+        'employee_id': match.employee_id,
+        'confidence': match.confidence,
+        'method': match.method,
+        'auto_assign': match.employee_id is not None and match.confidence >= AUTO_ASSIGN_MIN_CONFIDENCE
+    }), 200
 
-    return jsonify(new_employee.to_dict_with_stats()), 201
+def employee_task_to_dict(task):
+    return {
+        'id': task.id,
+        'description': task.description,
+        'deadline': task.deadline_label,
+        'status': task.status,
+        'meeting_id': task.meeting_id,
+        'meeting_file_name': task.meeting.file_name if task.meeting else 'N/A'
+    }
 
 @app.route('/employees/<int:employee_id>/tasks', methods=['GET'])
+@cached_response('tasks', 'employees')
 def get_employee_tasks(employee_id):
     employee = Employee.query.get(employee_id)
     if not employee:
         return jsonify({'message': 'Employee not found'}), 404
 
-    tasks = []
-    for task in employee.tasks:
-        tasks.append({
-            'id': task.id,
-            'description': task.description,
-            'deadline': task.deadline,
-            'status': task.status,
-            'meeting_id': task.meeting_id,
-            'meeting_file_name': task.meeting.file_name if task.meeting else 'N/A'
-        })
-    return jsonify(tasks), 200
-
-@app.route('/assignments', methods=['GET'])
-def assignments():
-    tasks = Task.query.all()
-    assignments = []
-    for task in tasks:
-        assignee_name = None
-        assignee_avatar = None
-        if task.assigned_employee_id:
-            employee = Employee.query.get(task.assigned_employee_id)
-            if employee:
-                assignee_name = employee.name
-                assignee_avatar = f"https://i.pravatar.cc/150?img={(employee.id % 70) + 1}"
-        elif task.ai_assignee:
-            assignee_name = task.ai_assignee + ' (AI Suggestion)'
-            assignee_avatar = f"https://i.pravatar.cc/150?img={(task.id % 70) + 20}"
-    
-        assignments.append({
+    query = Task.query.options(
+        joinedload(Task.meeting).load_only(Meeting.id, Meeting.file_name)
+    ).filter_by(assigned_employee_id=employee.id)
+    args = request.args.to_dict()
+    args.pop('assigned_employee_id', None)
+    try:
+        query = filter_tasks(query, args)
+        return list_response(query, [Task.id], lambda task: [task.id], employee_task_to_dict)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+def task_to_assignment(task):
+    assignee_name = None
+    assignee_avatar = None
+    if task.assigned_employee_id:
+        employee = task.assigned_employee
+        if employee:
+            assignee_name = employee.name
+            assignee_avatar = f"https://i.pravatar.cc/150?img={(employee.id % 70) + 1}"
+    elif task.ai_assignee:
+        assignee_name = task.ai_assignee + ' (AI Suggestion)'
+        assignee_avatar = f"https://i.pravatar.cc/150?img={(task.id % 70) + 20}"
+
+    return {
         'id': task.id,
         'meeting_id': task.meeting_id,
         'description': task.description,
         'ai_assignee': task.ai_assignee,
         'ai_assignee_confidence': task.ai_assignee_confidence,
-        'deadline': task.deadline,
-        'source_quotes': json.loads(task.source_quotes or '[]'),
+        'deadline': task.deadline_label,
+        'source_quotes': task.source_quotes,
         'assigned_employee_id': task.assigned_employee_id,
         'status': task.status,
         'assignee_name': assignee_name,
         'assignee_avatar': assignee_avatar
-    })
-    
-    return jsonify(assignments), 200
+    }
+
+@app.route('/assignments', methods=['GET'])
+@cached_response('tasks', 'employees')
+def assignments():
+    query = Task.query.options(joinedload(Task.assigned_employee), joinedload(Task.quotes))
+    try:
+        query = filter_tasks(query, request.args)
+        return list_response(query, [Task.id], lambda task: [task.id], task_to_assignment)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
 
 @app.route('/assignments', methods=['POST'])
 def save_assignments():
@@ -554,25 +2409,10 @@ def save_assignments():
         return jsonify({'success': False, 'error': 'Invalid assignments format'}), 400
     
     try:
-        for task_id_str, employee_id_str in assignments.items():
-            try:
-                task_id = int(task_id_str)
-                employee_id = int(employee_id_str)
-            except ValueError:
-                print(f"Warning: Could not convert task_id_str='{task_id_str}' or employee_id_str='{employee_id_str}' to int. Skipping.")
-                continue
-            
-            task = Task.query.get(task_id)
-            if not task:
-                print(f"Warning: Task with ID {task_id} not found. Skipping assignment.")
-                continue
-
-            employee = Employee.query.get(employee_id)
-            if not employee:
-                print(f"Warning: Employee with ID {employee_id} not found. Skipping assignment for task {task_id}.")
-                continue
-
-            task.assigned_employee_id = employee_id
+        results = apply_bulk_assignments(assignments.items())
+        for result in results:
+            if result['result'] == 'skipped':
+                print(f"Warning: Skipping assignment of task {result['task_id']} to employee {result['employee_id']}: {result['reason']}")
         
         db.session.commit()
         return jsonify({'success': True}), 200
@@ -580,6 +2420,62 @@ def save_assignments():
         db.session.rollback()
         print('Error saving assignments:', e)
         return jsonify({'success': False, 'error': 'Server error while saving assignments'}), 500
+
+def bulk_response(results):
+    applied = sum(1 for result in results if result['result'] == 'applied')
+    return jsonify({
+        'success': True,
+        'applied': applied,
+        'skipped': len(results) - applied,
+        'results': results
+    }), 200
+
+@app.route('/assignments/bulk', methods=['POST'])
+def bulk_assignments():
+    data = request.json
+    if not data:
+        return jsonify({'success': False, 'message': 'No data provided'}), 400
+
+    try:
+        pairs = parse_bulk_items(data, 'assignments', 'employee_id')
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+    try:
+        results = apply_bulk_assignments(pairs)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print('Error saving bulk assignments:', e)
+        return jsonify({'success': False, 'message': 'Server error while saving assignments'}), 500
+
+    return bulk_response(results)
+
+@app.route('/tasks/status/bulk', methods=['POST'])
+def bulk_update_task_status():
+    data = request.json
+    if not data:
+        return jsonify({'success': False, 'message': 'No data provided'}), 400
+
+    try:
+        if 'task_ids' in data:
+            if not isinstance(data['task_ids'], list):
+                raise ValueError('Invalid task_ids format')
+            pairs = [(task_id, data.get('status')) for task_id in data['task_ids']]
+        else:
+            pairs = parse_bulk_items(data, 'updates', 'status')
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+    try:
+        results = apply_bulk_statuses(pairs)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print('Error updating task statuses:', e)
+        return jsonify({'success': False, 'message': 'Failed to update task status in database'}), 500
+
+    return bulk_response(results)
     
 @app.route('/get_final_assignments', methods=['GET'])
 def get_final_assignments():
@@ -587,13 +2483,13 @@ def get_final_assignments():
     if not current_meeting_id:
         return jsonify({'error': 'No active meeting ID found in session. Please upload a file first.'}), 400
 
-    tasks = Task.query.filter_by(meeting_id=current_meeting_id).all()
+    tasks = Task.query.options(joinedload(Task.assigned_employee)).filter_by(meeting_id=current_meeting_id).all()
 
     final_assignments = []
     for task in tasks:
         assignee_info = None
         if task.assigned_employee_id:
-            employee = Employee.query.get(task.assigned_employee_id)
+            employee = task.assigned_employee
             if employee:
                 assignee_info = {'id': employee.id, 'name': employee.name, 'role': employee.role}
         elif task.ai_assignee:
@@ -602,7 +2498,7 @@ def get_final_assignments():
         final_assignments.append({
             'id': task.id,
             'description': task.description,
-            'deadline': task.deadline,
+            'deadline': task.deadline_label,
             'ai_assignee': task.ai_assignee,
             'assigned_employee_id': task.assigned_employee_id,
             'assignee': assignee_info
@@ -610,10 +2506,173 @@ def get_final_assignments():
 
     return jsonify(final_assignments)
 
+def parse_event_window(args):
+    window_start = window_end = None
+    if args.get('start'):
+        window_start = datetime.combine(parse_date_arg(args, 'start'), datetime.min.time())
+    if args.get('end'):
+        # The end date is inclusive.
+        window_end = datetime.combine(parse_date_arg(args, 'end'), datetime.min.time()) + timedelta(days=1)
+    return window_start, window_end
+
+def series_occurrences(series, window_start, window_end, cursor):
+    start_from = cursor[0] if cursor else None
+    for starts_at, _ in occurrences(
+        series.starts_at, series.ends_at, series.recurrence, series.recurrence_interval,
+        until=series.recurrence_until, after=window_start, before=window_end, start_from=start_from
+    ):
+        if cursor and (starts_at, series.id) <= cursor:
+            continue
+        yield starts_at, series.id, series
+
+def event_occurrences(window_start, window_end, category=None, cursor=None, limit=None):
+    # Occurrences overlapping the window in (starts_at, id) order. One-off
+    # events come from an index range scan; each repeating series is
+    # expanded lazily from the window, and the streams are merged.
+    one_offs = Event.query.filter(Event.recurrence.is_(None))
+    series = Event.query.filter(Event.recurrence.isnot(None))
+    if window_start:
+        one_offs = one_offs.filter(Event.starts_at > window_start - EVENT_MAX_DURATION, Event.ends_at > window_start)
+        series = series.filter(or_(
+            Event.recurrence_until.is_(None), Event.recurrence_until > window_start - EVENT_MAX_DURATION
+        ))
+    if window_end:
+        one_offs = one_offs.filter(Event.starts_at < window_end)
+        series = series.filter(Event.starts_at < window_end)
+    if category:
+        one_offs = one_offs.filter(Event.category == category)
+        series = series.filter(Event.category == category)
+    if cursor:
+        one_offs = one_offs.filter(tuple_(Event.starts_at, Event.id) > tuple_(*cursor))
+    one_offs = one_offs.order_by(Event.starts_at, Event.id)
+    if limit is not None:
+        one_offs = one_offs.limit(limit)
+
+    streams = [((event.starts_at, event.id, event) for event in one_offs)]
+    streams.extend(series_occurrences(event, window_start, window_end, cursor) for event in series)
+    merged = heapq.merge(*streams, key=lambda item: item[:2])
+    return islice(merged, limit) if limit is not None else merged
+
 @app.route('/api/events', methods=['GET'])
+@cached_response('events')
 def get_events():
-    events = Event.query.all()
-    return jsonify([event.to_dict() for event in events]), 200
+    try:
+        window_start, window_end = parse_event_window(request.args)
+        category = request.args.get('category')
+        if window_start is None and window_end is None:
+            # No window: the stored events, one entry per repeating series.
+            query = Event.query
+            if category:
+                query = query.filter(Event.category == category)
+            meeting_id = parse_int(request.args, 'meeting_id')
+            if meeting_id is not None:
+                query = query.filter(Event.meeting_id == meeting_id)
+            return list_response(
+                query,
+                [Event.starts_at, Event.id],
+                lambda event: [event.starts_at, event.id],
+                lambda event: event.to_dict()
+            )
+
+        if not wants_page(request.args):
+            if window_end is None:
+                return jsonify({
+                    'success': False,
+                    'message': 'Give an end date or a limit; repeating events have no last occurrence'
+                }), 400
+            items = list(event_occurrences(window_start, window_end, category, limit=EVENTS_MAX_OCCURRENCES + 1))
+            if len(items) > EVENTS_MAX_OCCURRENCES:
+                return jsonify({
+                    'success': False,
+                    'message': f'More than {EVENTS_MAX_OCCURRENCES} occurrences in this range; pass a limit to page through them'
+                }), 400
+            return jsonify([event.to_dict(starts_at) for starts_at, _, event in items]), 200
+
+        limit = parse_limit(request.args.get('limit'))
+        cursor = None
+        if request.args.get('after'):
+            values = decode_cursor(request.args['after'], 2)
+            cursor = (cursor_value(Event.starts_at, values[0]), cursor_value(Event.id, values[1]))
+        items = list(event_occurrences(window_start, window_end, category, cursor, limit + 1))
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1][:2])
+        return jsonify({
+            'items': [event.to_dict(starts_at) for starts_at, _, event in items],
+            'next_cursor': next_cursor
+        }), 200
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
+def parse_recurrence(value, starts_at):
+    # Accepts "weekly" or {"frequency": "weekly", "interval": 2, "until": ..., "count": ...}.
+    if not value:
+        return None, 1, None
+    if isinstance(value, str):
+        value = {'frequency': value}
+    if not isinstance(value, dict):
+        raise ValueError('recurrence must be a frequency or an object')
+    frequency = value.get('frequency')
+    if frequency not in FREQUENCIES:
+        raise ValueError(f"recurrence frequency must be one of {', '.join(FREQUENCIES)}")
+    try:
+        interval = int(value.get('interval') or 1)
+    except (TypeError, ValueError):
+        raise ValueError('recurrence interval must be an integer')
+    if interval < 1:
+        raise ValueError('recurrence interval must be positive')
+    until = None
+    if value.get('count') is not None:
+        try:
+            count = int(value['count'])
+        except (TypeError, ValueError):
+            raise ValueError('recurrence count must be an integer')
+        if count < 1:
+            raise ValueError('recurrence count must be positive')
+        until = last_start(starts_at, frequency, interval, count)
+    elif value.get('until'):
+        text = str(value['until']).strip()
+        try:
+            # A date on its own includes that whole day.
+            until = datetime.combine(date.fromisoformat(text), datetime.max.time())
+        except ValueError:
+            until = parse_datetime(text)
+        if until < starts_at:
+            raise ValueError('recurrence until is before the first occurrence')
+    return frequency, interval, until
+
+def event_fields(data):
+    title = (data.get('title') or '').strip()
+    if not title:
+        raise ValueError('Event title is required')
+    if data.get('starts_at'):
+        starts_at = parse_datetime(data['starts_at'])
+    else:
+        starts_at = datetime.combine(parse_date(data.get('date')), parse_time(data.get('time')))
+    if data.get('ends_at'):
+        ends_at = parse_datetime(data['ends_at'])
+    else:
+        try:
+            minutes = int(data.get('duration_minutes') or EVENT_DEFAULT_MINUTES)
+        except (TypeError, ValueError):
+            raise ValueError('duration_minutes must be an integer')
+        ends_at = starts_at + timedelta(minutes=minutes)
+    if ends_at <= starts_at:
+        raise ValueError('An event has to end after it starts')
+    if ends_at - starts_at > EVENT_MAX_DURATION:
+        raise ValueError(f'Events can last at most {EVENT_MAX_DURATION.days} days')
+    recurrence, interval, until = parse_recurrence(data.get('recurrence'), starts_at)
+    return {
+        'title': title,
+        'starts_at': starts_at,
+        'ends_at': ends_at,
+        'category': data.get('category') or 'meeting',
+        'description': data.get('description'),
+        'recurrence': recurrence,
+        'recurrence_interval': interval,
+        'recurrence_until': until,
+    }
 
 @app.route('/api/events', methods=['POST'])
 def create_event():
@@ -621,22 +2680,20 @@ def create_event():
 
     if not data:
         return jsonify({'success': False, 'message': 'No data provided'}), 400
-    
+
     try:
-        title = data.get('title')
-        date = data.get('date')
-        time = data.get('time')
-        category = data.get('category')
-        description = data.get('description')
-    except Exception as e:
-        jsonify({'success': False, 'message': 'Missing required event field'}), 400
-    
-    new_event = Event(title=title, date=date, time=time, category=category, description=description)
+        new_event = Event(**event_fields(data))
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+
     db.session.add(new_event)
 
     try:
+        db.session.flush()
+        event_data = new_event.to_dict()
+        queue_change('event.created', event_data)
         db.session.commit()
-        return jsonify(new_event.to_dict()), 201
+        return jsonify(event_data), 201
     except Exception as e:
         db.session.rollback()
         print(f"Error adding event: {e}")
@@ -644,7 +2701,10 @@ def create_event():
 
 if __name__ == '__main__':
     with app.app_context():
-        db.create_all()
+        try:
+            migrate_database()
+        except MigrationError as e:
+            raise SystemExit(f"Database migration failed: {e}")
 
         if Employee.query.count() == 0:
             print("Adding dummy employees...")
@@ -664,17 +2724,21 @@ if __name__ == '__main__':
             db.session.add_all([meeting1, meeting2])
             db.session.flush()
 
-            task1 = Task(meeting_id=meeting1.id, description="Design landing page mockups", ai_assignee="John Doe", deadline="2023-03-28", assigned_employee_id=1, status="pending")
-            task2 = Task(meeting_id=meeting1.id, description="Review user flows", ai_assignee="John Doe", deadline="2023-03-29", assigned_employee_id=1, status="pending")
-            task3 = Task(meeting_id=meeting2.id, description="Create design system components", ai_assignee="John Doe", deadline="2023-03-30", assigned_employee_id=1, status="complete")
+            task1 = Task(meeting_id=meeting1.id, description="Design landing page mockups", ai_assignee="John Doe", deadline=parse_date("2023-03-28"), assigned_employee_id=1, status="pending")
+            task2 = Task(meeting_id=meeting1.id, description="Review user flows", ai_assignee="John Doe", deadline=parse_date("2023-03-29"), assigned_employee_id=1, status="pending")
+            task3 = Task(meeting_id=meeting2.id, description="Create design system components", ai_assignee="John Doe", deadline=parse_date("2023-03-30"), assigned_employee_id=1, status="complete")
 
-            task4 = Task(meeting_id=meeting1.id, description="Develop iOS login screen", ai_assignee="Jane Smith", deadline="2023-03-27", assigned_employee_id=2, status="pending")
-            task5 = Task(meeting_id=meeting2.id, description="Implement push notifications", ai_assignee="Jane Smith", deadline="2023-04-01", assigned_employee_id=2, status="pending")
+            task4 = Task(meeting_id=meeting1.id, description="Develop iOS login screen", ai_assignee="Jane Smith", deadline=parse_date("2023-03-27"), assigned_employee_id=2, status="pending")
+            task5 = Task(meeting_id=meeting2.id, description="Implement push notifications", ai_assignee="Jane Smith", deadline=parse_date("2023-04-01"), assigned_employee_id=2, status="pending")
 
-            task6 = Task(meeting_id=meeting1.id, description="Write website copy", ai_assignee="Peter Jones", deadline="2023-03-28", assigned_employee_id=3, status="complete")
-            task7 = Task(meeting_id=meeting2.id, description="Proofread marketing materials", ai_assignee="Peter Jones", deadline="2023-03-29", assigned_employee_id=3, status="pending")
+            task6 = Task(meeting_id=meeting1.id, description="Write website copy", ai_assignee="Peter Jones", deadline=parse_date("2023-03-28"), assigned_employee_id=3, status="complete")
+            task7 = Task(meeting_id=meeting2.id, description="Proofread marketing materials", ai_assignee="Peter Jones", deadline=parse_date("2023-03-29"), assigned_employee_id=3, status="pending")
             
             db.session.add_all([task1, task2, task3, task4, task5, task6, task7])
             db.session.commit()
             print("Dummy tasks added.")
+
+    # The reloader's parent process only watches files; the child serves.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_workers()
     app.run(debug=True)
\ No newline at end of file
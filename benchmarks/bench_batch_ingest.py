@@ -0,0 +1,102 @@
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+
+def run_child(args):
+    # Worker counts are read at import, so each mode runs in its own process.
+    from stub_ollama import start_stub_server
+
+    db_dir = tempfile.mkdtemp(prefix='multibrain-bench-')
+    os.chdir(db_dir)
+    _, url = start_stub_server(tasks_per_response=args.stub_tasks, token_delay=args.token_delay)
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(db_dir, 'bench.db')}",
+        CACHE_DB_PATH=os.path.join(db_dir, 'cache.db'),
+        OLLAMA_URL=url,
+    )
+    import app as app_module
+    from fixtures import make_transcript
+    from query_counter import count_queries
+    from seed import seed_database
+
+    seed_database(app_module, employees=50, meetings=10, tasks=100)
+    client = app_module.app.test_client()
+    transcripts = [make_transcript(args.turns, seed=1000 + i).encode() for i in range(args.meetings)]
+
+    with app_module.app.app_context(), count_queries(app_module.db.engine) as counter:
+        started = time.perf_counter()
+        if args.child == 'sequential':
+            # What importing a backlog looked like: one upload, wait, the next.
+            for i, text in enumerate(transcripts):
+                response = client.post('/auto_assign', data={
+                    'file': (io.BytesIO(text), f'meeting-{i}.txt'), 'fileType': 'transcript',
+                })
+                assert response.status_code == 202, response.get_data(as_text=True)
+                while app_module.job_queue.depth():
+                    time.sleep(0.002)
+        else:
+            response = client.post('/batches', data={
+                'file': [(io.BytesIO(text), f'meeting-{i}.txt') for i, text in enumerate(transcripts)],
+            })
+            assert response.status_code == 202, response.get_data(as_text=True)
+            while app_module.batch_queue.depth():
+                time.sleep(0.002)
+        elapsed = time.perf_counter() - started
+        meetings = app_module.Meeting.query.count() - 10
+
+    print(json.dumps({
+        'seconds': elapsed,
+        'meetings': meetings,
+        'meetings_per_hour': meetings / elapsed * 3600,
+        'sql_per_meeting': counter.count / args.meetings,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Importing a backlog of meetings: one upload at a time vs POST /batches.')
+    parser.add_argument('--meetings', type=int, default=40)
+    parser.add_argument('--turns', type=int, default=200, help='speaker turns per transcript')
+    parser.add_argument('--stub-tasks', type=int, default=5, help='tasks the Ollama stand-in returns per chunk')
+    parser.add_argument('--token-delay', type=float, default=0.002, help='seconds per streamed fragment from the stand-in')
+    parser.add_argument('--batch-workers', type=int, default=8)
+    parser.add_argument('--llm-concurrency', type=int, default=4)
+    parser.add_argument('--child', choices=('sequential', 'batch'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args)
+        return
+
+    env = dict(os.environ, BATCH_WORKERS=str(args.batch_workers), LLM_CONCURRENCY=str(args.llm_concurrency))
+    results = {}
+    for mode in ('sequential', 'batch'):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *sys.argv[1:], '--child', mode],
+            env=env, capture_output=True, text=True
+        )
+        if output.returncode != 0:
+            sys.stderr.write(output.stderr)
+            raise SystemExit(f'{mode} failed')
+        results[mode] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    print(f"{args.meetings} meetings of {args.turns} turns, {args.batch_workers} batch workers, "
+          f"LLM concurrency {args.llm_concurrency}, stub delay {args.token_delay * 1000:g} ms/fragment")
+    print(f"{'mode':>11} {'seconds':>9} {'meetings/hour':>14} {'SQL/meeting':>12}")
+    for mode, data in results.items():
+        print(f"{mode:>11} {data['seconds']:>9.2f} {data['meetings_per_hour']:>14.0f} {data['sql_per_meeting']:>12.1f}")
+    speedup = results['batch']['meetings_per_hour'] / results['sequential']['meetings_per_hour']
+    print(f"batch throughput: {speedup:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
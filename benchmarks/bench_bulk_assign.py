@@ -0,0 +1,58 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+import app as app_module
+from query_counter import count_queries
+from seed import seed_database
+
+
+def row_by_row(assignments):
+    Task, Employee, db = app_module.Task, app_module.Employee, app_module.db
+    for task_id, employee_id in assignments.items():
+        task = db.session.get(Task, int(task_id))
+        employee = db.session.get(Employee, int(employee_id))
+        if task and employee:
+            task.assigned_employee_id = employee.id
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk assignment vs row-by-row updates.')
+    parser.add_argument('--pairs', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--employees', type=int, default=200)
+    args = parser.parse_args()
+
+    client = app_module.app.test_client()
+    rng = random.Random(0)
+    print(f"{'pairs':>6} {'row-by-row (s)':>15} {'queries':>8} {'bulk (s)':>9} {'queries':>8}")
+    for pairs in args.pairs:
+        seed_database(app_module, employees=args.employees, meetings=max(1, pairs // 10), tasks=pairs)
+        assignments = {str(task_id): rng.randint(1, args.employees) for task_id in range(1, pairs + 1)}
+
+        with app_module.app.app_context():
+            with count_queries(app_module.db.engine) as slow_counter:
+                started = time.perf_counter()
+                row_by_row(assignments)
+                slow = time.perf_counter() - started
+
+            with count_queries(app_module.db.engine) as bulk_counter:
+                started = time.perf_counter()
+                response = client.post('/assignments/bulk', json={'assignments': assignments})
+                bulk = time.perf_counter() - started
+            assert response.status_code == 200 and response.json['applied'] == pairs
+
+        print(f"{pairs:>6} {slow:>15.2f} {slow_counter.count:>8} {bulk:>9.2f} {bulk_counter.count:>8}")
+
+
+if __name__ == '__main__':
+    main()
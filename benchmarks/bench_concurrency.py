@@ -0,0 +1,112 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def run_child(args):
+    import app as app_module
+    from seed import seed_database
+
+    seed_database(app_module, employees=50, meetings=50, tasks=args.tasks)
+
+    latencies = {'read': [], 'write': []}
+    errors = {'read': 0, 'write': 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + args.seconds
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = app_module.app.test_client()
+        while time.perf_counter() < deadline:
+            if rng.random() < args.write_ratio:
+                kind = 'write'
+                started = time.perf_counter()
+                response = client.put(
+                    f'/tasks/{rng.randint(1, args.tasks)}/status',
+                    json={'status': rng.choice(['pending', 'complete'])}
+                )
+            else:
+                kind = 'read'
+                started = time.perf_counter()
+                response = client.get('/tasks?limit=50&status=pending')
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies[kind].append(elapsed)
+                if response.status_code != 200:
+                    errors[kind] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result = {}
+    for kind in ('read', 'write'):
+        result[kind] = {
+            'requests': len(latencies[kind]),
+            'per_second': len(latencies[kind]) / args.seconds,
+            'p50_ms': percentile(latencies[kind], 0.50) * 1000,
+            'p95_ms': percentile(latencies[kind], 0.95) * 1000,
+            'errors': errors[kind],
+        }
+    print(json.dumps(result))
+
+
+def run_mode(args, journal_mode, synchronous):
+    db_dir = tempfile.mkdtemp(prefix='multibrain-bench-')
+    env = dict(os.environ)
+    env['DATABASE_URL'] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+    env['SQLITE_JOURNAL_MODE'] = journal_mode
+    env['SQLITE_SYNCHRONOUS'] = synchronous
+    command = [
+        sys.executable, os.path.abspath(__file__), '--child',
+        '--threads', str(args.threads), '--seconds', str(args.seconds),
+        '--tasks', str(args.tasks), '--write-ratio', str(args.write_ratio),
+    ]
+    output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mixed read/write load on /tasks with different SQLite settings.')
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--tasks', type=int, default=10000)
+    parser.add_argument('--write-ratio', type=float, default=0.2)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args)
+        return
+
+    modes = [('DELETE', 'FULL'), ('WAL', 'NORMAL')]
+    print(f"{args.threads} threads, {args.seconds:g}s, {args.tasks} tasks, {args.write_ratio:.0%} writes")
+    print(f"{'journal':>8} {'sync':>7} {'op':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'errors':>7}")
+    for journal_mode, synchronous in modes:
+        result = run_mode(args, journal_mode, synchronous)
+        for kind in ('read', 'write'):
+            r = result[kind]
+            print(f"{journal_mode:>8} {synchronous:>7} {kind:>6} {r['per_second']:>8.1f} "
+                  f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} {r['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
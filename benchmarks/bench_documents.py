@@ -0,0 +1,76 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from documents import iter_document, read_document
+from fixtures import make_transcript, write_docx, write_pdf
+from task_extraction import iter_chunks, split_transcript
+
+LINES_PER_PAGE = 50
+
+
+def build_fixtures(directory, pages):
+    lines = make_transcript(pages * LINES_PER_PAGE, seed=pages).splitlines()
+    page_lines = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+    text = '\n\n'.join('\n'.join(page) for page in page_lines)
+
+    paths = {}
+    paths['txt (utf-8)'] = os.path.join(directory, f'{pages}-utf8.txt')
+    with open(paths['txt (utf-8)'], 'w', encoding='utf-8') as f:
+        f.write(text)
+    paths['txt (utf-16)'] = os.path.join(directory, f'{pages}-utf16.txt')
+    with open(paths['txt (utf-16)'], 'w', encoding='utf-16') as f:
+        f.write(text)
+    paths['docx'] = os.path.join(directory, f'{pages}.docx')
+    write_docx(paths['docx'], lines)
+    paths['pdf'] = os.path.join(directory, f'{pages}.pdf')
+    write_pdf(paths['pdf'], page_lines)
+    return paths
+
+
+def measure_streaming(path, chunk_tokens):
+    started = time.perf_counter()
+    first_chunk = None
+    chunks = 0
+    for _ in iter_chunks(iter_document(path), chunk_tokens):
+        if first_chunk is None:
+            first_chunk = time.perf_counter() - started
+        chunks += 1
+    return time.perf_counter() - started, first_chunk, chunks
+
+
+def peak_memory(function):
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Document extraction throughput and streaming behaviour.')
+    parser.add_argument('--pages', type=int, nargs='+', default=[100, 500])
+    parser.add_argument('--chunk-tokens', type=int, default=1500)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix='multibrain-docs-')
+    print(f"{'pages':>5} {'format':>12} {'MB':>6} {'total (s)':>9} {'MB/s':>7} {'pages/s':>8} "
+          f"{'1st chunk (s)':>13} {'chunks':>6} {'peak MB stream':>14} {'peak MB whole':>13}")
+    for pages in args.pages:
+        for name, path in build_fixtures(directory, pages).items():
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            total, first_chunk, chunks = measure_streaming(path, args.chunk_tokens)
+            streamed = peak_memory(lambda: sum(1 for _ in iter_chunks(iter_document(path), args.chunk_tokens)))
+            whole = peak_memory(lambda: split_transcript(read_document(path), args.chunk_tokens))
+            print(f"{pages:>5} {name:>12} {size_mb:>6.1f} {total:>9.2f} {size_mb / total:>7.1f} {pages / total:>8.0f} "
+                  f"{first_chunk:>13.3f} {chunks:>6} {streamed / 1e6:>14.1f} {whole / 1e6:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
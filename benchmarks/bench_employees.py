@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+import app as app_module
+from query_counter import count_queries
+from seed import seed_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description='/employees latency as the task table grows.')
+    parser.add_argument('--tasks', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--employees', type=int, default=200)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    client = app_module.app.test_client()
+    print(f"{'tasks':>7} {'queries':>8} {'median latency (ms)':>20}")
+    for total in args.tasks:
+        seed_database(app_module, employees=args.employees, meetings=max(1, total // 10), tasks=total)
+        timings = []
+        with app_module.app.app_context():
+            for _ in range(args.runs):
+                app_module.response_cache.invalidate()
+                with count_queries(app_module.db.engine) as counter:
+                    started = time.perf_counter()
+                    response = client.get('/employees')
+                    timings.append(time.perf_counter() - started)
+                assert response.status_code == 200
+        timings.sort()
+        print(f"{total:>7} {counter.count:>8} {timings[len(timings) // 2] * 1000:>20.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+os.environ.setdefault('CACHE_DB_PATH', os.path.join(DB_DIR, 'cache.db'))
+
+from sqlalchemy import insert
+
+import app as app_module
+from query_counter import count_queries
+from recurrence import FREQUENCIES, occurrences
+
+CATEGORIES = ['meeting', 'work', 'social']
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def seed_events(events, series, first_year, years, seed):
+    rng = random.Random(seed)
+    span_start = datetime(first_year, 1, 1)
+    span_minutes = years * 365 * 24 * 60
+    rows = []
+    for i in range(events):
+        starts_at = span_start + timedelta(minutes=rng.randrange(0, span_minutes, 15))
+        row = {
+            'id': i + 1,
+            'title': f'Event {i + 1}',
+            'starts_at': starts_at,
+            'ends_at': starts_at + timedelta(minutes=rng.choice([15, 30, 60, 90, 120])),
+            'category': rng.choice(CATEGORIES),
+            'description': None,
+            'recurrence': None,
+            'recurrence_interval': 1,
+            'recurrence_until': None,
+        }
+        if i < series:
+            row['recurrence'] = FREQUENCIES[i % len(FREQUENCIES)]
+            row['recurrence_interval'] = rng.choice([1, 1, 2])
+            if rng.random() < 0.5:
+                row['recurrence_until'] = starts_at + timedelta(days=rng.randint(30, years * 365))
+        rows.append(row)
+
+    db = app_module.db
+    with app_module.app.app_context():
+        db.drop_all()
+        db.create_all()
+        for start in range(0, len(rows), 10000):
+            db.session.execute(insert(app_module.Event), rows[start:start + 10000])
+        db.session.commit()
+    return rows
+
+
+def materialized_rows(rows, span_end):
+    # What storing every occurrence as its own row would take, up to the
+    # end of the seeded span (open-ended series would need a cut-off).
+    total = 0
+    for row in rows:
+        if row['recurrence'] is None:
+            total += 1
+            continue
+        total += sum(1 for _ in occurrences(
+            row['starts_at'], row['ends_at'], row['recurrence'], row['recurrence_interval'],
+            until=row['recurrence_until'], before=span_end
+        ))
+    return total
+
+
+def timed_requests(client, paths, repeats):
+    latencies = []
+    sizes = []
+    with app_module.app.app_context(), count_queries(app_module.db.engine) as counter:
+        for _ in range(repeats):
+            for path in paths:
+                app_module.response_cache.invalidate()
+                started = time.perf_counter()
+                response = client.get(path)
+                latencies.append(time.perf_counter() - started)
+                assert response.status_code == 200, (path, response.get_data(as_text=True))
+                data = response.json
+                sizes.append(len(data if isinstance(data, list) else data['items']))
+    return latencies, sizes, counter.count / len(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calendar range queries over 100k events with repeating series expanded per window.')
+    parser.add_argument('--events', type=int, default=100000)
+    parser.add_argument('--series', type=int, default=200, help='how many of the events repeat')
+    parser.add_argument('--first-year', type=int, default=2020)
+    parser.add_argument('--years', type=int, default=10)
+    parser.add_argument('--windows', type=int, default=20, help='random windows per view')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rows = seed_events(args.events, args.series, args.first_year, args.years, args.seed)
+    seed_seconds = time.perf_counter() - started
+    span_end = datetime(args.first_year + args.years, 1, 1)
+    print(f"{args.events} events ({args.series} repeating) over {args.years} years, seeded in {seed_seconds:.1f} s; "
+          f"materialising every occurrence would take {materialized_rows(rows, span_end)} rows")
+
+    rng = random.Random(args.seed)
+    client = app_module.app.test_client()
+
+    def window_paths(days, extra=''):
+        paths = []
+        for _ in range(args.windows):
+            start = date(args.first_year, 1, 1) + timedelta(days=rng.randint(0, args.years * 365 - days))
+            end = start + timedelta(days=days - 1)
+            paths.append(f'/api/events?start={start}&end={end}{extra}')
+        return paths
+
+    def upcoming_paths(limit):
+        return [
+            f'/api/events?start={date(args.first_year, 1, 1) + timedelta(days=rng.randint(0, args.years * 365))}&limit={limit}'
+            for _ in range(args.windows)
+        ]
+
+    views = [
+        ('week', window_paths(7)),
+        ('month (calendar page)', window_paths(31)),
+        ('year, first page of 50', window_paths(365, '&limit=50')),
+        ('next 5 (dashboard)', upcoming_paths(5)),
+        ('all stored, one page of 50', ['/api/events?limit=50']),
+    ]
+    print(f"{'view':>28} {'p50 ms':>8} {'p95 ms':>8} {'items':>7} {'SQL/req':>8}")
+    for label, paths in views:
+        latencies, sizes, statements = timed_requests(client, paths, args.repeats)
+        print(f"{label:>28} {percentile(latencies, 0.5) * 1000:>8.1f} {percentile(latencies, 0.95) * 1000:>8.1f} "
+              f"{sum(sizes) / len(sizes):>7.0f} {statements:>8.1f}")
+
+    # The old page load: every event, filtered in the browser.
+    with app_module.app.app_context():
+        samples = []
+        for _ in range(args.repeats):
+            started = time.perf_counter()
+            everything = [event.to_dict() for event in app_module.Event.query.all()]
+            samples.append(time.perf_counter() - started)
+            app_module.db.session.remove()
+    print(f"{'load every event (before)':>28} {percentile(samples, 0.5) * 1000:>8.1f} {percentile(samples, 0.95) * 1000:>8.1f} "
+          f"{len(everything):>7} {1:>8.1f}")
+    print("repeating series are returned as occurrences inside the window; the 'before' row lists each series once.")
+
+
+if __name__ == '__main__':
+    main()
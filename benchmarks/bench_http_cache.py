@@ -0,0 +1,91 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+import app as app_module
+from query_counter import count_queries
+from seed import seed_database
+
+# One dashboard load plus the tasks and employees pages.
+PAGE_LOADS = [
+    '/employees',
+    '/assignments?status=pending&limit=7',
+    '/api/events?limit=4',
+    '/tasks?limit=50',
+]
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def run_mode(mode, args, client, engine):
+    rng = random.Random(0)
+    etags = {}
+    latencies = []
+    transferred = 0
+    not_modified = 0
+    with count_queries(engine) as counter:
+        for load in range(args.loads):
+            if args.write_every and load and load % args.write_every == 0:
+                client.put(f'/tasks/{rng.randint(1, args.tasks)}/status',
+                           json={'status': rng.choice(['pending', 'complete'])})
+            if mode == 'uncached':
+                app_module.response_cache.invalidate()
+            started = time.perf_counter()
+            for path in PAGE_LOADS:
+                headers = {}
+                if mode == 'conditional' and path in etags:
+                    headers['If-None-Match'] = etags[path]
+                response = client.get(path, headers=headers)
+                assert response.status_code in (200, 304), (path, response.status_code)
+                if response.status_code == 304:
+                    not_modified += 1
+                etags[path] = response.headers.get('ETag')
+                transferred += len(response.get_data())
+            latencies.append(time.perf_counter() - started)
+        queries = counter.count
+    return {
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'kilobytes': transferred / 1024,
+        'queries_per_load': queries / args.loads,
+        'not_modified': not_modified,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Repeated dashboard loads with and without the response cache and ETags.')
+    parser.add_argument('--tasks', type=int, default=20000)
+    parser.add_argument('--loads', type=int, default=200)
+    parser.add_argument('--write-every', type=int, default=20, help='change one task status every N loads (0: never)')
+    args = parser.parse_args()
+
+    seed_database(app_module, employees=200, meetings=200, tasks=args.tasks)
+    client = app_module.app.test_client()
+
+    print(f"{args.tasks} tasks, {args.loads} loads of {len(PAGE_LOADS)} requests, "
+          f"a write every {args.write_every or 'never'} loads")
+    print(f"{'mode':>12} {'p50 ms':>8} {'p95 ms':>8} {'KiB sent':>9} {'queries/load':>13} {'304s':>6}")
+    with app_module.app.app_context():
+        engine = app_module.db.engine
+        for mode in ('uncached', 'cached', 'conditional'):
+            r = run_mode(mode, args, client, engine)
+            print(f"{mode:>12} {r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['kilobytes']:>9.0f} "
+                  f"{r['queries_per_load']:>13.1f} {r['not_modified']:>6}")
+
+
+if __name__ == '__main__':
+    main()
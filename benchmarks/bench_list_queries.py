@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+import app as app_module
+from query_counter import count_queries
+from seed import seed_database
+
+ENDPOINTS = [
+    '/tasks', '/tasks?limit=50', '/assignments', '/assignments?limit=50',
+    '/employees', '/employees/1/tasks', '/employees/1/tasks?limit=50', '/get_final_assignments',
+]
+
+
+def measure(client, engine, path):
+    # A response served from the cache runs no list query at all.
+    app_module.response_cache.invalidate()
+    with count_queries(engine) as counter:
+        started = time.perf_counter()
+        response = client.get(path)
+        elapsed = time.perf_counter() - started
+    assert response.status_code == 200, (path, response.status_code)
+    return counter.count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SQL statement counts and latency of the task list endpoints.')
+    parser.add_argument('--tasks', type=int, nargs='+', default=[100, 10000, 100000])
+    args = parser.parse_args()
+
+    client = app_module.app.test_client()
+    with client.session_transaction() as session:
+        session['current_meeting_id'] = 1
+
+    counts = {}
+    args.tasks = sorted(args.tasks)
+    print(f"{'tasks':>7} {'endpoint':<28} {'queries':>8} {'latency (ms)':>13}")
+    for total in args.tasks:
+        seed_database(app_module, employees=50, meetings=max(1, total // 10), tasks=total)
+        with app_module.app.app_context():
+            engine = app_module.db.engine
+            for path in ENDPOINTS:
+                queries, elapsed = measure(client, engine, path)
+                counts.setdefault(path, []).append(queries)
+                print(f"{total:>7} {path:<28} {queries:>8} {elapsed * 1000:>13.1f}")
+
+    # One extra query per row (or per page of rows) shows up as a higher
+    # count on the bigger database.
+    growing = {path: values for path, values in counts.items() if len(set(values)) > 1}
+    if growing:
+        for path, values in growing.items():
+            print(f"FAIL {path}: " + ', '.join(f'{count} queries at {total} tasks' for total, count in zip(args.tasks, values)))
+        sys.exit(1)
+    print(f"OK: query counts are the same at {', '.join(str(total) for total in args.tasks)} tasks.")
+
+
+if __name__ == '__main__':
+    main()
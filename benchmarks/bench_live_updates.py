@@ -0,0 +1,203 @@
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+os.environ.setdefault('STREAM_HEARTBEAT_SECONDS', '1')
+os.environ.setdefault('BACKGROUND_WORKERS', '0')
+
+from werkzeug.serving import make_server
+
+import app as app_module
+from query_counter import count_queries
+from seed import seed_database
+
+# What the dashboard loads on every refresh.
+DASHBOARD_REQUESTS = ['/employees', '/assignments?status=pending&limit=7', '/api/events?limit=4']
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+class TrafficCounter:
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        self.bytes = 0
+
+    def __call__(self, environ, start_response):
+        with self.lock:
+            self.requests[environ['PATH_INFO']] += 1
+        for chunk in self.wsgi_app(environ, start_response):
+            with self.lock:
+                self.bytes += len(chunk)
+            yield chunk
+
+    def reset(self):
+        with self.lock:
+            self.requests.clear()
+            self.bytes = 0
+
+
+def get(port, path):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    try:
+        connection.request('GET', path)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def writer(port, statuses, changes, interval, sent):
+    rng = random.Random(1)
+    task_ids = list(statuses)
+    for _ in range(changes):
+        task_id = rng.choice(task_ids)
+        status = 'complete' if statuses[task_id] == 'pending' else 'pending'
+        statuses[task_id] = status
+        sent[(task_id, status)] = time.perf_counter()
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        connection.request('PUT', f'/tasks/{task_id}/status', body=json.dumps({'status': status}),
+                           headers={'Content-Type': 'application/json'})
+        connection.getresponse().read()
+        connection.close()
+        time.sleep(interval)
+
+
+def polling_client(port, stop, interval):
+    while not stop.is_set():
+        for path in DASHBOARD_REQUESTS:
+            get(port, path)
+        stop.wait(interval)
+
+
+def streaming_client(port, stop, sent, delays, lock):
+    for path in DASHBOARD_REQUESTS:
+        get(port, path)
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    connection.request('GET', '/stream')
+    response = connection.getresponse()
+    event_type = None
+    try:
+        while not stop.is_set():
+            line = response.readline()
+            if not line:
+                break
+            line = line.decode().rstrip('\n')
+            if line.startswith('event: '):
+                event_type = line[7:]
+            elif line.startswith('data: ') and event_type == 'task.status':
+                received = time.perf_counter()
+                for change in json.loads(line[6:])['tasks']:
+                    started = sent.get((change['id'], change['status']))
+                    if started is not None:
+                        with lock:
+                            delays.append(received - started)
+            elif line.startswith('data: ') and event_type == 'reset':
+                for path in DASHBOARD_REQUESTS:
+                    get(port, path)
+    finally:
+        connection.close()
+
+
+def run_mode(mode, args, port, traffic, statuses):
+    traffic.reset()
+    stop = threading.Event()
+    sent = {}
+    delays = []
+    lock = threading.Lock()
+    if mode == 'polling':
+        clients = [threading.Thread(target=polling_client, args=(port, stop, args.poll_seconds))
+                   for _ in range(args.clients)]
+    else:
+        clients = [threading.Thread(target=streaming_client, args=(port, stop, sent, delays, lock))
+                   for _ in range(args.clients)]
+
+    engine = app_module.db.engine
+    with count_queries(engine) as counter:
+        started = time.perf_counter()
+        for client in clients:
+            client.start()
+        time.sleep(0.5)
+        write_interval = args.seconds / max(1, args.changes)
+        writer(port, statuses, args.changes, write_interval, sent)
+        time.sleep(max(0.0, args.seconds - (time.perf_counter() - started)) + 0.5)
+        stop.set()
+        for client in clients:
+            client.join()
+        elapsed = time.perf_counter() - started
+        queries = counter.count
+
+    requests = sum(count for path, count in traffic.requests.items() if not path.startswith('/tasks/'))
+    return {
+        'requests': requests,
+        'requests_per_second': requests / elapsed,
+        'kilobytes': traffic.bytes / 1024,
+        'queries': queries,
+        'p50_ms': percentile(delays, 0.50) * 1000,
+        'p95_ms': percentile(delays, 0.95) * 1000,
+        'delivered': len(delays),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Request volume of dashboard clients: periodic re-fetching vs /stream.')
+    parser.add_argument('--clients', type=int, default=25)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--changes', type=int, default=50)
+    parser.add_argument('--poll-seconds', type=float, default=2)
+    parser.add_argument('--tasks', type=int, default=5000)
+    args = parser.parse_args()
+
+    seed_database(app_module, employees=50, meetings=50, tasks=args.tasks)
+    with app_module.app.app_context():
+        statuses = dict(app_module.db.session.query(app_module.Task.id, app_module.Task.status))
+
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    traffic = TrafficCounter(app_module.app.wsgi_app)
+    app_module.app.wsgi_app = traffic
+    server = make_server('127.0.0.1', 0, app_module.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    print(f"{args.clients} clients, {args.seconds:g}s, {args.changes} status changes, "
+          f"polling every {args.poll_seconds:g}s")
+    print(f"{'mode':>8} {'requests':>9} {'req/s':>7} {'KiB':>8} {'queries':>8} {'p50 ms':>7} {'p95 ms':>7}")
+    try:
+        with app_module.app.app_context():
+            for mode in ('polling', 'stream'):
+                r = run_mode(mode, args, server.port, traffic, statuses)
+                if mode == 'polling':
+                    p50, p95 = f"~{args.poll_seconds * 500:.0f}", f"<{args.poll_seconds * 1000:.0f}"
+                else:
+                    p50, p95 = f"{r['p50_ms']:.1f}", f"{r['p95_ms']:.1f}"
+                    assert r['delivered'] == args.changes * args.clients, r
+                print(f"{mode:>8} {r['requests']:>9} {r['requests_per_second']:>7.1f} {r['kilobytes']:>8.0f} "
+                      f"{r['queries']:>8} {p50:>7} {p95:>7}")
+    finally:
+        server.shutdown()
+    print("Requests exclude the status updates themselves; p50/p95 is the delay until a client sees a change "
+          "(for polling, bounded by the interval).")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fixtures import make_transcript
+from ollama_client import OllamaClient
+from stub_ollama import start_stub_server
+from task_extraction import estimate_tokens, extract_tasks_map_reduce, split_transcript
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end extraction latency: single prompt vs map-reduce.')
+    parser.add_argument('--turns', type=int, nargs='+', default=[200, 1000, 3000])
+    parser.add_argument('--chunk-tokens', type=int, default=1500)
+    parser.add_argument('--parallelism', type=int, default=4)
+    parser.add_argument('--prompt-token-delay', type=float, default=0.0002,
+                        help='stub seconds of prompt evaluation per prompt word')
+    parser.add_argument('--token-delay', type=float, default=0.002)
+    args = parser.parse_args()
+
+    _, url = start_stub_server(token_delay=args.token_delay, prompt_token_delay=args.prompt_token_delay)
+    client = OllamaClient(base_url=url, pool_size=args.parallelism)
+
+    def analyse_chunk(text, on_task=None):
+        return client.extract_tasks(f"Transcript:\n{text}", on_task=on_task)
+
+    print(f"{'turns':>6} {'tokens':>7} {'chunks':>6} {'single (s)':>11} {'map-reduce (s)':>15} {'tasks':>6}")
+    for turns in args.turns:
+        text = make_transcript(turns, seed=turns)
+
+        started = time.perf_counter()
+        analyse_chunk(text)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = extract_tasks_map_reduce(text, analyse_chunk, args.chunk_tokens, args.parallelism)
+        mapped = time.perf_counter() - started
+
+        chunks = len(split_transcript(text, args.chunk_tokens))
+        print(f"{turns:>6} {estimate_tokens(text):>7} {chunks:>6} {single:>11.2f} {mapped:>15.2f} {len(result['tasks']):>6}")
+
+
+if __name__ == '__main__':
+    main()
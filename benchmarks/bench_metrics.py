@@ -0,0 +1,91 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Mostly reads, as on the dashboard, with a status change every few requests.
+REQUESTS = [
+    ('GET', '/tasks?limit=50'),
+    ('GET', '/employees'),
+    ('GET', '/assignments?status=pending&limit=7'),
+    ('PUT', '/tasks/{task_id}/status'),
+]
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def run_child(args):
+    # METRICS_ENABLED is read at import, so each mode runs in its own process.
+    db_dir = tempfile.mkdtemp(prefix='multibrain-bench-')
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(db_dir, 'bench.db')}"
+    import app as app_module
+    from seed import seed_database
+
+    seed_database(app_module, employees=200, meetings=200, tasks=args.tasks)
+    client = app_module.app.test_client()
+    rng = random.Random(0)
+    latencies = {path: [] for _, path in REQUESTS}
+    for round_number in range(args.rounds):
+        for method, path in REQUESTS:
+            # Drop cached lists so every read runs its queries.
+            app_module.response_cache.invalidate()
+            started = time.perf_counter()
+            if method == 'PUT':
+                response = client.put(path.format(task_id=rng.randint(1, args.tasks)),
+                                      json={'status': rng.choice(['pending', 'complete'])})
+            else:
+                response = client.get(path)
+            latencies[path].append(time.perf_counter() - started)
+            assert response.status_code == 200, (path, response.status_code)
+
+    result = {path: {'p50_ms': percentile(samples, 0.5) * 1000, 'p95_ms': percentile(samples, 0.95) * 1000}
+              for path, samples in latencies.items()}
+    if app_module.METRICS_ENABLED:
+        started = time.perf_counter()
+        body = client.get('/metrics').get_data()
+        result['scrape'] = {'ms': (time.perf_counter() - started) * 1000, 'bytes': len(body)}
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Request latency with instrumentation on and off.')
+    parser.add_argument('--tasks', type=int, default=20000)
+    parser.add_argument('--rounds', type=int, default=300)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        run_child(args)
+        return
+
+    results = {}
+    for enabled in ('0', '1'):
+        output = subprocess.run(
+            [sys.executable, __file__, '--child', '--tasks', str(args.tasks), '--rounds', str(args.rounds)],
+            env=dict(os.environ, METRICS_ENABLED=enabled), capture_output=True, text=True, check=True
+        ).stdout
+        results[enabled] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{args.tasks} tasks, {args.rounds} rounds, response cache bypassed")
+    print(f"{'request':>38} {'off p50':>8} {'on p50':>8} {'off p95':>8} {'on p95':>8} {'p50 cost':>9}")
+    for _, path in REQUESTS:
+        off, on = results['0'][path], results['1'][path]
+        print(f"{path:>38} {off['p50_ms']:>8.2f} {on['p50_ms']:>8.2f} {off['p95_ms']:>8.2f} {on['p95_ms']:>8.2f} "
+              f"{(on['p50_ms'] - off['p50_ms']) / off['p50_ms']:>+9.1%}")
+    scrape = results['1']['scrape']
+    print(f"GET /metrics: {scrape['ms']:.2f} ms, {scrape['bytes'] / 1024:.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
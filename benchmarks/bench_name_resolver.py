@@ -0,0 +1,160 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+from sqlalchemy import insert
+
+import app as app_module
+from name_resolver import EmployeeResolver
+
+FIRST_NAMES = [
+    'James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'William', 'Elizabeth',
+    'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Charles', 'Karen',
+    'Chris', 'Nancy', 'Daniel', 'Lisa', 'Matthew', 'Betty', 'Anthony', 'Margaret', 'Mark', 'Sandra',
+    'Donald', 'Ashley', 'Steven', 'Kimberly', 'Paul', 'Emily', 'Andrew', 'Donna', 'Joshua', 'Michelle',
+    'Kenneth', 'Dorothy', 'Kevin', 'Carol', 'Brian', 'Amanda', 'George', 'Melissa', 'Edward', 'Deborah',
+]
+LAST_NAMES = [
+    'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+    'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin',
+    'Lee', 'Perez', 'Thompson', 'White', 'Harris', 'Sanchez', 'Clark', 'Ramirez', 'Lewis', 'Robinson',
+    'Walker', 'Young', 'Allen', 'King', 'Wright', 'Scott', 'Torres', 'Nguyen', 'Hill', 'Flores',
+    'Green', 'Adams', 'Nelson', 'Baker', 'Hall', 'Rivera', 'Campbell', 'Mitchell', 'Carter', 'Roberts',
+]
+
+
+def make_last_names():
+    # Variants like "Smithson" and "McSmith" keep near-miss surnames in the
+    # index, so a typo has plausible wrong answers to choose from.
+    names = list(LAST_NAMES)
+    names += [f"{last}son" for last in LAST_NAMES]
+    names += [f"Mc{last}" for last in LAST_NAMES]
+    names += [f"{last}ley" for last in LAST_NAMES]
+    return names
+
+
+def make_employees(count):
+    last_names = make_last_names()
+    employees = []
+    for i in range(count):
+        first = FIRST_NAMES[i % len(FIRST_NAMES)]
+        last = last_names[(i // len(FIRST_NAMES)) % len(last_names)]
+        # Past the available combinations, number surnames so names stay unique.
+        cycle = i // (len(FIRST_NAMES) * len(last_names))
+        if cycle:
+            last = f"{last}{cycle}"
+        employees.append((i + 1, f"{first} {last}", f"{first.lower()}.{last.lower()}@example.com", []))
+    return employees
+
+
+def typo(word, rng):
+    # Swap two different adjacent letters, so the result is always a typo.
+    positions = [i for i in range(len(word) - 1) if word[i] != word[i + 1]]
+    i = rng.choice(positions)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+# (label, how the LLM might write the name, whether a unique answer exists)
+def query_forms(name, rng):
+    first, last = name.split(' ', 1)
+    return [
+        ('exact', name),
+        ('lowercase', name.lower()),
+        ('initial', f"{first[0]}. {last}"),
+        ('email', f"{first.lower()}.{last.lower()}"),
+        ('honorific', f"Dr. {name}"),
+        ('typo', f"{first} {typo(last, rng)}"),
+        ('first_only', first),
+    ]
+
+
+def old_lookup(employees_by_name, text):
+    employee = employees_by_name.get(text.lower())
+    return employee[0] if employee else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Employee name resolution: exact lowercase dict vs the resolver index.')
+    parser.add_argument('--employees', type=int, default=10000)
+    parser.add_argument('--queries', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    employees = make_employees(args.employees)
+
+    started = time.perf_counter()
+    resolver = EmployeeResolver()
+    resolver.replace_all(employees)
+    build_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for row in employees[:100]:
+        resolver.upsert(*row)
+    upsert_ms = (time.perf_counter() - started) * 1000 / 100
+
+    with app_module.app.app_context():
+        db = app_module.db
+        db.drop_all()
+        db.create_all()
+        db.session.execute(insert(app_module.Employee), [
+            {'id': employee_id, 'name': name, 'email': email} for employee_id, name, email, _ in employees
+        ])
+        db.session.commit()
+
+        started = time.perf_counter()
+        employees_by_name = {e.name.lower(): (e.id, e.email) for e in app_module.Employee.query.all()}
+        old_load_ms = (time.perf_counter() - started) * 1000
+        db.session.remove()
+
+        app_module.refresh_employee_resolver()
+        started = time.perf_counter()
+        app_module.refresh_employee_resolver()
+        refresh_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{args.employees} employees")
+    print(f"  per-upload load, old exact dict:          {old_load_ms:8.1f} ms")
+    print(f"  per-upload refresh, resolver (unchanged): {refresh_ms:8.2f} ms")
+    print(f"  resolver full build:                      {build_seconds * 1000:8.1f} ms")
+    print(f"  resolver incremental upsert:              {upsert_ms:8.3f} ms/employee")
+    print()
+
+    sample = rng.sample(employees, min(args.queries, len(employees)))
+    results = {}
+    for employee_id, name, _, _ in sample:
+        for label, text in query_forms(name, rng):
+            expected = None if label == 'first_only' else employee_id
+            entry = results.setdefault(label, {'old': Counter(), 'new': Counter(), 'auto': Counter(), 'seconds': 0.0})
+
+            got = old_lookup(employees_by_name, text)
+            entry['old']['correct' if got == expected else ('missed' if got is None else 'wrong')] += 1
+
+            started = time.perf_counter()
+            match = resolver.resolve(text)
+            entry['seconds'] += time.perf_counter() - started
+            got = match.employee_id
+            entry['new']['correct' if got == expected else ('missed' if got is None else 'wrong')] += 1
+            if match.confidence >= app_module.AUTO_ASSIGN_MIN_CONFIDENCE:
+                entry['auto']['correct' if got == expected else 'wrong'] += 1
+
+    print(f"{'query form':>11} {'old correct':>12} {'new correct':>12} {'new wrong':>10} "
+          f"{'auto-assigned':>14} {'auto wrong':>11} {'us/lookup':>10}")
+    for label, entry in results.items():
+        total = sum(entry['new'].values())
+        print(f"{label:>11} {entry['old']['correct'] / total:>12.0%} {entry['new']['correct'] / total:>12.0%} "
+              f"{entry['new']['wrong']:>10} {sum(entry['auto'].values()):>14} {entry['auto']['wrong']:>11} "
+              f"{entry['seconds'] / total * 1e6:>10.1f}")
+    print("first_only is correct when left unresolved: every first name is shared by many employees.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ollama_client import OllamaClient
+from stub_ollama import start_stub_server
+
+
+def blocking_call(url, prompt):
+    response = requests.post(
+        f"{url}/api/generate",
+        json={"model": "llama2:latest", "prompt": prompt, "stream": False},
+        timeout=120
+    )
+    response.raise_for_status()
+    return json.loads(response.json()['response'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time-to-first-task for blocking vs streaming Ollama calls.')
+    parser.add_argument('--url', help='Ollama URL; a local stub server is started when omitted')
+    parser.add_argument('--tasks', type=int, default=10)
+    parser.add_argument('--token-delay', type=float, default=0.005)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        _, url = start_stub_server(tasks_per_response=args.tasks, token_delay=args.token_delay)
+    client = OllamaClient(base_url=url)
+    prompt = 'Meeting transcript ' * 50
+
+    blocking_total = streaming_first = streaming_total = 0.0
+    for _ in range(args.runs):
+        started = time.perf_counter()
+        blocking_call(url, prompt)
+        blocking_total += time.perf_counter() - started
+
+        first = []
+        started = time.perf_counter()
+        client.extract_tasks(prompt, on_task=lambda task: first or first.append(time.perf_counter() - started))
+        streaming_total += time.perf_counter() - started
+        streaming_first += first[0] if first else 0.0
+
+    runs = args.runs
+    print(f"blocking   first task {blocking_total / runs * 1000:8.1f} ms  total {blocking_total / runs * 1000:8.1f} ms")
+    print(f"streaming  first task {streaming_first / runs * 1000:8.1f} ms  total {streaming_total / runs * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from stub_ollama import start_stub_server
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+
+
+def change_prompt(app_module, version, same_answers=False):
+    # The stand-in derives its tasks from the prompt length: a reworded
+    # prompt of the same length gets the same tasks back, a longer one a
+    # different list.
+    if same_answers:
+        app_module.OLLAMA_PROMPT_TEMPLATE = app_module.OLLAMA_PROMPT_TEMPLATE.replace('ONLY', 'JUST', 1)
+    else:
+        app_module.OLLAMA_PROMPT_TEMPLATE += f'\nPrompt revision {version}.'
+    app_module.ANALYSIS_FINGERPRINT = f'bench-{version}'
+
+
+def wait(queue):
+    while queue.depth():
+        time.sleep(0.005)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='After a prompt change: re-uploading every transcript vs re-analysing stored meetings.')
+    parser.add_argument('--meetings', type=int, default=40)
+    parser.add_argument('--turns', type=int, default=200, help='speaker turns per transcript')
+    parser.add_argument('--stub-tasks', type=int, default=6, help='tasks the Ollama stand-in returns per chunk')
+    parser.add_argument('--token-delay', type=float, default=0.002, help='seconds per streamed fragment from the stand-in')
+    parser.add_argument('--workers', type=int, default=4, help='BATCH_WORKERS and REANALYSIS_WORKERS')
+    args = parser.parse_args()
+
+    os.chdir(DB_DIR)
+    _, url = start_stub_server(tasks_per_response=args.stub_tasks, token_delay=args.token_delay)
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}",
+        CACHE_DB_PATH=os.path.join(DB_DIR, 'cache.db'),
+        OLLAMA_URL=url,
+        BATCH_WORKERS=str(args.workers),
+        REANALYSIS_WORKERS=str(args.workers),
+    )
+    import app as app_module
+    from fixtures import make_transcript
+    from query_counter import count_queries
+
+    client = app_module.app.test_client()
+    transcripts = [make_transcript(args.turns, seed=2000 + i).encode() for i in range(args.meetings)]
+
+    def upload_all():
+        response = client.post('/batches', data={
+            'file': [(io.BytesIO(text), f'meeting-{i}.txt') for i, text in enumerate(transcripts)],
+            'resume': '0',
+        })
+        assert response.status_code == 202, response.get_data(as_text=True)
+        wait(app_module.batch_queue)
+
+    with app_module.app.app_context():
+        db = app_module.db
+        app_module.migrate_database()
+        for name in ['John Doe', 'Jane Smith', 'Peter Jones', 'Alice Brown', 'Robert Green']:
+            db.session.add(app_module.Employee(name=name, email=f"{name.split()[0].lower()}@example.com"))
+        db.session.commit()
+        upload_all()
+        tasks_before = app_module.Task.query.count()
+        # Someone has worked through part of the list since the import.
+        touched = [task_id for task_id, in db.session.query(app_module.Task.id).order_by(app_module.Task.id)][::5]
+        client.post('/tasks/status/bulk', json={'task_ids': touched, 'status': 'complete'})
+        db.session.remove()
+
+        same = reanalyse(app_module, client, args, touched, 2, same_answers=True)
+        change_prompt(app_module, 3)
+        with count_queries(db.engine) as counter:
+            started = time.perf_counter()
+            upload_all()
+            elapsed = time.perf_counter() - started
+        db.session.remove()
+        reupload = (elapsed, counter.writes, app_module.Meeting.query.count() - args.meetings)
+        # Re-uploading leaves a second copy of every meeting; drop them so
+        # only the originals are stale for the next run.
+        Task, Meeting = app_module.Task, app_module.Meeting
+        db.session.query(Task).filter(Task.meeting_id > args.meetings).delete()
+        db.session.query(Meeting).filter(Meeting.id > args.meetings).delete()
+        db.session.commit()
+
+        runs = [same, reanalyse(app_module, client, args, touched, 4)]
+
+    print(f"{args.meetings} meetings of {args.turns} turns, {tasks_before} tasks, {len(touched)} marked complete, "
+          f"{args.workers} workers, stub delay {args.token_delay * 1000:g} ms/fragment")
+    print(f"{'after a prompt change':>32} {'seconds':>8} {'meetings/hour':>14} {'SQL writes':>11} {'new meetings':>13}")
+    elapsed, writes, new_meetings = reupload
+    print(f"{'re-upload everything':>32} {elapsed:>8.2f} {args.meetings / elapsed * 3600:>14.0f} {writes:>11} {new_meetings:>13}")
+    for label, elapsed, writes, stale, changes, still_complete in runs:
+        print(f"{label:>32} {elapsed:>8.2f} {stale / elapsed * 3600:>14.0f} {writes:>11} {0:>13}")
+        print(f"{'':>32} tasks: " + ', '.join(f'{count} {name}' for name, count in changes.items()) +
+              f"; {still_complete} of {len(touched)} completed tasks still complete")
+    print("Re-uploading recordings would also re-run Whisper; re-analysis reads the stored transcript.")
+
+
+def reanalyse(app_module, client, args, touched, version, same_answers=False):
+    from query_counter import count_queries
+
+    change_prompt(app_module, version, same_answers)
+    db = app_module.db
+    stale = app_module.stale_meetings().count()
+    with count_queries(db.engine) as counter:
+        started = time.perf_counter()
+        response = client.post('/meetings/reanalyse')
+        assert response.status_code == 202, response.get_data(as_text=True)
+        wait(app_module.reanalysis_queue)
+        elapsed = time.perf_counter() - started
+    db.session.remove()
+
+    changes = {}
+    for job in client.get(response.json['status_url']).json['jobs']:
+        assert job['stage'] == 'done', job['error']
+        for name, count in client.get(f"/jobs/{job['id']}").json['changes'].items():
+            changes[name] = changes.get(name, 0) + count
+    Task = app_module.Task
+    still_complete = Task.query.filter(Task.id.in_(touched), Task.status == 'complete').count()
+    db.session.remove()
+    label = 're-analyse, same answers' if same_answers else 're-analyse, new answers'
+    return label, elapsed, counter.writes, stale, changes, still_complete
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from smtp_sink import start_smtp_sink
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+START = datetime(2026, 3, 2, 0, 0)
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def scan_tick(app_module, previous, now):
+    # A scheduler without the queue: read every open task with a deadline
+    # each tick and work out which of them crossed a reminder time since
+    # the last one.
+    Task = app_module.Task
+    rows = app_module.db.session.query(Task.id, Task.deadline, Task.assigned_employee_id).filter(
+        Task.status == 'pending', Task.deadline.isnot(None)
+    ).all()
+    schedule = app_module.reminder_schedule
+    return sum(1 for row in rows if any(previous < slot <= now for slot in schedule.slots(row.deadline)))
+
+
+def wait_for_outbox(app_module):
+    OutboxEmail = app_module.OutboxEmail
+    while OutboxEmail.query.filter(OutboxEmail.status == 'pending').count():
+        app_module.db.session.commit()
+        time.sleep(0.05)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Deadline reminders on a fake clock: indexed queue vs scanning open tasks.')
+    parser.add_argument('--tasks', type=int, default=50000)
+    parser.add_argument('--employees', type=int, default=500)
+    parser.add_argument('--days', type=int, default=14, help='simulated days, ticking every hour')
+    parser.add_argument('--scan-ticks', type=int, default=24, help='ticks to time the full-scan scheduler on')
+    args = parser.parse_args()
+
+    sink, port = start_smtp_sink()
+    os.chdir(DB_DIR)
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}",
+        CACHE_DB_PATH=os.path.join(DB_DIR, 'cache.db'),
+        SMTP_HOST='127.0.0.1',
+        SMTP_PORT=str(port),
+        SMTP_SSL='0',
+        EMAIL_ADDRESS='reminders@example.com',
+        EMAIL_RATE_PER_SECOND='0',
+        EMAIL_BATCH_SIZE='500',
+    )
+    from sqlalchemy import text
+
+    import app as app_module
+    from query_counter import count_queries
+    from seed import seed_database
+
+    clock = [START]
+    app_module.reminder_scheduler.clock = lambda: clock[0]
+    seed_database(app_module, employees=args.employees, meetings=100, tasks=args.tasks)
+
+    with app_module.app.app_context():
+        db = app_module.db
+        # Deadlines from a month before the start to three months after it.
+        db.session.execute(text(
+            "UPDATE tasks SET deadline = date(:start, ((id * 7919) % 120 - 30) || ' days')"
+        ), {'start': START.date().isoformat()})
+        db.session.commit()
+        started = time.perf_counter()
+        scheduled = app_module.reschedule_reminders(START)
+        reschedule_seconds = time.perf_counter() - started
+        open_tasks = app_module.Task.query.filter(app_module.Task.status == 'pending').count()
+        db.session.remove()
+
+        idle, busy, statements = [], [], []
+        digests_per_day, reminders_per_day = [], []
+        for day in range(args.days):
+            digests = 0
+            reminded = app_module.OutboxEmail.query.count()
+            for hour in range(24):
+                clock[0] = START + timedelta(days=day, hours=hour + 1)
+                with count_queries(db.engine) as counter:
+                    tick_started = time.perf_counter()
+                    queued = app_module.send_due_reminders(clock[0])
+                    elapsed = time.perf_counter() - tick_started
+                (busy if queued else idle).append(elapsed)
+                statements.append(counter.count)
+                digests += queued
+                db.session.remove()
+            # Delivery happens between ticks so it doesn't count against them.
+            wait_for_outbox(app_module)
+            digests_per_day.append(digests)
+            reminders_per_day.append(sum(
+                body.count('\n- ') for body, in db.session.query(app_module.OutboxEmail.body).filter(
+                    app_module.OutboxEmail.id > reminded
+                )
+            ))
+            db.session.remove()
+
+        scan = []
+        previous = START
+        for hour in range(args.scan_ticks):
+            now = START + timedelta(hours=hour + 1)
+            tick_started = time.perf_counter()
+            scan_tick(app_module, previous, now)
+            scan.append(time.perf_counter() - tick_started)
+            previous = now
+            db.session.remove()
+
+    delivered = len(sink.messages)
+    print(f"{args.tasks} tasks ({open_tasks} open, {scheduled} with a reminder scheduled), {args.employees} employees, "
+          f"{args.days} days ticking hourly")
+    print(f"  scheduling every open task from scratch: {reschedule_seconds:.2f} s")
+    print(f"{'tick':>26} {'p50 ms':>8} {'p95 ms':>8} {'ticks':>6}")
+    print(f"{'queue, nothing due':>26} {percentile(idle, 0.5) * 1000:>8.2f} {percentile(idle, 0.95) * 1000:>8.2f} {len(idle):>6}")
+    if busy:
+        print(f"{'queue, digests due':>26} {percentile(busy, 0.5) * 1000:>8.1f} {percentile(busy, 0.95) * 1000:>8.1f} {len(busy):>6}")
+    print(f"{'scan every open task':>26} {percentile(scan, 0.5) * 1000:>8.1f} {percentile(scan, 0.95) * 1000:>8.1f} {len(scan):>6}")
+    print(f"  SQL statements per idle tick: {min(statements)}")
+    total_reminders = sum(reminders_per_day)
+    total_digests = sum(digests_per_day)
+    print(f"  {total_reminders} task reminders sent as {total_digests} digests "
+          f"({total_reminders / max(1, total_digests):.1f} tasks per email, {total_digests / args.days:.0f} emails/day)")
+    print(f"  {delivered} digests delivered to the local SMTP sink")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DB_DIR = tempfile.mkdtemp(prefix='multibrain-bench-')
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(DB_DIR, 'bench.db')}")
+
+from sqlalchemy import text
+
+import app as app_module
+import search_index
+from seed import seed_database
+
+# (label, what is typed into /search, the LIKE patterns an unindexed search would scan for)
+QUERIES = [
+    ('rare', 'walrus', ['walrus']),
+    ('uncommon', 'escrow', ['escrow']),
+    ('frequent', 'audit', ['audit']),
+    ('two words', 'walrus escrow', ['walrus', 'escrow']),
+    ('everywhere', 'Q3 report', ['q3', 'report']),
+    ('phrase', '"launch checklist"', ['launch checklist']),
+    ('prefix', 'onboard*', ['onboard']),
+]
+# Words added to every Nth meeting. The fixture transcripts reuse a small
+# vocabulary, so without these every query would match most meetings.
+PLANTED = [('walrus', 1000), ('escrow', 100), ('audit', 10)]
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def timed(fn, repeats):
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    return result, percentile(samples, 0.5) * 1000, percentile(samples, 0.95) * 1000
+
+
+def like_search(session, patterns, limit):
+    # What searching looked like without an index: every pattern must be in
+    # the task or the transcript, newest first, with no relevance order.
+    task_where = ' AND '.join(f"description LIKE :p{i}" for i in range(len(patterns)))
+    meeting_where = ' AND '.join(f"transcript LIKE :p{i}" for i in range(len(patterns)))
+    params = {f'p{i}': f'%{pattern}%' for i, pattern in enumerate(patterns)}
+    params['limit'] = limit
+    tasks = session.execute(text(f'SELECT id FROM tasks WHERE {task_where} ORDER BY id DESC LIMIT :limit'), params).all()
+    meetings = session.execute(
+        text(f'SELECT id FROM meetings WHERE {meeting_where} ORDER BY id DESC LIMIT :limit'), params
+    ).all()
+    return len(tasks) + len(meetings)
+
+
+def like_count(session, patterns):
+    where = ' AND '.join(f"transcript LIKE :p{i}" for i in range(len(patterns)))
+    params = {f'p{i}': f'%{pattern}%' for i, pattern in enumerate(patterns)}
+    return session.execute(text(f'SELECT count(*) FROM meetings WHERE {where}'), params).scalar()
+
+
+def fts_count(session, query):
+    return session.execute(
+        text('SELECT count(*) FROM meetings_fts WHERE meetings_fts MATCH :expression'),
+        {'expression': search_index.match_expression(query)}
+    ).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over meetings and tasks: FTS5 + BM25 vs LIKE '%...%' scans.")
+    parser.add_argument('--meetings', type=int, default=10000)
+    parser.add_argument('--tasks', type=int, default=50000)
+    parser.add_argument('--turns', type=int, default=100, help='speaker turns per transcript')
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    seed_database(app_module, employees=100, meetings=args.meetings, tasks=args.tasks, transcript_turns=args.turns)
+    seed_seconds = time.perf_counter() - started
+
+    client = app_module.app.test_client()
+    with app_module.app.app_context():
+        session = app_module.db.session
+        # Updated in place, so the triggers have to keep the index in step.
+        started = time.perf_counter()
+        updates = 0
+        for word, every in PLANTED:
+            for meeting_id in range(1, args.meetings + 1, every):
+                session.execute(
+                    text("UPDATE meetings SET transcript = transcript || :extra WHERE id = :id"),
+                    {'extra': f'\nJohn Doe: Someone has to look at the {word} contract.', 'id': meeting_id}
+                )
+                updates += 1
+        session.commit()
+        update_ms = (time.perf_counter() - started) * 1000 / updates
+
+        started = time.perf_counter()
+        search_index.rebuild(session)
+        session.commit()
+        rebuild_seconds = time.perf_counter() - started
+
+        transcript_mb = session.execute(text('SELECT sum(length(transcript)) FROM meetings')).scalar() / 1e6
+        print(f"{args.meetings} meetings ({transcript_mb:.0f} MB of transcripts), {args.tasks} tasks")
+        print(f"  seeding with the index kept up by triggers: {seed_seconds:.1f} s, full rebuild: {rebuild_seconds:.1f} s, "
+              f"transcript update: {update_ms:.2f} ms")
+        print()
+        print(f"{'query':>10} {'meetings':>9} {'LIKE page':>10} {'LIKE all':>9} {'FTS p50':>8} {'FTS p95':>8} "
+              f"{'/search p50':>12} {'speedup':>8}")
+        for label, query, patterns in QUERIES:
+            like_total, like_all_p50, _ = timed(lambda: like_count(session, patterns), max(1, args.repeats // 4))
+            fts_total = fts_count(session, query)
+            _, like_p50, _ = timed(lambda: like_search(session, patterns, args.limit), args.repeats)
+            _, fts_p50, fts_p95 = timed(lambda: (
+                search_index.search_tasks(session, search_index.match_expression(query), args.limit),
+                search_index.search_meetings(session, search_index.match_expression(query), args.limit),
+            ), args.repeats)
+
+            def endpoint():
+                app_module.response_cache.invalidate()
+                response = client.get('/search', query_string={'q': query, 'limit': args.limit})
+                assert response.status_code == 200, response.get_data(as_text=True)
+            _, endpoint_p50, _ = timed(endpoint, args.repeats)
+            print(f"{label:>10} {fts_total:>9} {like_p50:>10.1f} {like_all_p50:>9.1f} {fts_p50:>8.1f} {fts_p95:>8.1f} "
+                  f"{endpoint_p50:>12.1f} {like_p50 / fts_p50:>7.1f}x")
+            if like_total != fts_total:
+                print(f"{'':>10} LIKE matched {like_total} meetings; stemming and word boundaries account for the difference")
+        print("times in ms; 'LIKE page' and FTS fetch the first page of tasks and meetings, 'LIKE all' counts every match.")
+        print("LIKE returns newest first and can stop after one page when most meetings match; FTS ranks every match.")
+
+
+if __name__ == '__main__':
+    main()
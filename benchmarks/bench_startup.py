@@ -0,0 +1,55 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import json, time
+def rss_mb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+started = time.perf_counter()
+import app
+imported = time.perf_counter() - started
+result = {'import_s': imported, 'rss_after_import_mb': rss_mb()}
+if LOAD_MODEL:
+    started = time.perf_counter()
+    app.whisper_models.get(MODEL_SIZE)
+    result['first_load_s'] = time.perf_counter() - started
+    result['rss_after_load_mb'] = rss_mb()
+print(json.dumps(result))
+"""
+
+
+def run_probe(preload, load_model, size):
+    env = dict(os.environ, WHISPER_PRELOAD='1' if preload else '0', WHISPER_MODEL=size)
+    code = f'LOAD_MODEL = {load_model!r}\nMODEL_SIZE = {size!r}\n' + PROBE
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, env=env, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report app startup time and RSS with lazy vs preloaded Whisper.')
+    parser.add_argument('--size', default='base', choices=['tiny', 'base', 'small'])
+    args = parser.parse_args()
+
+    scenarios = [
+        ('lazy, no transcription', False, False),
+        ('lazy, first transcription', False, True),
+        ('preloaded', True, False),
+    ]
+    for label, preload, load_model in scenarios:
+        result = run_probe(preload, load_model, args.size)
+        line = f"{label:<28} import {result['import_s']:.2f}s  rss {result['rss_after_import_mb']:.0f} MB"
+        if 'first_load_s' in result:
+            line += f"  first load {result['first_load_s']:.2f}s  rss {result['rss_after_load_mb']:.0f} MB"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
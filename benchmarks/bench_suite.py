@@ -0,0 +1,318 @@
+import argparse
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+SCENARIOS = ('lists', 'upload', 'analysis', 'transcription')
+LIST_ENDPOINTS = [
+    '/tasks?limit=50',
+    '/tasks?status=pending&limit=50',
+    '/employees',
+    '/employees/1/tasks',
+    '/assignments?limit=50',
+    '/api/events?limit=20',
+]
+# Metrics where a higher number is better; everything else is a cost.
+HIGHER_IS_BETTER = ('per_second', 'per_hour')
+
+
+def percentile(samples, fraction):
+    if not samples:
+        return 0.0
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def latency_summary(samples):
+    return {
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 3),
+    }
+
+
+def load_app(args):
+    # Every scenario gets a fresh process, database and stub, so results
+    # don't depend on which scenarios ran before.
+    from stub_ollama import start_stub_server
+
+    db_dir = tempfile.mkdtemp(prefix='multibrain-bench-')
+    _, url = start_stub_server(tasks_per_response=args.stub_tasks, token_delay=args.token_delay)
+    os.environ.update(
+        DATABASE_URL=f"sqlite:///{os.path.join(db_dir, 'bench.db')}",
+        CACHE_DB_PATH=os.path.join(db_dir, 'cache.db'),
+        OLLAMA_URL=url,
+    )
+    import app as app_module
+    return app_module
+
+
+def run_lists(args):
+    app_module = load_app(args)
+    from query_counter import count_queries
+    from seed import seed_database
+
+    seed_database(app_module, employees=args.employees, meetings=args.meetings, tasks=args.tasks, seed=args.seed)
+    client = app_module.app.test_client()
+    results = {}
+    with app_module.app.app_context():
+        engine = app_module.db.engine
+        for path in LIST_ENDPOINTS:
+            client.get(path)
+            latencies = []
+            with count_queries(engine) as counter:
+                started = time.perf_counter()
+                for _ in range(args.requests):
+                    # Measure the queries, not the response cache.
+                    app_module.response_cache.invalidate()
+                    request_started = time.perf_counter()
+                    response = client.get(path)
+                    latencies.append(time.perf_counter() - request_started)
+                    assert response.status_code == 200, (path, response.status_code)
+                elapsed = time.perf_counter() - started
+            results[path] = dict(
+                latency_summary(latencies),
+                requests_per_second=round(args.requests / elapsed, 1),
+                sql_per_request=round(counter.count / args.requests, 2),
+            )
+    return results
+
+
+def wait_for_jobs(app_module, timeout=600):
+    deadline = time.monotonic() + timeout
+    while app_module.job_queue.depth():
+        if time.monotonic() > deadline:
+            raise TimeoutError('upload jobs did not finish')
+        time.sleep(0.002)
+
+
+def run_upload(args):
+    app_module = load_app(args)
+    from fixtures import make_transcript
+    from query_counter import count_queries
+    from seed import seed_database
+
+    seed_database(app_module, employees=args.employees, meetings=10, tasks=100, seed=args.seed)
+    client = app_module.app.test_client()
+    results = {}
+    with app_module.app.app_context():
+        engine = app_module.db.engine
+        for turns in args.turns:
+            upload_latencies = []
+            job_latencies = []
+            stages = {}
+            with count_queries(engine) as counter:
+                started = time.perf_counter()
+                for repeat in range(args.uploads):
+                    # A different transcript each time, so the analysis cache never answers.
+                    text = make_transcript(turns, seed=args.seed * 10000 + turns * 100 + repeat)
+                    upload_started = time.perf_counter()
+                    response = client.post('/auto_assign', data={
+                        'file': (io.BytesIO(text.encode()), f'meeting-{turns}-{repeat}.txt'),
+                        'fileType': 'transcript',
+                    })
+                    upload_latencies.append(time.perf_counter() - upload_started)
+                    assert response.status_code == 202, response.get_data(as_text=True)
+                    wait_for_jobs(app_module)
+                    job_latencies.append(time.perf_counter() - upload_started)
+                    job = app_module.db.session.get(app_module.Job, response.json['job_id'])
+                    assert job.stage == 'done', job.error
+                    for name, value in json.loads(job.result).get('timings', {}).items():
+                        stages.setdefault(name, []).append(value)
+                    app_module.db.session.remove()
+                elapsed = time.perf_counter() - started
+            results[f'{turns}_turns'] = {
+                'upload': latency_summary(upload_latencies),
+                'end_to_end': latency_summary(job_latencies),
+                'meetings_per_hour': round(args.uploads / elapsed * 3600),
+                'sql_per_meeting': round(counter.count / args.uploads, 1),
+                'stages_p50': {name: percentile(values, 0.5) for name, values in sorted(stages.items())},
+            }
+    return results
+
+
+def run_analysis(args):
+    app_module = load_app(args)
+    from fixtures import make_transcript
+    from task_extraction import estimate_tokens
+
+    results = {}
+    for turns in args.turns:
+        latencies = []
+        tasks = 0
+        started = time.perf_counter()
+        for repeat in range(args.uploads):
+            text = make_transcript(turns, seed=args.seed * 10000 + turns * 100 + repeat + 50)
+            call_started = time.perf_counter()
+            tasks += len(app_module.analyse_transcipt(text).get('tasks', []))
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+        results[f'{turns}_turns'] = dict(
+            latency_summary(latencies),
+            transcript_tokens=estimate_tokens(make_transcript(turns, seed=args.seed)),
+            tasks_per_call=round(tasks / args.uploads, 1),
+            calls_per_second=round(args.uploads / elapsed, 2),
+        )
+    return results
+
+
+def run_transcription(args):
+    try:
+        import whisper  # noqa: F401
+    except ImportError:
+        return {'skipped': 'openai-whisper is not installed'}
+    if shutil.which('ffmpeg') is None:
+        return {'skipped': 'ffmpeg is not installed'}
+
+    app_module = load_app(args)
+    from fixtures import write_wav
+
+    # Load the model before timing anything.
+    app_module.whisper_models.get(args.whisper_model)
+    directory = tempfile.mkdtemp(prefix='multibrain-audio-')
+    results = {}
+    for seconds in args.audio_seconds:
+        latencies = []
+        for repeat in range(args.audio_repeats):
+            path = os.path.join(directory, f'clip-{seconds}-{repeat}.wav')
+            write_wav(path, seconds, seed=repeat)
+            started = time.perf_counter()
+            app_module.transcribe_audio(path, args.whisper_model)
+            latencies.append(time.perf_counter() - started)
+        results[f'{seconds:g}s'] = dict(
+            latency_summary(latencies),
+            real_time_factor=round(percentile(latencies, 0.5) / seconds, 3),
+        )
+    return results
+
+
+RUNNERS = {
+    'lists': run_lists,
+    'upload': run_upload,
+    'analysis': run_analysis,
+    'transcription': run_transcription,
+}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def flatten(data, prefix=''):
+    for key, value in data.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            yield from flatten(value, f'{name}.')
+        elif isinstance(value, (int, float)):
+            yield name, value
+
+
+def compare(previous, current):
+    old = dict(flatten(previous['scenarios']))
+    print(f"\nCompared with {previous['meta'].get('commit')} ({previous['meta'].get('timestamp')}):")
+    print(f"{'metric':<70} {'before':>10} {'after':>10} {'change':>8}")
+    for name, value in flatten(current['scenarios']):
+        before = old.get(name)
+        if not before or '.stages_p50.' in name:
+            continue
+        change = (value - before) / before
+        better = change > 0 if name.endswith(HIGHER_IS_BETTER) else change < 0
+        flag = '' if abs(change) < 0.1 else (' better' if better else ' WORSE')
+        print(f"{name:<70} {before:>10.2f} {value:>10.2f} {change:>+8.1%}{flag}")
+
+
+def print_results(results):
+    for scenario, data in results['scenarios'].items():
+        print(f"\n[{scenario}] peak RSS {data.pop('peak_rss_mb', 0):.0f} MB")
+        for name, value in flatten(data):
+            print(f"  {name:<66} {value:>10}")
+        if 'skipped' in data:
+            print(f"  skipped: {data['skipped']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Repeatable benchmarks of the upload pipeline and list endpoints.')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--employees', type=int, default=200)
+    parser.add_argument('--meetings', type=int, default=500)
+    parser.add_argument('--tasks', type=int, default=20000)
+    parser.add_argument('--requests', type=int, default=200, help='requests per list endpoint')
+    parser.add_argument('--turns', type=int, nargs='+', default=[50, 200, 800], help='transcript lengths in speaker turns')
+    parser.add_argument('--uploads', type=int, default=10, help='uploads (and analysis calls) per transcript length')
+    parser.add_argument('--stub-tasks', type=int, default=5, help='tasks the Ollama stand-in returns per chunk')
+    parser.add_argument('--token-delay', type=float, default=0.0, help='seconds per streamed fragment from the stand-in')
+    parser.add_argument('--audio-seconds', type=float, nargs='+', default=[5, 15])
+    parser.add_argument('--audio-repeats', type=int, default=3)
+    parser.add_argument('--whisper-model', default='tiny')
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>-<commit>.json)')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    parser.add_argument('--child', choices=SCENARIOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        data = RUNNERS[args.child](args)
+        data['peak_rss_mb'] = round(peak_rss_mb(), 1)
+        print(json.dumps(data))
+        return
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'args': {key: value for key, value in vars(args).items() if key not in ('child', 'output', 'compare')},
+        },
+        'scenarios': {},
+    }
+    for scenario in args.scenarios:
+        print(f"running {scenario}...", file=sys.stderr)
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), *sys.argv[1:], '--child', scenario],
+            capture_output=True, text=True, cwd=tempfile.mkdtemp(prefix='multibrain-bench-')
+        )
+        if output.returncode != 0:
+            sys.stderr.write(output.stderr)
+            raise SystemExit(f'{scenario} failed')
+        results['scenarios'][scenario] = json.loads(output.stdout.strip().splitlines()[-1])
+
+    path = args.output or os.path.join(
+        BENCH_DIR, 'results', f"{datetime.now():%Y%m%d-%H%M%S}-{results['meta']['commit'] or 'local'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print_results(json.loads(json.dumps(results)))
+    print(f"\nSaved {path}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import whisper
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcription import SAMPLE_RATE, ChunkedTranscriber
+
+
+def build_fixture(path, minutes):
+    clip = whisper.load_audio(path)
+    gap = np.zeros(SAMPLE_RATE // 2, dtype=clip.dtype)
+    target = int(minutes * 60 * SAMPLE_RATE)
+    pieces = []
+    length = 0
+    while length < target:
+        pieces.extend([clip, gap])
+        length += len(clip) + len(gap)
+    return np.concatenate(pieces)[:target]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare single-call and chunked Whisper transcription.')
+    parser.add_argument('audio', help='speech clip used to build the fixtures (mp3/wav)')
+    parser.add_argument('--minutes', type=float, nargs='+', default=[2, 5, 10])
+    parser.add_argument('--model', default='base')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--segment-seconds', type=float, default=60)
+    args = parser.parse_args()
+
+    model = whisper.load_model(args.model, device='cpu')
+    engine = ChunkedTranscriber(
+        model_name=args.model,
+        workers=args.workers,
+        segment_seconds=args.segment_seconds,
+        min_chunked_seconds=0
+    )
+    engine.transcribe_array(np.zeros(SAMPLE_RATE, dtype=np.float32))
+
+    print(f"{'minutes':>8} {'single (s)':>11} {'chunked (s)':>12} {'speedup':>8}")
+    for minutes in args.minutes:
+        audio = build_fixture(args.audio, minutes)
+
+        start = time.perf_counter()
+        model.transcribe(audio, fp16=False)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine.transcribe_array(audio)
+        chunked = time.perf_counter() - start
+
+        print(f"{minutes:>8.1f} {single:>11.1f} {chunked:>12.1f} {single / chunked:>7.2f}x")
+
+    engine.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import math
+import random
+import struct
+import wave
+
+SPEAKERS = ['John Doe', 'Jane Smith', 'Peter Jones', 'Alice Brown', 'Robert Green']
+OPENERS = [
+    'I think we should', 'Can someone', 'Next week I will', 'Before Friday we need to',
+    'Let us make sure to', 'I can take care of it and', 'We still have to',
+]
+ACTIONS = [
+    'prepare the Q3 report', 'review the launch checklist', 'send the client feedback summary',
+    'update the budget sheet', 'draft the onboarding docs', 'schedule the design review',
+    'fix the login bug', 'follow up with the vendor', 'book the venue for the offsite',
+]
+FILLER = [
+    'That sounds reasonable.', 'I agree with that.', 'We talked about this last time.',
+    'Let me check my calendar.', 'The numbers looked good this month.', 'Any other questions?',
+]
+
+
+def make_transcript(turns, seed=0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(turns):
+        speaker = rng.choice(SPEAKERS)
+        if rng.random() < 0.3:
+            sentence = f"{rng.choice(OPENERS)} {rng.choice(ACTIONS)}."
+        else:
+            sentence = rng.choice(FILLER)
+        lines.append(f"{speaker}: {sentence} {rng.choice(FILLER)}")
+    return '\n'.join(lines)
+
+
+def pdf_escape(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path, pages, line_height=14):
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>',
+    ]
+    page_ids = []
+    for lines in pages:
+        commands = ['BT', '/F1 10 Tf', f'{line_height} TL', '40 800 Td']
+        for line in lines:
+            commands.append(f"({pdf_escape(line)}) Tj T*")
+        commands.append('ET')
+        stream = '\n'.join(commands).encode('cp1252', errors='replace')
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % len(objects)
+        )
+        page_ids.append(len(objects))
+    kids = ' '.join(f'{page_id} 0 R' for page_id in page_ids).encode()
+    objects[1] = b'<< /Type /Pages /Kids [' + kids + b'] /Count %d >>' % len(page_ids)
+
+    with open(path, 'wb') as f:
+        f.write(b'%PDF-1.4\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(f.tell())
+            f.write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+        xref = f.tell()
+        f.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+        for offset in offsets:
+            f.write(b'%010d 00000 n \n' % offset)
+        f.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+
+
+def write_docx(path, paragraphs):
+    from xml.sax.saxutils import escape
+    import zipfile
+
+    body = ''.join(f'<w:p><w:r><w:t xml:space="preserve">{escape(p)}</w:t></w:r></w:p>' for p in paragraphs)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f'<w:body>{body}</w:body></w:document>'
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '</Types>'
+    )
+    rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('[Content_Types].xml', content_types)
+        archive.writestr('_rels/.rels', rels)
+        archive.writestr('word/document.xml', document)
+
+
+def write_wav(path, seconds, seed=0, sample_rate=16000):
+    # Bursts of voiced-sounding tones separated by pauses, so silence-based
+    # segmentation has somewhere to cut; not intelligible speech.
+    rng = random.Random(seed)
+    samples = []
+    total = int(seconds * sample_rate)
+    while len(samples) < total:
+        burst = int(rng.uniform(0.4, 2.5) * sample_rate)
+        pitch = rng.uniform(90, 250)
+        for i in range(burst):
+            envelope = math.sin(math.pi * i / burst)
+            value = math.sin(2 * math.pi * pitch * i / sample_rate) + 0.3 * math.sin(6 * math.pi * pitch * i / sample_rate)
+            samples.append(int(envelope * value * 8000 + rng.gauss(0, 300)))
+        samples.extend(int(rng.gauss(0, 100)) for _ in range(int(rng.uniform(0.2, 1.0) * sample_rate)))
+    samples = [max(-32768, min(32767, sample)) for sample in samples[:total]]
+    with wave.open(path, 'wb') as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        out.writeframes(struct.pack(f'<{len(samples)}h', *samples))
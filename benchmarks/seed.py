@@ -0,0 +1,57 @@
+import random
+from datetime import date
+
+from sqlalchemy import insert
+
+from fixtures import ACTIONS, SPEAKERS, make_transcript
+
+
+def seed_database(app_module, employees=50, meetings=100, tasks=1000, transcript_turns=20, seed=0):
+    rng = random.Random(seed)
+    db = app_module.db
+    with app_module.app.app_context():
+        db.drop_all()
+        db.create_all()
+
+        db.session.execute(insert(app_module.Employee), [
+            {
+                'id': i + 1,
+                'name': f"{SPEAKERS[i % len(SPEAKERS)]} {i + 1}",
+                'role': 'Engineer',
+                'position': 'Developer',
+                'email': f"employee{i + 1}@example.com",
+            }
+            for i in range(employees)
+        ])
+        db.session.execute(insert(app_module.Meeting), [
+            {
+                'id': i + 1,
+                'file_name': f"meeting_{i + 1}.txt",
+                'transcript': make_transcript(transcript_turns, seed=i),
+            }
+            for i in range(meetings)
+        ])
+        rows = []
+        quotes = []
+        for i in range(tasks):
+            assigned = rng.random() < 0.7
+            rows.append({
+                'id': i + 1,
+                'meeting_id': rng.randint(1, meetings),
+                'description': f"{rng.choice(ACTIONS).capitalize()} #{i + 1}",
+                'ai_assignee': rng.choice(SPEAKERS),
+                'ai_assignee_confidence': round(rng.uniform(0.4, 1.0), 2),
+                'deadline': date(2024, rng.randint(1, 12), rng.randint(1, 28)),
+                'assigned_employee_id': rng.randint(1, employees) if assigned else None,
+                'status': rng.choice(['pending', 'complete']),
+            })
+            quotes.append({'task_id': i + 1, 'position': 0, 'text': f"quote {i + 1}"})
+            if len(rows) == 10000:
+                db.session.execute(insert(app_module.Task), rows)
+                db.session.execute(insert(app_module.TaskQuote), quotes)
+                rows = []
+                quotes = []
+        if rows:
+            db.session.execute(insert(app_module.Task), rows)
+            db.session.execute(insert(app_module.TaskQuote), quotes)
+        db.session.commit()
@@ -0,0 +1,98 @@
+import argparse
+import socketserver
+import threading
+import time
+from email import message_from_bytes
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply('220 multibrain-sink ready')
+        sender = None
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors='replace').strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                self.reply('250 multibrain-sink')
+            elif verb == 'MAIL':
+                sender = command
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'RCPT':
+                recipients.append(command.split(':', 1)[1].strip(' <>'))
+                self.reply('250 OK')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                data = []
+                while True:
+                    chunk = self.rfile.readline()
+                    if chunk in (b'.\r\n', b'.\n', b''):
+                        break
+                    data.append(chunk[1:] if chunk.startswith(b'..') else chunk)
+                with self.server.lock:
+                    self.server.messages.append({
+                        'sender': sender,
+                        'recipients': recipients,
+                        'message': message_from_bytes(b''.join(data)),
+                    })
+                self.reply('250 OK queued')
+            elif verb == 'RSET':
+                sender = None
+                recipients = []
+                self.reply('250 OK')
+            elif verb == 'NOOP':
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address):
+        super().__init__(address, SMTPSinkHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+
+
+def start_smtp_sink(port=0):
+    sink = SMTPSink(('127.0.0.1', port))
+    threading.Thread(target=sink.serve_forever, daemon=True).start()
+    return sink, sink.server_address[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local SMTP sink that accepts and prints every message.')
+    parser.add_argument('--port', type=int, default=1025)
+    args = parser.parse_args()
+
+    sink, port = start_smtp_sink(args.port)
+    print(f'SMTP sink listening on 127.0.0.1:{port}')
+    seen = 0
+    try:
+        while True:
+            time.sleep(1)
+            with sink.lock:
+                new = sink.messages[seen:]
+                seen = len(sink.messages)
+            for item in new:
+                print(f"To {', '.join(item['recipients'])}: {item['message']['Subject']}")
+    except KeyboardInterrupt:
+        sink.shutdown()
+
+
+if __name__ == '__main__':
+    main()
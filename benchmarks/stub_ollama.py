@@ -0,0 +1,120 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_tasks(count, seed=0):
+    rng = random.Random(seed)
+    names = ['John Doe', 'Jane Smith', 'Peter Jones', 'Alice Brown', 'Robert Green', None]
+    verbs = ['Prepare', 'Review', 'Send', 'Draft', 'Update', 'Schedule']
+    things = ['the Q3 report', 'the launch checklist', 'client feedback', 'the budget', 'onboarding docs']
+    return [
+        {
+            'id': f'T{i + 1}',
+            'assignee': rng.choice(names),
+            'assignee_confidence': round(rng.uniform(0.5, 1.0), 2),
+            'description': f'{rng.choice(verbs)} {rng.choice(things)}',
+            'deadline': rng.choice([None, 'Friday', '2024-07-01']),
+            'source_quotes': [f'quote {i + 1}']
+        }
+        for i in range(count)
+    ]
+
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    tasks_per_response = 5
+    token_delay = 0.0
+    fragment_size = 8
+    prompt_delay = 0.0
+    prompt_token_delay = 0.0
+
+    def log_message(self, format, *args):
+        pass
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            pass
+
+    def do_POST(self):
+        if self.path != '/api/generate':
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        prompt = body.get('prompt', '')
+        text = json.dumps({'tasks': make_tasks(self.tasks_per_response, seed=len(prompt))})
+        time.sleep(self.prompt_delay + self.prompt_token_delay * len(prompt.split()))
+
+        if not body.get('stream', True):
+            time.sleep(self.token_delay * (len(text) // self.fragment_size))
+            payload = json.dumps({'model': body.get('model'), 'response': text, 'done': True}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for i in range(0, len(text), self.fragment_size):
+            self._write_chunk({'model': body.get('model'), 'response': text[i:i + self.fragment_size], 'done': False})
+            time.sleep(self.token_delay)
+        self._write_chunk({
+            'model': body.get('model'),
+            'response': '',
+            'done': True,
+            'prompt_eval_count': len(prompt.split()),
+            'eval_count': len(text) // 4
+        })
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _write_chunk(self, obj):
+        line = (json.dumps(obj) + '\n').encode()
+        self.wfile.write(f'{len(line):X}\r\n'.encode() + line + b'\r\n')
+        self.wfile.flush()
+
+
+def start_stub_server(port=0, tasks_per_response=5, token_delay=0.0, prompt_delay=0.0, prompt_token_delay=0.0):
+    handler = type('ConfiguredStubOllamaHandler', (StubOllamaHandler,), {
+        'tasks_per_response': tasks_per_response,
+        'token_delay': token_delay,
+        'prompt_delay': prompt_delay,
+        'prompt_token_delay': prompt_token_delay,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for the Ollama /api/generate API.')
+    parser.add_argument('--port', type=int, default=11434)
+    parser.add_argument('--tasks', type=int, default=5)
+    parser.add_argument('--token-delay', type=float, default=0.01)
+    parser.add_argument('--prompt-delay', type=float, default=0.0)
+    parser.add_argument('--prompt-token-delay', type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.port, args.tasks, args.token_delay, args.prompt_delay, args.prompt_token_delay)
+    print(f'Stub Ollama listening on {url}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
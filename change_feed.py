@@ -0,0 +1,126 @@
+import json
+import queue
+import threading
+import time
+from collections import deque
+
+
+def format_event(event_type, data, event_id=None, retry_ms=None):
+    lines = []
+    if retry_ms is not None:
+        lines.append(f'retry: {int(retry_ms)}')
+    if event_id is not None:
+        lines.append(f'id: {event_id}')
+    lines.append(f'event: {event_type}')
+    for line in json.dumps(data, separators=(',', ':')).splitlines() or ['']:
+        lines.append(f'data: {line}')
+    return '\n'.join(lines) + '\n\n'
+
+
+class Subscription:
+    def __init__(self, feed, max_queue):
+        self.feed = feed
+        self._queue = queue.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+    def put(self, item):
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            # A client that can't keep up is told to reload instead of
+            # holding an ever-growing backlog in server memory.
+            self.overflowed = True
+
+    def get(self, timeout):
+        if self.overflowed:
+            return None
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.feed.unsubscribe(self)
+
+
+class ChangeFeed:
+    def __init__(self, history=1000, max_queue=500):
+        # The epoch makes ids from a previous server process unresumable.
+        self.epoch = format(int(time.time() * 1000), 'x')
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._sequence = 0
+        self._history = deque(maxlen=history)
+        self._subscribers = set()
+        self.published = 0
+
+    def publish(self, event_type, data):
+        with self._lock:
+            self._sequence += 1
+            item = (f'{self.epoch}-{self._sequence}', event_type, data)
+            self._history.append(item)
+            self.published += 1
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.put(item)
+        return item[0]
+
+    def subscribe(self, last_event_id=None):
+        subscription = Subscription(self, self.max_queue)
+        with self._lock:
+            backlog = self._missed_since(last_event_id)
+            if backlog is None:
+                backlog = [(self.last_id(), 'reset', {})]
+            for item in backlog:
+                subscription.put(item)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def _missed_since(self, last_event_id):
+        # None means the client missed events we no longer hold and has to
+        # reload its state.
+        if not last_event_id:
+            return []
+        epoch, _, sequence = last_event_id.partition('-')
+        try:
+            sequence = int(sequence)
+        except ValueError:
+            return None
+        oldest = self._sequence - len(self._history) + 1
+        if epoch != self.epoch or sequence > self._sequence or sequence < oldest - 1:
+            return None
+        return list(self._history)[sequence - oldest + 1:]
+
+    def last_id(self):
+        return f'{self.epoch}-{self._sequence}'
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'subscribers': len(self._subscribers),
+                'published': self.published,
+                'last_event_id': self.last_id(),
+            }
+
+    def stream(self, last_event_id=None, heartbeat_seconds=15, retry_ms=3000):
+        # Subscribing inside the generator ties the subscription to the
+        # response: it is released when the server closes the iterator.
+        subscription = self.subscribe(last_event_id)
+        try:
+            yield format_event('hello', {'last_event_id': last_event_id}, retry_ms=retry_ms)
+            while True:
+                item = subscription.get(heartbeat_seconds)
+                if subscription.overflowed:
+                    yield format_event('reset', {}, event_id=self.last_id())
+                    return
+                if item is None:
+                    yield ': keep-alive\n\n'
+                    continue
+                event_id, event_type, data = item
+                yield format_event(event_type, data, event_id=event_id)
+        finally:
+            subscription.close()
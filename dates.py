@@ -0,0 +1,114 @@
+from datetime import date, datetime, time, timedelta
+import re
+
+DATE_FORMATS = ['%Y-%m-%d', '%Y/%m/%d', '%d %B %Y', '%d %b %Y', '%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y']
+TIME_FORMATS = ['%H:%M', '%H:%M:%S', '%H:%M:%S.%f', '%I:%M %p', '%I:%M%p', '%I %p']
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+NUMBERS = {'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7, 'ten': 10}
+FRIDAY = 4
+
+
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or '').strip()
+    if not text:
+        raise ValueError('Missing date')
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f'Unrecognised date: {text}')
+
+
+def parse_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    text = str(value or '').strip()
+    if not text:
+        raise ValueError('Missing date and time')
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    date_part, _, time_part = text.rpartition(' ')
+    try:
+        return datetime.combine(parse_date(date_part), parse_time(time_part))
+    except ValueError:
+        raise ValueError(f'Unrecognised date and time: {text}')
+
+
+def parse_time(value):
+    if isinstance(value, time):
+        return value
+    text = str(value or '').strip()
+    if not text:
+        raise ValueError('Missing time')
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f'Unrecognised time: {text}')
+
+
+def end_of_month(day):
+    following = day.replace(day=28) + timedelta(days=4)
+    return following - timedelta(days=following.day)
+
+
+def parse_relative_date(value, today):
+    # Deadlines the way they are said in meetings ("by Friday", "end of next
+    # week", "in two weeks"), counted from the day they were heard.
+    text = ' '.join(re.sub(r'[^\w\s]', ' ', str(value or '').lower()).split())
+    text = re.sub(r'^(by|on|before|until|due|no later than) ', '', text)
+    text = re.sub(r'^(the )?end of (the )?', 'end of ', text)
+    if text in ('today', 'tonight', 'eod', 'end of day', 'asap', 'end of today'):
+        return today
+    if text in ('tomorrow', 'end of tomorrow'):
+        return today + timedelta(days=1)
+    if text == 'day after tomorrow':
+        return today + timedelta(days=2)
+
+    match = re.fullmatch(r'(this |next )?(' + '|'.join(WEEKDAYS) + ')', text)
+    if match:
+        days = (WEEKDAYS.index(match.group(2)) - today.weekday()) % 7
+        return today + timedelta(days=days + (7 if match.group(1) == 'next ' else 0))
+    if text in ('this week', 'end of week', 'end of this week', 'eow'):
+        return today + timedelta(days=max(0, FRIDAY - today.weekday()))
+    if text in ('next week', 'end of next week'):
+        return today + timedelta(days=FRIDAY - today.weekday() + 7)
+    if text in ('this month', 'end of month', 'end of this month', 'eom'):
+        return end_of_month(today)
+    if text in ('next month', 'end of next month'):
+        return end_of_month(end_of_month(today) + timedelta(days=1))
+
+    match = re.fullmatch(r'(in|within) (\d+|' + '|'.join(NUMBERS) + r') (day|days|week|weeks)', text)
+    if match:
+        count = int(match.group(2)) if match.group(2).isdigit() else NUMBERS[match.group(2)]
+        return today + timedelta(days=count * (7 if match.group(3).startswith('week') else 1))
+    raise ValueError(f'Unrecognised deadline: {value}')
+
+
+def split_deadline(value, today=None):
+    # Returns (date, text). Relative deadlines are only resolved when the day
+    # they are relative to is known; their wording is kept next to the date.
+    if value is None or str(value).strip() == '':
+        return None, None
+    try:
+        return parse_date(value), None
+    except ValueError:
+        text = str(value).strip()
+    if today is not None:
+        try:
+            return parse_relative_date(text, today), text
+        except ValueError:
+            pass
+    return None, text
@@ -0,0 +1,177 @@
+import codecs
+import os
+import unicodedata
+import zipfile
+from xml.etree import ElementTree
+
+TEXT_SAMPLE_BYTES = 64 * 1024
+TEXT_BLOCK_CHARS = 256 * 1024
+DOCX_BLOCK_CHARS = 64 * 1024
+
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
+class DocumentError(Exception):
+    pass
+
+
+def looks_like_cp1252(sample):
+    # Mostly-ASCII text with a few accents or smart quotes is nearly always
+    # Windows "ANSI"; statistical detection guesses poorly on it.
+    try:
+        text = sample.decode('cp1252')
+    except UnicodeDecodeError:
+        return False
+    letters = [c for c in text if c.isalpha()]
+    accented = [c for c in letters if ord(c) > 127]
+    if not letters or len(accented) > len(letters) * 0.3:
+        return False
+    return all(
+        c in '\u2018\u2019\u201c\u201d\u2013\u2014\u2026\u00a0' or 'LATIN' in unicodedata.name(c, '')
+        for c in text if ord(c) > 127
+    )
+
+
+def detect_encoding(path):
+    with open(path, 'rb') as f:
+        sample = f.read(TEXT_SAMPLE_BYTES)
+    for bom, encoding in BOMS:
+        if sample.startswith(bom):
+            return encoding
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        if len(sample) == TEXT_SAMPLE_BYTES and e.start >= len(sample) - 3:
+            return 'utf-8'
+    if looks_like_cp1252(sample):
+        return 'cp1252'
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        return 'latin-1'
+    best = from_bytes(sample).best()
+    return best.encoding if best else 'latin-1'
+
+
+def iter_text(path, block_chars=TEXT_BLOCK_CHARS):
+    encoding = detect_encoding(path)
+    carry = ''
+    with open(path, 'r', encoding=encoding, errors='replace') as f:
+        while True:
+            block = f.read(block_chars)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind('\n\n')
+            if cut == -1:
+                cut = block.rfind('\n')
+            if cut == -1 and len(block) < block_chars * 4:
+                carry = block
+                continue
+            if cut == -1:
+                cut = len(block)
+            if block[:cut].strip():
+                yield block[:cut].strip('\n')
+            carry = block[cut:]
+    if carry.strip():
+        yield carry.strip('\n')
+
+
+def iter_pdf(path):
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PdfReadError
+    except ImportError:
+        raise DocumentError('PDF transcripts need the pypdf package (pip install pypdf)')
+
+    try:
+        reader = PdfReader(path)
+        if reader.is_encrypted and not reader.decrypt(''):
+            raise DocumentError('PDF is password protected')
+        for page in reader.pages:
+            text = (page.extract_text() or '').strip()
+            if text:
+                yield text
+    except PdfReadError as e:
+        raise DocumentError(f'Unreadable PDF: {e}')
+
+
+def paragraph_text(paragraph):
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == WORD_NS + 't' and node.text:
+            parts.append(node.text)
+        elif node.tag == WORD_NS + 'tab':
+            parts.append('\t')
+        elif node.tag in (WORD_NS + 'br', WORD_NS + 'cr'):
+            parts.append('\n')
+    return ''.join(parts).strip()
+
+
+def iter_docx(path, block_chars=DOCX_BLOCK_CHARS):
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise DocumentError('Unreadable DOCX: not a zip archive')
+
+    with archive:
+        try:
+            document = archive.open('word/document.xml')
+        except KeyError:
+            raise DocumentError('Unreadable DOCX: word/document.xml is missing')
+
+        paragraphs = []
+        size = 0
+        depth = 0
+        with document:
+            try:
+                for event, node in ElementTree.iterparse(document, events=('start', 'end')):
+                    if node.tag != WORD_NS + 'p':
+                        continue
+                    if event == 'start':
+                        depth += 1
+                        continue
+                    depth -= 1
+                    if depth:
+                        continue
+                    text = paragraph_text(node)
+                    node.clear()
+                    if not text:
+                        continue
+                    paragraphs.append(text)
+                    size += len(text)
+                    if size >= block_chars:
+                        yield '\n\n'.join(paragraphs)
+                        paragraphs = []
+                        size = 0
+            except ElementTree.ParseError as e:
+                raise DocumentError(f'Unreadable DOCX: {e}')
+        if paragraphs:
+            yield '\n\n'.join(paragraphs)
+
+
+EXTRACTORS = {
+    'txt': iter_text,
+    'pdf': iter_pdf,
+    'docx': iter_docx,
+}
+
+
+def iter_document(path):
+    extension = os.path.splitext(path)[1].lstrip('.').lower()
+    extractor = EXTRACTORS.get(extension)
+    if extractor is None:
+        raise DocumentError(f'Unsupported document type: .{extension}')
+    return extractor(path)
+
+
+def read_document(path):
+    return '\n\n'.join(iter_document(path))
@@ -0,0 +1,8 @@
+# Picked up by `gunicorn app:app` when run from the repo root.
+
+
+def post_worker_init(worker):
+    # Resume unfinished jobs and start the outbox sender and reminder
+    # scheduler as soon as the worker is up, not on its first request.
+    from app import start_background_workers
+    start_background_workers()
@@ -0,0 +1,188 @@
+import hashlib
+import os
+import subprocess
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from transcription import SAMPLE_RATE
+
+INCOMING_PREFIX = '.incoming-'
+PCM_SUFFIX = '.pcm16k'
+
+
+class UploadTooLarge(RequestEntityTooLarge):
+    pass
+
+
+class IncomingUpload:
+    def __init__(self, directory, max_bytes=0):
+        fd, self.temp_path = tempfile.mkstemp(prefix=INCOMING_PREFIX, dir=directory)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.stored_path = None
+        self._file = os.fdopen(fd, 'w+b')
+        self._digest = hashlib.sha256()
+
+    def write(self, data):
+        self.size += len(data)
+        if self.max_bytes and self.size > self.max_bytes:
+            self.close()
+            raise UploadTooLarge(f'Upload exceeds the {self.max_bytes / (1024 * 1024):g} MB limit')
+        self._digest.update(data)
+        return self._file.write(data)
+
+    def hexdigest(self):
+        return self._digest.hexdigest()
+
+    def store(self, extension):
+        self._file.close()
+        path = os.path.join(self.directory, f'{self.hexdigest()}.{extension}')
+        if os.path.exists(path):
+            os.remove(self.temp_path)
+            os.utime(path)
+        else:
+            os.replace(self.temp_path, path)
+        self.stored_path = path
+        return path
+
+    def close(self):
+        self._file.close()
+        if self.stored_path is None and os.path.exists(self.temp_path):
+            os.remove(self.temp_path)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+
+def store_stream(directory, stream, extension, max_bytes=0, chunk_size=1024 * 1024):
+    upload = IncomingUpload(directory, max_bytes)
+    try:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            upload.write(chunk)
+        upload.store(extension)
+    finally:
+        upload.close()
+    return upload
+
+
+def file_extension(name):
+    return name.rsplit('.', 1)[1].lower() if '.' in name else ''
+
+
+def iter_archive(path, extensions):
+    with zipfile.ZipFile(path) as archive:
+        for info in sorted(archive.infolist(), key=lambda info: info.filename):
+            name = info.filename
+            if info.is_dir() or name.startswith('__MACOSX/') or os.path.basename(name).startswith('.'):
+                continue
+            if file_extension(name) in extensions:
+                yield name, lambda info=info: archive.open(info)
+
+
+def iter_input_files(paths, extensions):
+    # Yields (name, open) for every ingestible file in the given files,
+    # directories and .zip archives, in a stable order so reruns line up.
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+                for name in sorted(files):
+                    full_path = os.path.join(root, name)
+                    if file_extension(name) == 'zip':
+                        yield from iter_archive(full_path, extensions)
+                    elif file_extension(name) in extensions and not name.startswith('.'):
+                        yield os.path.relpath(full_path, path), lambda full_path=full_path: open(full_path, 'rb')
+        elif file_extension(path) == 'zip':
+            yield from iter_archive(path, extensions)
+        else:
+            yield os.path.basename(path), lambda path=path: open(path, 'rb')
+
+
+def pcm_path(source_path):
+    return os.path.splitext(source_path)[0] + PCM_SUFFIX
+
+
+def convert_to_pcm(source_path, target_path):
+    fd, temp_path = tempfile.mkstemp(prefix=INCOMING_PREFIX, dir=os.path.dirname(target_path) or '.')
+    os.close(fd)
+    command = [
+        'ffmpeg', '-nostdin', '-y', '-threads', '0', '-i', source_path,
+        '-f', 's16le', '-ac', '1', '-acodec', 'pcm_s16le', '-ar', str(SAMPLE_RATE), temp_path
+    ]
+    try:
+        subprocess.run(command, capture_output=True, check=True)
+    except subprocess.CalledProcessError as e:
+        os.remove(temp_path)
+        raise RuntimeError(f"Failed to decode audio: {e.stderr.decode(errors='replace')[-500:]}") from e
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    os.replace(temp_path, target_path)
+    return target_path
+
+
+def prepare_audio(source_path):
+    target = pcm_path(source_path)
+    if not os.path.exists(target):
+        convert_to_pcm(source_path, target)
+    return target
+
+
+def load_pcm(path):
+    return np.fromfile(path, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+def upload_key(path):
+    return os.path.basename(path).split('.', 1)[0]
+
+
+def cleanup_uploads(directory, max_age_seconds=0, max_bytes=0, keep=(), grace_seconds=3600, now=None):
+    now = time.time() if now is None else now
+    entries = []
+    for entry in os.scandir(directory):
+        if not entry.is_file():
+            continue
+        stat = entry.stat()
+        entries.append((stat.st_mtime, stat.st_size, entry.path, entry.name))
+
+    removed = []
+    remaining = []
+    for mtime, size, path, name in sorted(entries):
+        age = now - mtime
+        if age < grace_seconds:
+            remaining.append((mtime, size, path, name))
+        elif name.startswith(INCOMING_PREFIX):
+            removed.append((path, size))
+        elif upload_key(name) in keep:
+            remaining.append((mtime, size, path, name))
+        elif max_age_seconds and age > max_age_seconds:
+            removed.append((path, size))
+        else:
+            remaining.append((mtime, size, path, name))
+
+    if max_bytes:
+        total = sum(size for _, size, _, _ in remaining)
+        for mtime, size, path, name in remaining:
+            if total <= max_bytes:
+                break
+            if now - mtime < grace_seconds or upload_key(name) in keep:
+                continue
+            removed.append((path, size))
+            total -= size
+
+    freed = 0
+    for path, size in removed:
+        try:
+            os.remove(path)
+            freed += size
+        except FileNotFoundError:
+            pass
+    return len(removed), freed
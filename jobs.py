@@ -0,0 +1,55 @@
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+JOB_STAGES = ('queued', 'transcribing', 'analysing', 'persisting', 'emailing', 'done', 'failed')
+FINISHED_STAGES = ('done', 'failed')
+
+
+def new_job_id():
+    return uuid.uuid4().hex
+
+
+class JobQueue:
+    def __init__(self, handler, max_workers=2):
+        self.handler = handler
+        self.max_workers = max(1, int(max_workers))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='multibrain-job'
+            )
+        return self._executor
+
+    def submit(self, job_id):
+        with self._lock:
+            if job_id in self._pending:
+                return False
+            self._pending.add(job_id)
+            self._get_executor().submit(self._run, job_id)
+        return True
+
+    def _run(self, job_id):
+        try:
+            self.handler(job_id)
+        except Exception as e:
+            print(f"Error running job {job_id}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(job_id)
+
+    def depth(self):
+        with self._lock:
+            return len(self._pending)
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
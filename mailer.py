@@ -0,0 +1,109 @@
+import random
+import smtplib
+import socket
+import ssl
+import threading
+import time
+from contextlib import contextmanager
+from email.message import EmailMessage
+
+
+def build_message(from_address, to_address, subject, body):
+    msg = EmailMessage()
+    msg['From'] = from_address
+    msg['To'] = to_address
+    msg['Subject'] = subject
+    msg.set_content(body)
+    return msg
+
+
+class SMTPTransport:
+    def __init__(self, host, port, username=None, password=None, use_ssl=True, starttls=False, timeout=30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.starttls = starttls
+        self.timeout = timeout
+
+    @contextmanager
+    def session(self):
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, context=ssl.create_default_context(), timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                server.starttls(context=ssl.create_default_context())
+            if self.username:
+                server.login(self.username, self.password)
+            yield server
+        finally:
+            try:
+                server.quit()
+            except (smtplib.SMTPException, OSError):
+                server.close()
+
+
+def is_transient(error):
+    if isinstance(error, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    # Unsupported extensions, no usable auth method and certificate
+    # failures are configuration problems; retrying won't fix them.
+    if isinstance(error, (smtplib.SMTPException, ssl.SSLCertVerificationError)):
+        return False
+    # DNS failures, unreachable hosts, timeouts and TLS handshakes cut short
+    # are network trouble that usually passes.
+    return isinstance(error, OSError)
+
+
+def backoff_delay(attempts, base=30, maximum=3600):
+    delay = min(maximum, base * (2 ** max(0, attempts - 1)))
+    return delay * random.uniform(0.8, 1.2)
+
+
+class RateLimiter:
+    def __init__(self, rate_per_second):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0
+        self._next = 0.0
+
+    def wait(self):
+        now = time.monotonic()
+        if now < self._next:
+            time.sleep(self._next - now)
+            now = self._next
+        self._next = now + self.interval
+
+
+class OutboxWorker:
+    def __init__(self, drain, poll_seconds=30):
+        self.drain = drain
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='outbox-sender', daemon=True)
+                self._thread.start()
+
+    def wake(self):
+        self.start()
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                while self.drain():
+                    pass
+            except Exception as e:
+                print("Error draining email outbox:", e)
+            self._wake.wait(self.poll_seconds)
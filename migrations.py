@@ -0,0 +1,338 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+from sqlalchemy import Date, DateTime, Time, bindparam, create_engine, event, inspect, text
+
+from dates import parse_date, parse_time, split_deadline
+from reminders import ReminderSchedule
+import search_index
+
+
+class MigrationError(Exception):
+    pass
+
+
+def migration_engine(url):
+    engine = create_engine(url)
+    if engine.dialect.name == 'sqlite':
+        # pysqlite only opens transactions before DML; take over BEGIN so that
+        # ALTER/CREATE/DROP statements roll back with the data changes.
+        @event.listens_for(engine, 'connect')
+        def disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, 'begin')
+        def begin_sqlite_transaction(connection):
+            connection.exec_driver_sql('BEGIN IMMEDIATE')
+    return engine
+
+
+def table_names(connection):
+    return set(inspect(connection).get_table_names())
+
+
+def column_names(connection, table):
+    return {column['name'] for column in inspect(connection).get_columns(table)}
+
+
+def add_late_columns(connection):
+    tables = table_names(connection)
+    if 'jobs' in tables and 'model_size' not in column_names(connection, 'jobs'):
+        connection.execute(text('ALTER TABLE jobs ADD COLUMN model_size VARCHAR(20)'))
+
+
+def add_indexes(connection):
+    tables = table_names(connection)
+    statements = {
+        'tasks': [
+            'CREATE INDEX IF NOT EXISTS ix_tasks_meeting_id ON tasks (meeting_id)',
+            'CREATE INDEX IF NOT EXISTS ix_tasks_status ON tasks (status)',
+            'CREATE INDEX IF NOT EXISTS ix_tasks_assigned_employee_id_status ON tasks (assigned_employee_id, status)',
+        ],
+        'outbox_emails': [
+            'CREATE INDEX IF NOT EXISTS ix_outbox_emails_status_next_attempt_at ON outbox_emails (status, next_attempt_at)',
+        ],
+    }
+    for table, table_statements in statements.items():
+        if table in tables:
+            for statement in table_statements:
+                connection.execute(text(statement))
+
+
+def move_source_quotes(connection):
+    connection.execute(text(
+        'CREATE TABLE IF NOT EXISTS task_quotes ('
+        'id INTEGER NOT NULL PRIMARY KEY, '
+        'task_id INTEGER NOT NULL REFERENCES tasks (id), '
+        'position INTEGER NOT NULL, '
+        'text TEXT NOT NULL)'
+    ))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_task_quotes_task_id ON task_quotes (task_id)'))
+
+    if 'source_quotes' not in column_names(connection, 'tasks'):
+        return
+
+    rows = connection.execute(text(
+        "SELECT id, source_quotes FROM tasks WHERE source_quotes IS NOT NULL AND source_quotes != ''"
+    ))
+    quotes = []
+    for task_id, raw in rows:
+        try:
+            values = json.loads(raw)
+        except ValueError:
+            values = [raw]
+        if not isinstance(values, list):
+            values = [values]
+        for position, value in enumerate(values):
+            if value is None:
+                continue
+            quotes.append({
+                'task_id': task_id,
+                'position': position,
+                'text': value if isinstance(value, str) else json.dumps(value),
+            })
+    if quotes:
+        connection.execute(
+            text('INSERT INTO task_quotes (task_id, position, text) VALUES (:task_id, :position, :text)'),
+            quotes
+        )
+    connection.execute(text('ALTER TABLE tasks DROP COLUMN source_quotes'))
+
+
+def convert_task_deadlines(connection):
+    if 'deadline_text' in column_names(connection, 'tasks'):
+        return
+
+    connection.execute(text('DROP INDEX IF EXISTS ix_tasks_deadline'))
+    connection.execute(text('ALTER TABLE tasks RENAME COLUMN deadline TO deadline_text'))
+    connection.execute(text('ALTER TABLE tasks ADD COLUMN deadline DATE'))
+
+    updates = []
+    for task_id, raw in connection.execute(text('SELECT id, deadline_text FROM tasks WHERE deadline_text IS NOT NULL')):
+        deadline, deadline_text = split_deadline(raw)
+        updates.append({'task_id': task_id, 'deadline': deadline, 'deadline_text': deadline_text})
+    if updates:
+        connection.execute(
+            text(
+                'UPDATE tasks SET deadline = :deadline, deadline_text = :deadline_text WHERE id = :task_id'
+            ).bindparams(bindparam('deadline', type_=Date)),
+            updates
+        )
+    connection.execute(text('CREATE INDEX ix_tasks_deadline ON tasks (deadline)'))
+
+
+def convert_event_dates(connection):
+    if 'events' not in table_names(connection):
+        return
+
+    rows = []
+    unreadable = []
+    for event_id, title, raw_date, raw_time, category, description in connection.execute(text(
+        'SELECT id, title, date, time, category, description FROM events'
+    )):
+        try:
+            rows.append({
+                'id': event_id,
+                'title': title,
+                'date': parse_date(raw_date),
+                'time': parse_time(raw_time),
+                'category': category or 'meeting',
+                'description': description,
+            })
+        except ValueError:
+            unreadable.append(f'{event_id} ({raw_date!r} {raw_time!r})')
+    if unreadable:
+        raise MigrationError('Events with unreadable date/time, fix them and restart: ' + ', '.join(unreadable))
+
+    connection.execute(text(
+        'CREATE TABLE events_new ('
+        'id INTEGER NOT NULL PRIMARY KEY, '
+        'title VARCHAR(255) NOT NULL, '
+        'date DATE NOT NULL, '
+        'time TIME NOT NULL, '
+        'category VARCHAR(20) NOT NULL, '
+        'description TEXT)'
+    ))
+    if rows:
+        connection.execute(
+            text(
+                'INSERT INTO events_new (id, title, date, time, category, description) '
+                'VALUES (:id, :title, :date, :time, :category, :description)'
+            ).bindparams(bindparam('date', type_=Date), bindparam('time', type_=Time)),
+            rows
+        )
+    connection.execute(text('DROP TABLE events'))
+    connection.execute(text('ALTER TABLE events_new RENAME TO events'))
+    connection.execute(text('CREATE INDEX ix_events_date_time ON events (date, time)'))
+
+
+def convert_dates(connection):
+    if 'tasks' in table_names(connection):
+        convert_task_deadlines(connection)
+    convert_event_dates(connection)
+
+
+def add_job_content_hash(connection):
+    if 'jobs' not in table_names(connection) or 'content_hash' in column_names(connection, 'jobs'):
+        return
+    connection.execute(text('ALTER TABLE jobs ADD COLUMN content_hash VARCHAR(64)'))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_jobs_content_hash ON jobs (content_hash)'))
+
+
+def add_job_batch_id(connection):
+    if 'jobs' not in table_names(connection) or 'batch_id' in column_names(connection, 'jobs'):
+        return
+    connection.execute(text('ALTER TABLE jobs ADD COLUMN batch_id VARCHAR(32)'))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_jobs_batch_id ON jobs (batch_id)'))
+
+
+def add_search_index(connection):
+    if connection.dialect.name != 'sqlite' or 'tasks' not in table_names(connection):
+        return
+    search_index.install(connection)
+    search_index.rebuild(connection)
+
+
+def add_meeting_analysis_fingerprint(connection):
+    if 'meetings' not in table_names(connection) or 'analysis_fingerprint' in column_names(connection, 'meetings'):
+        return
+    connection.execute(text('ALTER TABLE meetings ADD COLUMN analysis_fingerprint VARCHAR(64)'))
+    connection.execute(text(
+        'CREATE INDEX IF NOT EXISTS ix_meetings_analysis_fingerprint ON meetings (analysis_fingerprint)'
+    ))
+
+
+def add_task_next_reminder_at(connection):
+    if 'tasks' not in table_names(connection) or 'next_reminder_at' in column_names(connection, 'tasks'):
+        return
+    connection.execute(text('ALTER TABLE tasks ADD COLUMN next_reminder_at DATETIME'))
+    connection.execute(text('CREATE INDEX IF NOT EXISTS ix_tasks_next_reminder_at ON tasks (next_reminder_at)'))
+    # Scheduled with the default settings; `flask reminders --reschedule`
+    # applies others.
+    schedule = ReminderSchedule()
+    now = datetime.now()
+    updates = []
+    for task_id, deadline in connection.execute(
+        text("SELECT id, deadline FROM tasks WHERE status = 'pending' AND deadline IS NOT NULL")
+    ):
+        next_reminder_at = schedule.next_after(parse_date(deadline), now)
+        if next_reminder_at:
+            updates.append({'task_id': task_id, 'next_reminder_at': next_reminder_at})
+    if updates:
+        connection.execute(
+            text('UPDATE tasks SET next_reminder_at = :next_reminder_at WHERE id = :task_id')
+            .bindparams(bindparam('next_reminder_at', type_=DateTime)),
+            updates
+        )
+
+
+def convert_event_datetimes(connection):
+    if 'events' not in table_names(connection) or 'starts_at' in column_names(connection, 'events'):
+        return
+
+    # Old events had no end; give them the length new events default to.
+    duration = timedelta(minutes=int(os.getenv('EVENT_DEFAULT_MINUTES', '60')))
+    rows = []
+    for event_id, title, raw_date, raw_time, category, description in connection.execute(text(
+        'SELECT id, title, date, time, category, description FROM events'
+    )):
+        starts_at = datetime.combine(parse_date(raw_date), parse_time(raw_time))
+        rows.append({
+            'id': event_id,
+            'title': title,
+            'starts_at': starts_at,
+            'ends_at': starts_at + duration,
+            'category': category,
+            'description': description,
+        })
+
+    connection.execute(text(
+        'CREATE TABLE events_new ('
+        'id INTEGER NOT NULL PRIMARY KEY, '
+        'title VARCHAR(255) NOT NULL, '
+        'starts_at DATETIME NOT NULL, '
+        'ends_at DATETIME NOT NULL, '
+        'category VARCHAR(20) NOT NULL, '
+        'description TEXT, '
+        'recurrence VARCHAR(10), '
+        'recurrence_interval INTEGER NOT NULL DEFAULT 1, '
+        'recurrence_until DATETIME, '
+        'meeting_id INTEGER REFERENCES meetings (id))'
+    ))
+    if rows:
+        connection.execute(
+            text(
+                'INSERT INTO events_new (id, title, starts_at, ends_at, category, description) '
+                'VALUES (:id, :title, :starts_at, :ends_at, :category, :description)'
+            ).bindparams(bindparam('starts_at', type_=DateTime), bindparam('ends_at', type_=DateTime)),
+            rows
+        )
+    connection.execute(text('DROP TABLE events'))
+    connection.execute(text('ALTER TABLE events_new RENAME TO events'))
+    connection.execute(text('CREATE INDEX ix_events_recurrence_starts_at ON events (recurrence, starts_at)'))
+    connection.execute(text('CREATE INDEX ix_events_meeting_id ON events (meeting_id)'))
+
+
+def add_job_event_options(connection):
+    if 'jobs' not in table_names(connection) or 'event_options' in column_names(connection, 'jobs'):
+        return
+    connection.execute(text('ALTER TABLE jobs ADD COLUMN event_options TEXT'))
+
+
+MIGRATIONS = [
+    (1, 'add_late_columns', add_late_columns),
+    (2, 'add_indexes', add_indexes),
+    (3, 'move_source_quotes', move_source_quotes),
+    (4, 'convert_dates', convert_dates),
+    (5, 'add_job_content_hash', add_job_content_hash),
+    (6, 'add_job_batch_id', add_job_batch_id),
+    (7, 'add_search_index', add_search_index),
+    (8, 'add_meeting_analysis_fingerprint', add_meeting_analysis_fingerprint),
+    (9, 'add_task_next_reminder_at', add_task_next_reminder_at),
+    (10, 'convert_event_datetimes', convert_event_datetimes),
+    (11, 'add_job_event_options', add_job_event_options),
+]
+
+
+def record_version(connection, version, name):
+    connection.execute(
+        text('INSERT INTO schema_migrations (version, name, applied_at) VALUES (:version, :name, :applied_at)'),
+        {'version': version, 'name': name, 'applied_at': datetime.utcnow().isoformat(' ')}
+    )
+
+
+def run_migrations(url, create_schema, migrations=MIGRATIONS):
+    engine = migration_engine(url)
+    try:
+        with engine.begin() as connection:
+            connection.execute(text(
+                'CREATE TABLE IF NOT EXISTS schema_migrations ('
+                'version INTEGER NOT NULL PRIMARY KEY, '
+                'name VARCHAR(100) NOT NULL, '
+                'applied_at VARCHAR(32) NOT NULL)'
+            ))
+            applied = {row[0] for row in connection.execute(text('SELECT version FROM schema_migrations'))}
+            fresh = not applied and 'tasks' not in table_names(connection)
+
+        applied_now = []
+        if fresh:
+            create_schema()
+            with engine.begin() as connection:
+                for version, name, _ in migrations:
+                    record_version(connection, version, name)
+            return applied_now
+
+        for version, name, upgrade in migrations:
+            if version in applied:
+                continue
+            print(f"Applying migration {version:04d}_{name}")
+            with engine.begin() as connection:
+                upgrade(connection)
+                record_version(connection, version, name)
+            applied_now.append(name)
+
+        create_schema()
+        return applied_now
+    finally:
+        engine.dispose()
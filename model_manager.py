@@ -0,0 +1,88 @@
+import threading
+import time
+
+WHISPER_MODEL_SIZES = ('tiny', 'base', 'small')
+
+
+class WhisperModelManager:
+    def __init__(self, default_size='base', device='cpu', idle_timeout=0):
+        if default_size not in WHISPER_MODEL_SIZES:
+            raise ValueError(f"Unsupported Whisper model size '{default_size}'")
+        self.default_size = default_size
+        self.device = device
+        self.idle_timeout = idle_timeout
+        self._models = {}
+        self._last_used = {}
+        self._pinned = set()
+        self._idle_closers = []
+        self._lock = threading.Lock()
+        self._reaper = None
+
+    def resolve_size(self, size=None):
+        size = size or self.default_size
+        if size not in WHISPER_MODEL_SIZES:
+            raise ValueError(f"Unsupported Whisper model size '{size}'")
+        return size
+
+    def get(self, size=None):
+        size = self.resolve_size(size)
+        with self._lock:
+            model = self._models.get(size)
+            if model is None:
+                import whisper
+                started = time.perf_counter()
+                model = whisper.load_model(size, device=self.device)
+                print(f"Loaded Whisper '{size}' model in {time.perf_counter() - started:.1f}s")
+                self._models[size] = model
+            self._last_used[size] = time.monotonic()
+            self._start_reaper()
+        return model
+
+    def preload(self, sizes=None):
+        for size in sizes or [self.default_size]:
+            self.get(size)
+            with self._lock:
+                self._pinned.add(size)
+
+    def unload(self, size=None):
+        size = self.resolve_size(size)
+        with self._lock:
+            self._models.pop(size, None)
+            self._last_used.pop(size, None)
+            self._pinned.discard(size)
+
+    def register_idle_closer(self, close_if_idle):
+        # Other holders of Whisper copies, such as transcription worker
+        # pools; the reaper calls close_if_idle(idle_timeout) on each sweep.
+        with self._lock:
+            self._idle_closers.append(close_if_idle)
+            self._start_reaper()
+
+    def loaded_sizes(self):
+        with self._lock:
+            return sorted(self._models)
+
+    def _start_reaper(self):
+        if self.idle_timeout <= 0 or self._reaper is not None:
+            return
+        self._reaper = threading.Thread(target=self._reap_idle, name='whisper-reaper', daemon=True)
+        self._reaper.start()
+
+    def _reap_idle(self):
+        while True:
+            time.sleep(min(self.idle_timeout, 30))
+            now = time.monotonic()
+            with self._lock:
+                for size in list(self._models):
+                    if size in self._pinned:
+                        continue
+                    if now - self._last_used.get(size, now) >= self.idle_timeout:
+                        print(f"Unloading idle Whisper '{size}' model")
+                        del self._models[size]
+                        del self._last_used[size]
+                closers = list(self._idle_closers)
+            for close_if_idle in closers:
+                try:
+                    close_if_idle(self.idle_timeout)
+                except Exception as e:
+                    print("Error releasing idle Whisper workers:", e)
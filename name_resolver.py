@@ -0,0 +1,234 @@
+import re
+import threading
+import unicodedata
+from collections import Counter, defaultdict, namedtuple
+from functools import lru_cache
+
+HONORIFICS = {'mr', 'mrs', 'ms', 'miss', 'mx', 'dr', 'prof', 'sir'}
+MAX_FUZZY_CANDIDATES = 50
+MIN_WORD_SIMILARITY = 0.6
+
+Match = namedtuple('Match', ['employee_id', 'confidence', 'method'])
+NO_MATCH = Match(None, 0.0, None)
+
+
+def normalize_name(text):
+    text = unicodedata.normalize('NFKD', str(text or ''))
+    text = ''.join(c for c in text if not unicodedata.combining(c)).lower()
+    text = re.sub(r'\(.*?\)', ' ', text)
+    text = re.sub(r"['’]", '', text)
+    words = [word for word in re.findall(r'[a-z0-9]+', text) if word not in HONORIFICS]
+    return ' '.join(words)
+
+
+def trigrams(name):
+    padded = f'  {name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@lru_cache(maxsize=65536)
+def bigrams(word):
+    padded = f' {word} '
+    return frozenset(padded[i:i + 2] for i in range(len(padded) - 1))
+
+
+def edit_distance(a, b, limit):
+    # Levenshtein distance that also counts swapped neighbours ("Smtih") as
+    # one edit, which is the typo transcripts and LLM output make most.
+    # Gives up with limit + 1 once every cell in a row is past the limit.
+    before, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb and before[j - 2] + 1 < cost:
+                cost = before[j - 2] + 1
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def word_similarity(a, b):
+    if a == b:
+        return 1.0
+    longest = max(len(a), len(b))
+    limit = int(longest * (1 - MIN_WORD_SIMILARITY))
+    # Words with no letter pair in common are never a typo of each other.
+    if abs(len(a) - len(b)) > limit or not bigrams(a) & bigrams(b):
+        return 0.0
+    distance = edit_distance(a, b, limit)
+    return 0.0 if distance > limit else 1 - distance / longest
+
+
+class EmployeeResolver:
+    def __init__(self, min_similarity=0.6, min_margin=0.05):
+        self.min_similarity = min_similarity
+        self.min_margin = min_margin
+        self.version = None
+        self.refresh_lock = threading.Lock()
+        self._lock = threading.RLock()
+        self._keys = {}
+        self._exact = defaultdict(set)
+        self._compact = defaultdict(set)
+        self._short = defaultdict(set)
+        self._first = defaultdict(set)
+        self._last = defaultdict(set)
+        self._words = defaultdict(set)
+        self._trigrams = defaultdict(set)
+        self._stale = set()
+        self._local_changes = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _index_keys(self, name, email, aliases):
+        names = {normalize_name(value) for value in [name] + list(aliases or [])}
+        names.discard('')
+        keys = []
+        for full in names:
+            words = full.split()
+            keys.append((self._exact, full))
+            keys.append((self._compact, full.replace(' ', '')))
+            keys.append((self._first, words[0]))
+            keys.extend((self._words, word) for word in words)
+            if len(words) > 1:
+                keys.append((self._last, words[-1]))
+                keys.append((self._short, f'{words[0][0]} {words[-1]}'))
+                keys.append((self._short, f'{words[0]} {words[-1][0]}'))
+        if email and '@' in email:
+            local = email.split('@', 1)[0].split('+', 1)[0]
+            email_name = normalize_name(local)
+            if email_name:
+                keys.append((self._compact, email_name.replace(' ', '')))
+                if ' ' in email_name:
+                    keys.append((self._exact, email_name))
+        return names, keys
+
+    def upsert(self, employee_id, name, email=None, aliases=()):
+        with self._lock:
+            self._remove(employee_id)
+            names, keys = self._index_keys(name, email, aliases)
+            for index, key in keys:
+                index[key].add(employee_id)
+            name_trigrams = [trigrams(full) for full in names]
+            for grams in name_trigrams:
+                for gram in grams:
+                    self._trigrams[gram].add(employee_id)
+            self._keys[employee_id] = (keys, name_trigrams, [full.split() for full in names])
+
+    def _remove(self, employee_id):
+        entry = self._keys.pop(employee_id, None)
+        if entry is None:
+            return
+        keys, name_trigrams, _ = entry
+        for index, key in keys:
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(employee_id)
+                if not ids:
+                    del index[key]
+        for grams in name_trigrams:
+            for gram in grams:
+                ids = self._trigrams.get(gram)
+                if ids is not None:
+                    ids.discard(employee_id)
+                    if not ids:
+                        del self._trigrams[gram]
+
+    def remove(self, employee_id):
+        with self._lock:
+            self._remove(employee_id)
+
+    def replace_all(self, rows):
+        with self._lock:
+            for employee_id in list(self._keys):
+                self._remove(employee_id)
+            for employee_id, name, email, aliases in rows:
+                self.upsert(employee_id, name, email, aliases)
+
+    def mark_stale(self, employee_ids):
+        with self._lock:
+            self._stale.update(employee_ids)
+            self._local_changes += 1
+
+    def take_stale(self):
+        # Returns the employees changed by this process since the last call
+        # and how many commits changed them.
+        with self._lock:
+            stale, changes = self._stale, self._local_changes
+            self._stale, self._local_changes = set(), 0
+            return stale, changes
+
+    def resolve(self, text):
+        name = normalize_name(text)
+        if not name:
+            return NO_MATCH
+        words = name.split()
+        with self._lock:
+            lookups = [(self._exact, name, 1.0, 'exact'), (self._compact, name.replace(' ', ''), 0.95, 'email')]
+            if len(words) == 2 and min(len(words[0]), len(words[1])) == 1:
+                lookups.append((self._short, name, 0.9, 'initial'))
+            if len(words) == 1:
+                lookups.append((self._first, name, 0.85, 'first_name'))
+                lookups.append((self._last, name, 0.8, 'last_name'))
+            for index, key, confidence, method in lookups:
+                ids = index.get(key)
+                if ids and len(ids) == 1:
+                    return Match(next(iter(ids)), confidence, method)
+                if ids:
+                    # Two "John"s: a guess would assign work to the wrong one.
+                    return NO_MATCH
+            return self._fuzzy(name, words)
+
+    def _candidates(self, query, words):
+        # A misspelt name usually still has one word right ("Robert Smtih"),
+        # which narrows the search far more than shared trigrams do.
+        candidates = set()
+        for word in words:
+            candidates.update(self._words.get(word, ()))
+        if candidates:
+            return candidates
+        shared = Counter()
+        for gram in query:
+            for employee_id in self._trigrams.get(gram, ()):
+                shared[employee_id] += 1
+        return [employee_id for employee_id, _ in shared.most_common(MAX_FUZZY_CANDIDATES)]
+
+    def _fuzzy(self, name, words):
+        # Names are compared word by word, so "Robert Smtih" scores on how
+        # close "smtih" is to "smith" rather than being swamped by "robert".
+        similarities = {}
+
+        def similarity(query_word, name_words):
+            if query_word in name_words:
+                return 1.0
+            best = 0.0
+            for word in name_words:
+                key = (query_word, word)
+                if key not in similarities:
+                    similarities[key] = word_similarity(query_word, word)
+                best = max(best, similarities[key])
+            return best
+
+        scores = []
+        for employee_id in self._candidates(trigrams(name), words):
+            best = max(
+                sum(similarity(query_word, name_words) for query_word in words)
+                / max(len(words), len(name_words))
+                for name_words in self._keys[employee_id][2]
+            )
+            scores.append((best, employee_id))
+        if not scores:
+            return NO_MATCH
+        scores.sort(reverse=True)
+        best, employee_id = scores[0]
+        runner_up = scores[1][0] if len(scores) > 1 else 0.0
+        if best < self.min_similarity or best - runner_up < self.min_margin:
+            return NO_MATCH
+        return Match(employee_id, round(best * 0.9, 3), 'fuzzy')
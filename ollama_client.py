@@ -0,0 +1,127 @@
+import json
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class TaskStreamParser:
+    def __init__(self):
+        self.text = ''
+        self.tasks = []
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._start = None
+
+    def feed(self, fragment):
+        completed = []
+        offset = len(self.text)
+        self.text += fragment
+
+        for i, ch in enumerate(fragment, start=offset):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                if self._stack:
+                    self._in_string = True
+            elif ch in '{[':
+                if ch == '{' and self._is_task_position():
+                    self._start = i
+                self._stack.append(ch)
+            elif ch in '}]' and self._stack:
+                self._stack.pop()
+                if ch == '}' and self._start is not None and self._is_task_position():
+                    try:
+                        task = json.loads(self.text[self._start:i + 1])
+                    except json.JSONDecodeError:
+                        task = None
+                    if isinstance(task, dict):
+                        self.tasks.append(task)
+                        completed.append(task)
+                    self._start = None
+
+        return completed
+
+    def _is_task_position(self):
+        return self._stack == ['{', '['] or self._stack == ['[']
+
+    def result(self):
+        try:
+            parsed = json.loads(self.text)
+        except json.JSONDecodeError:
+            if not self.tasks:
+                raise ValueError("Model did not return valid JSON")
+            return {'tasks': list(self.tasks)}
+        if isinstance(parsed, list):
+            parsed = {'tasks': parsed}
+        return parsed
+
+
+class OllamaClient:
+    def __init__(self, base_url='http://localhost:11434', model='llama2:latest', timeout=120, pool_size=4, on_stats=None):
+        self.base_url = base_url.rstrip('/')
+        self.model = model
+        self.timeout = timeout
+        self.on_stats = on_stats
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def stream_generate(self, prompt, stats=None):
+        with self.session.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": True
+            },
+            stream=True,
+            timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if chunk.get('error'):
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                yield chunk.get('response', '')
+                if chunk.get('done'):
+                    if stats is not None:
+                        # Ollama reports token counts only on the final chunk.
+                        stats['prompt_tokens'] = chunk.get('prompt_eval_count')
+                        stats['response_tokens'] = chunk.get('eval_count')
+                    break
+
+    def extract_tasks(self, prompt, on_task=None):
+        parser = TaskStreamParser()
+        stats = {'first_token_seconds': None, 'parse_seconds': 0.0}
+        started = time.perf_counter()
+        for fragment in self.stream_generate(prompt, stats):
+            if stats['first_token_seconds'] is None:
+                stats['first_token_seconds'] = time.perf_counter() - started
+            parse_started = time.perf_counter()
+            tasks = parser.feed(fragment)
+            stats['parse_seconds'] += time.perf_counter() - parse_started
+            for task in tasks:
+                if on_task is not None:
+                    on_task(task)
+        parse_started = time.perf_counter()
+        result = parser.result()
+        stats['parse_seconds'] += time.perf_counter() - parse_started
+        stats['seconds'] = time.perf_counter() - started
+        if self.on_stats is not None:
+            self.on_stats(stats)
+        return result
+
+    def close(self):
+        self.session.close()
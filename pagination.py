@@ -0,0 +1,83 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time
+
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(values):
+    raw = json.dumps(list(values), separators=(',', ':'), default=lambda value: value.isoformat()).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor, size):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, binascii.Error, UnicodeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError('Invalid cursor')
+    return values
+
+
+def cursor_value(column, value):
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is not None and python_type in (date, datetime, time):
+        try:
+            return python_type.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise ValueError('Invalid cursor')
+    return value
+
+
+def parse_limit(value, default=DEFAULT_PAGE_SIZE):
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        raise ValueError('limit must be an integer')
+    if limit < 1:
+        raise ValueError('limit must be positive')
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def parse_int(args, name):
+    value = args.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+
+
+def wants_page(args):
+    return 'limit' in args or 'after' in args
+
+
+def keyset_page(query, order_columns, key, after=None, limit=DEFAULT_PAGE_SIZE):
+    if after:
+        values = [
+            cursor_value(column, value)
+            for column, value in zip(order_columns, decode_cursor(after, len(order_columns)))
+        ]
+        if len(order_columns) == 1:
+            query = query.filter(order_columns[0] > values[0])
+        else:
+            query = query.filter(tuple_(*order_columns) > tuple_(*values))
+
+    rows = query.order_by(*order_columns).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(key(rows[-1]))
+    return rows, next_cursor
@@ -0,0 +1,57 @@
+from calendar import monthrange
+from datetime import timedelta
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+STEP_DAYS = {'daily': 1, 'weekly': 7}
+
+
+def add_months(moment, months):
+    # The 31st of a shorter month falls on its last day.
+    index = moment.month - 1 + months
+    year, month = moment.year + index // 12, index % 12 + 1
+    return moment.replace(year=year, month=month, day=min(moment.day, monthrange(year, month)[1]))
+
+
+def nth_start(starts_at, frequency, interval, n):
+    # Always counted from the first occurrence, so a monthly series on the
+    # 31st is back on the 31st after a short month.
+    if frequency == 'monthly':
+        return add_months(starts_at, n * interval)
+    return starts_at + timedelta(days=STEP_DAYS[frequency] * interval * n)
+
+
+def first_index(starts_at, duration, frequency, interval, after):
+    # The first occurrence still going on at `after`, found arithmetically
+    # rather than by walking the series from its start.
+    earliest = after - duration
+    if earliest < starts_at:
+        return 0
+    if frequency == 'monthly':
+        months = (earliest.year - starts_at.year) * 12 + earliest.month - starts_at.month
+        n = max(0, months // interval - 1)
+    else:
+        n = (earliest - starts_at) // timedelta(days=STEP_DAYS[frequency] * interval)
+    while nth_start(starts_at, frequency, interval, n) + duration <= after:
+        n += 1
+    return n
+
+
+def occurrences(starts_at, ends_at, frequency, interval, until=None, after=None, before=None, start_from=None):
+    # Lazily yields (start, end) for the occurrences that overlap
+    # [after, before) and start no earlier than start_from.
+    duration = ends_at - starts_at
+    n = 0
+    if after is not None:
+        n = first_index(starts_at, duration, frequency, interval, after)
+    if start_from is not None:
+        n = max(n, first_index(starts_at, timedelta(0), frequency, interval, start_from - timedelta(microseconds=1)))
+    while True:
+        start = nth_start(starts_at, frequency, interval, n)
+        if (until is not None and start > until) or (before is not None and start >= before):
+            return
+        yield start, start + duration
+        n += 1
+
+
+def last_start(starts_at, frequency, interval, count):
+    return nth_start(starts_at, frequency, interval, count - 1)
@@ -0,0 +1,110 @@
+import threading
+from datetime import datetime, time, timedelta
+
+
+class ReminderSchedule:
+    # Every reminder is sent at the same hour, so all of one person's tasks
+    # that come due on a day land in the same digest.
+    def __init__(self, lead_days=(3, 1, 0), hour=9, overdue_every=1, overdue_days=14):
+        self.lead_days = sorted({int(days) for days in lead_days if int(days) >= 0}, reverse=True)
+        self.hour = hour
+        self.overdue_every = overdue_every
+        self.overdue_days = overdue_days
+
+    def slots(self, deadline):
+        at = time(self.hour)
+        for days in self.lead_days:
+            yield datetime.combine(deadline - timedelta(days=days), at)
+        if self.overdue_every > 0:
+            for days in range(self.overdue_every, self.overdue_days + 1, self.overdue_every):
+                yield datetime.combine(deadline + timedelta(days=days), at)
+
+    def next_after(self, deadline, moment):
+        if deadline is None:
+            return None
+        for slot in self.slots(deadline):
+            if slot > moment:
+                return slot
+        return None
+
+
+def parse_lead_days(value):
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def due_label(deadline, today):
+    days = (deadline - today).days
+    if days < 0:
+        return f"overdue by {-days} day{'s' if days < -1 else ''}"
+    if days == 0:
+        return 'due today'
+    if days == 1:
+        return 'due tomorrow'
+    return f'due in {days} days'
+
+
+def build_digest(name, tasks, today):
+    # tasks: (description, deadline) pairs, one message for all of them.
+    tasks = sorted(tasks, key=lambda task: task[1])
+    overdue = sum(1 for _, deadline in tasks if deadline < today)
+    if overdue:
+        subject = f"{overdue} overdue task{'s' if overdue > 1 else ''}"
+        if len(tasks) > overdue:
+            subject += f", {len(tasks) - overdue} due soon"
+    else:
+        subject = f"{len(tasks)} task{'s' if len(tasks) > 1 else ''} due soon"
+
+    lines = [
+        f"Hi {name},",
+        "",
+        "Here are your tasks with deadlines coming up or passed:",
+        "",
+    ]
+    for description, deadline in tasks:
+        lines.append(f"- {description} ({due_label(deadline, today)}, {deadline.isoformat()})")
+    lines.append("")
+    lines.append("Tasks marked complete will drop out of these reminders.")
+    lines.append("")
+    lines.append("Best,")
+    lines.append("Your Meeting Assistant")
+    return f"Task reminder: {subject}", "\n".join(lines)
+
+
+class ReminderScheduler:
+    def __init__(self, tick, next_due, clock=datetime.now, poll_seconds=300):
+        self.tick = tick
+        self.next_due = next_due
+        self.clock = clock
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='reminder-scheduler', daemon=True)
+                self._thread.start()
+
+    def wake(self):
+        self.start()
+        self._wake.set()
+
+    def seconds_until_next(self):
+        upcoming = self.next_due()
+        if upcoming is None:
+            return self.poll_seconds
+        # Sleep until the earliest reminder, but still poll: a task created
+        # meanwhile may be due sooner.
+        return max(1.0, min(self.poll_seconds, (upcoming - self.clock()).total_seconds()))
+
+    def _run(self):
+        while True:
+            self._wake.clear()
+            try:
+                self.tick(self.clock())
+                wait = self.seconds_until_next()
+            except Exception as e:
+                print("Error sending reminders:", e)
+                wait = self.poll_seconds
+            self._wake.wait(wait)
@@ -0,0 +1,76 @@
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+CachedResponse = namedtuple('CachedResponse', ['body', 'mimetype', 'etag'])
+
+
+def body_etag(body):
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, name='responses', max_bytes=16 * 1024 * 1024):
+        self.name = name
+        self.max_bytes = max_bytes
+        # Very large bodies would evict everything else for a single entry.
+        self.max_entry_bytes = max_bytes // 4
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, body, mimetype):
+        entry = CachedResponse(body, mimetype, body_etag(body))
+        if len(body) > self.max_entry_bytes:
+            return entry
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.body)
+            self._entries[key] = entry
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+        return entry
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def invalidate(self, key=None):
+        # Keys start with the request path, so a path drops every cached
+        # query string and version of that endpoint.
+        with self._lock:
+            if key is None:
+                removed = list(self._entries)
+            else:
+                removed = [k for k in self._entries if k[0] == key]
+            for k in removed:
+                self._size -= len(self._entries.pop(k).body)
+            return len(removed)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'name': self.name,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'not_modified': self.not_modified,
+            }
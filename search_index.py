@@ -0,0 +1,172 @@
+import html
+import re
+
+from sqlalchemy import text
+
+# Porter stemming so "promised" finds "promise"; accents are folded so
+# "resume" finds "résumé".
+TOKENIZER = 'porter unicode61 remove_diacritics 2'
+# Matches in a task description count twice as much as in its quotes, and
+# in a meeting's file name twice as much as in its transcript.
+TASK_WEIGHTS = (2.0, 1.0)
+MEETING_WEIGHTS = (2.0, 1.0)
+SNIPPET_TOKENS = 24
+# Control characters never appear in stored text, so highlighted matches
+# can be marked up after the rest of the snippet has been escaped.
+OPEN_MARK, CLOSE_MARK = '\x02', '\x03'
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'did', 'do', 'for', 'from', 'has', 'have', 'i', 'in',
+    'is', 'it', 'of', 'on', 'or', 'that', 'the', 'this', 'to', 'was', 'we', 'what', 'when', 'where',
+    'which', 'who', 'whom', 'why', 'will', 'with',
+}
+
+QUOTES_SQL = "(SELECT group_concat(text, ' ') FROM task_quotes WHERE task_id = {task_id})"
+
+SCHEMA = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts USING fts5("
+    f"file_name, transcript, content='meetings', content_rowid='id', tokenize='{TOKENIZER}')",
+    # Task text is spread over tasks and task_quotes, so this index keeps
+    # its own copy (rowid = task id) instead of reading from one table.
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(description, quotes, tokenize='{TOKENIZER}')",
+
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN "
+    "INSERT INTO meetings_fts (rowid, file_name, transcript) VALUES (new.id, new.file_name, new.transcript); END",
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN "
+    "INSERT INTO meetings_fts (meetings_fts, rowid, file_name, transcript) "
+    "VALUES ('delete', old.id, old.file_name, old.transcript); END",
+    "CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE OF file_name, transcript ON meetings BEGIN "
+    "INSERT INTO meetings_fts (meetings_fts, rowid, file_name, transcript) "
+    "VALUES ('delete', old.id, old.file_name, old.transcript); "
+    "INSERT INTO meetings_fts (rowid, file_name, transcript) VALUES (new.id, new.file_name, new.transcript); END",
+
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts (rowid, description, quotes) "
+    f"VALUES (new.id, new.description, {QUOTES_SQL.format(task_id='new.id')}); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN "
+    "DELETE FROM tasks_fts WHERE rowid = old.id; END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF description ON tasks BEGIN "
+    "UPDATE tasks_fts SET description = new.description WHERE rowid = new.id; END",
+
+    "CREATE TRIGGER IF NOT EXISTS task_quotes_fts_insert AFTER INSERT ON task_quotes BEGIN "
+    f"UPDATE tasks_fts SET quotes = {QUOTES_SQL.format(task_id='new.task_id')} WHERE rowid = new.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS task_quotes_fts_delete AFTER DELETE ON task_quotes BEGIN "
+    f"UPDATE tasks_fts SET quotes = {QUOTES_SQL.format(task_id='old.task_id')} WHERE rowid = old.task_id; END",
+    "CREATE TRIGGER IF NOT EXISTS task_quotes_fts_update AFTER UPDATE OF text, task_id ON task_quotes BEGIN "
+    f"UPDATE tasks_fts SET quotes = {QUOTES_SQL.format(task_id='old.task_id')} WHERE rowid = old.task_id; "
+    f"UPDATE tasks_fts SET quotes = {QUOTES_SQL.format(task_id='new.task_id')} WHERE rowid = new.task_id; END",
+]
+
+TABLES = ['meetings_fts', 'tasks_fts']
+
+
+def install(connection):
+    for statement in SCHEMA:
+        connection.execute(text(statement))
+
+
+def uninstall(connection):
+    # Triggers go with their tables; the index tables have to be dropped
+    # explicitly or they outlive a drop_all().
+    for table in TABLES:
+        connection.execute(text(f'DROP TABLE IF EXISTS {table}'))
+
+
+def rebuild(connection):
+    connection.execute(text("INSERT INTO meetings_fts (meetings_fts) VALUES ('rebuild')"))
+    connection.execute(text('DELETE FROM tasks_fts'))
+    connection.execute(text(
+        'INSERT INTO tasks_fts (rowid, description, quotes) '
+        f"SELECT id, description, {QUOTES_SQL.format(task_id='tasks.id')} FROM tasks"
+    ))
+
+
+def words(value):
+    return re.findall(r'\w+', value.lower())
+
+
+def match_expression(query, any_term=False):
+    # Turns what people type into an FTS5 query: every word must match (or
+    # any word, with any_term), "double quotes" match a phrase and a trailing
+    # * matches a prefix. Words are quoted, so punctuation and FTS5 operators
+    # are taken literally.
+    phrases = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', query or ''):
+        if phrase:
+            tokens = words(phrase)
+            if tokens:
+                phrases.append(('"' + ' '.join(tokens) + '"', False))
+            continue
+        tokens = words(word)
+        for position, token in enumerate(tokens):
+            prefix = word.endswith('*') and position == len(tokens) - 1
+            phrases.append((f'"{token}"' + ('*' if prefix else ''), token in STOPWORDS and not prefix))
+    # Stopwords would only make a question like "who promised the Q3
+    # report" miss; keep them when there is nothing else to search for.
+    kept = [term for term, stopword in phrases if not stopword] or [term for term, _ in phrases]
+    return (' OR ' if any_term else ' ').join(kept) or None
+
+
+def highlight_html(value):
+    if value is None:
+        return None
+    return html.escape(value).replace(OPEN_MARK, '<mark>').replace(CLOSE_MARK, '</mark>')
+
+
+def ranked_ids(connection, table, weights, expression, limit, after=None):
+    # Keyset pagination on (score, rowid): bm25 is lower for better matches.
+    weights = ', '.join(str(weight) for weight in weights)
+    sql = (
+        f'SELECT id, score FROM (SELECT rowid AS id, bm25({table}, {weights}) AS score '
+        f'FROM {table} WHERE {table} MATCH :expression)'
+    )
+    params = {'expression': expression, 'limit': limit + 1}
+    if after is not None:
+        sql += ' WHERE score > :score OR (score = :score AND id > :id)'
+        params.update(score=after[0], id=after[1])
+    sql += ' ORDER BY score, id LIMIT :limit'
+    rows = [(row.id, row.score) for row in connection.execute(text(sql), params)]
+    next_key = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_key = (rows[-1][1], rows[-1][0])
+    return rows, next_key
+
+
+def highlights(connection, table, columns, expression, ids):
+    # Only the page being returned gets snippets; making them for every
+    # match of a common word would read every matching transcript.
+    if not ids:
+        return {}
+    sql = (
+        f'SELECT rowid, {", ".join(columns)} FROM {table} '
+        f'WHERE {table} MATCH :expression AND rowid IN ({", ".join(str(int(i)) for i in ids)})'
+    )
+    params = {'expression': expression, 'open': OPEN_MARK, 'close': CLOSE_MARK, 'tokens': SNIPPET_TOKENS}
+    return {row[0]: [highlight_html(value) for value in row[1:]] for row in connection.execute(text(sql), params)}
+
+
+def search_tasks(connection, expression, limit, after=None):
+    rows, next_key = ranked_ids(connection, 'tasks_fts', TASK_WEIGHTS, expression, limit, after)
+    marked = highlights(connection, 'tasks_fts', [
+        'highlight(tasks_fts, 0, :open, :close)',
+        "snippet(tasks_fts, 1, :open, :close, '…', :tokens)",
+    ], expression, [task_id for task_id, _ in rows])
+    results = []
+    for task_id, score in rows:
+        description, quotes = marked.get(task_id, (None, None))
+        results.append({'id': task_id, 'score': score, 'description': description, 'quotes': quotes})
+    return results, next_key
+
+
+def search_meetings(connection, expression, limit, after=None):
+    rows, next_key = ranked_ids(connection, 'meetings_fts', MEETING_WEIGHTS, expression, limit, after)
+    marked = highlights(connection, 'meetings_fts', [
+        'highlight(meetings_fts, 0, :open, :close)',
+        "snippet(meetings_fts, 1, :open, :close, '…', :tokens)",
+    ], expression, [meeting_id for meeting_id, _ in rows])
+    results = []
+    for meeting_id, score in rows:
+        file_name, snippet = marked.get(meeting_id, (None, None))
+        results.append({'id': meeting_id, 'score': score, 'file_name': file_name, 'snippet': snippet})
+    return results, next_key
@@ -8,6 +8,12 @@ document.addEventListener('DOMContentLoaded', () => {
     const assignedTasksList = document.getElementById('assigned-tasks-list');
     const viewAllWorkloadLink = document.getElementById('view-all-workload-link');
     const viewAllEventsLink = document.querySelector('.nearest-events-section .view-all-link');
+    const DASHBOARD_TASK_LIMIT = 7;
+    const DASHBOARD_EVENT_LIMIT = 4;
+
+    let workloadEmployees = [];
+    let dashboardTasks = [];
+    let upcomingEvents = [];
 
     async function fetchAndRenderWorkload() {
         if (!topEmployeesGrid) return;
@@ -17,80 +23,92 @@ document.addEventListener('DOMContentLoaded', () => {
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            const employees = await response.json();
-
-            const sortedEmployees = employees.sort((a, b) => b.total_pending_tasks - a.total_pending_tasks);
-
-            topEmployeesGrid.innerHTML = '';
-            sortedEmployees.slice(0, 5).forEach(employee => {
-                const employeeItem = document.createElement('div');
-                employeeItem.classList.add('employee-item');
-
-                const avatarUrl = employee.avatar || `https://i.pravatar.cc/150?img=${(employee.id % 70) + 1}`;
-
-                employeeItem.innerHTML = `
-                    <img src="${avatarUrl}" alt="${employee.name}" class="employee-avatar">
-                    <div class="employee-details">
-                        <p class="employee-name">${employee.name}</p>
-                        <p class="employee-position">${employee.position}</p>
-                    </div>
-                    <span class="completed-tasks">${employee.total_pending_tasks || 0} pending</span>
-                `;
-                topEmployeesGrid.appendChild(employeeItem);
-            });
-
-            if (sortedEmployees.length === 0) {
-                topEmployeesGrid.innerHTML = '<p class="no-data">No employee workload data available.</p>';
-            }
-
+            workloadEmployees = await response.json();
+            renderWorkload();
         } catch (error) {
             console.error('Error fetching employees for workload:', error);
             topEmployeesGrid.innerHTML = '<p class="error-message">Failed to load employee workload data.</p>';
         }
     }
 
+    function renderWorkload() {
+        const sortedEmployees = [...workloadEmployees].sort((a, b) => b.total_pending_tasks - a.total_pending_tasks);
+
+        topEmployeesGrid.innerHTML = '';
+        sortedEmployees.slice(0, 5).forEach(employee => {
+            const employeeItem = document.createElement('div');
+            employeeItem.classList.add('employee-item');
+
+            const avatarUrl = employee.avatar || `https://i.pravatar.cc/150?img=${(employee.id % 70) + 1}`;
+
+            employeeItem.innerHTML = `
+                <img src="${avatarUrl}" alt="${employee.name}" class="employee-avatar">
+                <div class="employee-details">
+                    <p class="employee-name">${employee.name}</p>
+                    <p class="employee-position">${employee.position}</p>
+                </div>
+                <span class="completed-tasks">${employee.total_pending_tasks || 0} pending</span>
+            `;
+            topEmployeesGrid.appendChild(employeeItem);
+        });
+
+        if (sortedEmployees.length === 0) {
+            topEmployeesGrid.innerHTML = '<p class="no-data">No employee workload data available.</p>';
+        }
+    }
+
+    // The user's calendar day, not the UTC one toISOString() would give.
+    function toISODate(date) {
+        return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+    }
+
     async function fetchAndRenderEvents() {
         if (!nearestEventsList) return;
 
         try {
-            const response = await fetch('/api/events');
+            const today = toISODate(new Date());
+            const response = await fetch(`/api/events?start=${today}&limit=${DASHBOARD_EVENT_LIMIT}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            const events = await response.json();
-
-            nearestEventsList.innerHTML = ''; 
+            upcomingEvents = (await response.json()).items;
+            renderEvents();
+        } catch (error) {
+            console.error('Error fetching events:', error);
+            nearestEventsList.innerHTML = '<p class="error-message">Failed to load events data.</p>';
+        }
+    }
 
-            events.slice(0, 4).forEach(event => {
-                const eventItem = document.createElement('div');
-                eventItem.classList.add('event-item');
+    function renderEvents() {
+        const events = upcomingEvents;
 
-                let tagClass = '';
-                if (event.category === 'work') {
-                    tagClass = 'orange';
-                } else if (event.category === 'social') {
-                    tagClass = 'blue';
-                } else if (event.category === 'meeting') {
-                    tagClass = 'green';
-                }
+        nearestEventsList.innerHTML = ''; 
 
-                eventItem.innerHTML = `
-                    <div class="event-details">
-                        <p class="event-title">${event.title}</p>
-                        <span class="event-time">${event.date} | ${event.time}</span>
-                    </div>
-                    <span class="event-tag ${tagClass}">${event.category}</span>
-                `;
-                nearestEventsList.appendChild(eventItem);
-            });
+        events.slice(0, DASHBOARD_EVENT_LIMIT).forEach(event => {
+            const eventItem = document.createElement('div');
+            eventItem.classList.add('event-item');
 
-            if (events.length === 0) {
-                nearestEventsList.innerHTML = '<p class="no-data">No upcoming events.</p>';
+            let tagClass = '';
+            if (event.category === 'work') {
+                tagClass = 'orange';
+            } else if (event.category === 'social') {
+                tagClass = 'blue';
+            } else if (event.category === 'meeting') {
+                tagClass = 'green';
             }
 
-        } catch (error) {
-            console.error('Error fetching events:', error);
-            nearestEventsList.innerHTML = '<p class="error-message">Failed to load events data.</p>';
+            eventItem.innerHTML = `
+                <div class="event-details">
+                    <p class="event-title">${event.title}</p>
+                    <span class="event-time">${event.date} | ${event.time}</span>
+                </div>
+                <span class="event-tag ${tagClass}">${event.category}</span>
+            `;
+            nearestEventsList.appendChild(eventItem);
+        });
+
+        if (events.length === 0) {
+            nearestEventsList.innerHTML = '<p class="no-data">No upcoming events.</p>';
         }
     }
 
@@ -98,66 +116,147 @@ document.addEventListener('DOMContentLoaded', () => {
         if (!assignedTasksList) return;
 
         try {
-            const response = await fetch('/assignments');
+            const response = await fetch(`/assignments?status=pending&limit=${DASHBOARD_TASK_LIMIT}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            const allTasks = await response.json();
+            dashboardTasks = (await response.json()).items;
+            renderDashboardTasks();
+        } catch (error) {
+            console.error('Error fetching tasks for dashboard:', error);
+            assignedTasksList.innerHTML = '<p class="error-message">Failed to load tasks data.</p>';
+        }
+    }
 
-            assignedTasksList.innerHTML = '';
+    function renderDashboardTasks() {
+        const pendingTasks = dashboardTasks;
 
-            const pendingTasks = allTasks.filter(t => t.status === 'pending');
+        assignedTasksList.innerHTML = '';
 
-            pendingTasks.slice(0, 7).forEach(task => {
-                const taskItem = document.createElement('div');
-                taskItem.classList.add('task-item');
+        pendingTasks.slice(0, DASHBOARD_TASK_LIMIT).forEach(task => {
+            const taskItem = document.createElement('div');
+            taskItem.classList.add('task-item');
 
-                let priorityClass = 'priority-low';
-                if (task.deadline) {
-                    const today = new Date();
-                    const deadlineDate = new Date(task.deadline);
-                    const diffTime = deadlineDate.getTime() - today.getTime();
-                    const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
+            let priorityClass = 'priority-low';
+            if (task.deadline) {
+                const today = new Date();
+                const deadlineDate = new Date(task.deadline);
+                const diffTime = deadlineDate.getTime() - today.getTime();
+                const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
 
-                    if (diffDays <= 3) {
-                        priorityClass = 'priority-high';
-                    } else if (diffDays <= 7) {
-                        priorityClass = 'priority-medium';
-                    }
+                if (diffDays <= 3) {
+                    priorityClass = 'priority-high';
+                } else if (diffDays <= 7) {
+                    priorityClass = 'priority-medium';
                 }
+            }
 
 
-                let assigneeAvatar = '';
-                let assigneeName = 'Unassigned';
+            let assigneeAvatar = '';
+            let assigneeName = 'Unassigned';
 
-                if (task.assignee_avatar) {
-                    assigneeAvatar = task.assignee_avatar;
-                    assigneeName = task.assignee_name;
-                } else if (task.ai_assignee) {
-                    assigneeName = task.ai_assignee + ' (AI)';
-                    assigneeAvatar = `https://i.pravatar.cc/150?img=${(task.id % 70) + 20}`;
-                } else {
-                    assigneeAvatar = `https://i.pravatar.cc/150?img=70`;
-                }
+            if (task.assignee_avatar) {
+                assigneeAvatar = task.assignee_avatar;
+                assigneeName = task.assignee_name;
+            } else if (task.ai_assignee) {
+                assigneeName = task.ai_assignee + ' (AI)';
+                assigneeAvatar = `https://i.pravatar.cc/150?img=${(task.id % 70) + 20}`;
+            } else {
+                assigneeAvatar = `https://i.pravatar.cc/150?img=70`;
+            }
 
-                taskItem.innerHTML = `
-                    <span class="task-priority-indicator ${priorityClass}"></span>
-                    <div class="task-details">
-                        <p class="task-name">${task.description}</p>
-                        <span class="task-date">${task.deadline || 'No deadline'}</span>
-                    </div>
-                    <img src="${assigneeAvatar}" alt="${assigneeName}" class="task-assignee-avatar">
-                `;
-                assignedTasksList.appendChild(taskItem);
-            });
+            taskItem.innerHTML = `
+                <span class="task-priority-indicator ${priorityClass}"></span>
+                <div class="task-details">
+                    <p class="task-name">${task.description}</p>
+                    <span class="task-date">${task.deadline || 'No deadline'}</span>
+                </div>
+                <img src="${assigneeAvatar}" alt="${assigneeName}" class="task-assignee-avatar">
+            `;
+            assignedTasksList.appendChild(taskItem);
+        });
 
-            if (pendingTasks.length === 0) {
-                 assignedTasksList.innerHTML = '<p class="no-tasks">No pending tasks found.</p>';
-            }
+        if (pendingTasks.length === 0) {
+             assignedTasksList.innerHTML = '<p class="no-tasks">No pending tasks found.</p>';
+        }
+    }
 
-        } catch (error) {
-            console.error('Error fetching tasks for dashboard:', error);
-            assignedTasksList.innerHTML = '<p class="error-message">Failed to load tasks data.</p>';
+    function assigneeFor(task) {
+        const employee = workloadEmployees.find(emp => emp.id === task.assigned_employee_id);
+        if (!task.assigned_employee_id) {
+            return { assignee_name: null, assignee_avatar: null };
+        }
+        return {
+            assignee_name: employee ? employee.name : task.assigned_employee_name,
+            assignee_avatar: `https://i.pravatar.cc/150?img=${(task.assigned_employee_id % 70) + 1}`
+        };
+    }
+
+    // The dashboard shows the oldest pending tasks; a task can be slotted in
+    // locally unless it would push the list past its limit from behind, in
+    // which case only the server knows what comes next.
+    function addPendingTask(task) {
+        if (dashboardTasks.some(t => t.id === task.id)) return;
+        const full = dashboardTasks.length >= DASHBOARD_TASK_LIMIT;
+        if (full && task.id > dashboardTasks[dashboardTasks.length - 1].id) return;
+        dashboardTasks.push(Object.assign({}, task, assigneeFor(task)));
+        dashboardTasks.sort((a, b) => a.id - b.id);
+        dashboardTasks = dashboardTasks.slice(0, DASHBOARD_TASK_LIMIT);
+        renderDashboardTasks();
+    }
+
+    function applyTaskEvent(type, data) {
+        if (topEmployeesGrid) {
+            live.applyTaskCounts(workloadEmployees, type, data);
+            renderWorkload();
+        }
+        if (!assignedTasksList) return;
+
+        if (type === 'task.created') {
+            if (data.status === 'pending') addPendingTask(data);
+        } else if (type === 'task.status') {
+            // Status changes only carry ids, so anything that could change
+            // which tasks are shown is re-read from the server once.
+            const wasFull = dashboardTasks.length >= DASHBOARD_TASK_LIMIT;
+            const lastId = wasFull ? dashboardTasks[dashboardTasks.length - 1].id : Infinity;
+            const completedIds = new Set(data.tasks.filter(change => change.status !== 'pending').map(change => change.id));
+            const reopened = data.tasks.some(change => change.status === 'pending' && change.id < lastId);
+            const remaining = dashboardTasks.filter(t => !completedIds.has(t.id));
+            const removed = remaining.length !== dashboardTasks.length;
+            dashboardTasks = remaining;
+            if (reopened || (removed && wasFull)) {
+                fetchAndRenderTasks();
+            } else if (removed) {
+                renderDashboardTasks();
+            }
+        } else if (type === 'task.updated') {
+            const index = dashboardTasks.findIndex(t => t.id === data.id);
+            if (index !== -1) {
+                dashboardTasks[index] = Object.assign({}, data, assigneeFor(data));
+                renderDashboardTasks();
+            }
+        } else if (type === 'task.deleted') {
+            const deletedIds = new Set(data.tasks.map(change => change.id));
+            const remaining = dashboardTasks.filter(t => !deletedIds.has(t.id));
+            if (remaining.length !== dashboardTasks.length) {
+                const wasFull = dashboardTasks.length >= DASHBOARD_TASK_LIMIT;
+                dashboardTasks = remaining;
+                if (wasFull) {
+                    fetchAndRenderTasks();
+                } else {
+                    renderDashboardTasks();
+                }
+            }
+        } else if (type === 'task.assigned') {
+            let changed = false;
+            data.tasks.forEach(change => {
+                const task = dashboardTasks.find(t => t.id === change.id);
+                if (task) {
+                    Object.assign(task, { assigned_employee_id: change.assigned_employee_id }, assigneeFor(change));
+                    changed = true;
+                }
+            });
+            if (changed) renderDashboardTasks();
         }
     }
 
@@ -165,6 +264,32 @@ document.addEventListener('DOMContentLoaded', () => {
     fetchAndRenderEvents();
     fetchAndRenderTasks();
 
+    ['task.created', 'task.updated', 'task.assigned', 'task.status', 'task.deleted'].forEach(type => {
+        live.on(type, data => applyTaskEvent(type, data));
+    });
+
+    live.on('employee.created', employee => {
+        if (!topEmployeesGrid || workloadEmployees.some(e => e.id === employee.id)) return;
+        workloadEmployees.push(employee);
+        renderWorkload();
+    });
+
+    live.on('event.created', event => {
+        if (!nearestEventsList) return;
+        const today = toISODate(new Date());
+        if (event.date < today || upcomingEvents.some(e => e.id === event.id)) return;
+        upcomingEvents.push(event);
+        upcomingEvents.sort((a, b) => `${a.date} ${a.time}`.localeCompare(`${b.date} ${b.time}`) || a.id - b.id);
+        upcomingEvents = upcomingEvents.slice(0, DASHBOARD_EVENT_LIMIT);
+        renderEvents();
+    });
+
+    live.on('reset', () => {
+        fetchAndRenderWorkload();
+        fetchAndRenderEvents();
+        fetchAndRenderTasks();
+    });
+
     if (autoAssignBtn) {
         autoAssignBtn.addEventListener('click', () => {
             window.location.href = '/auto_assign';
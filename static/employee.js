@@ -18,6 +18,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
 
     let employees = [];
+    const TASK_PAGE_SIZE = 50;
 
     async function fetchEmployees() {
         try {
@@ -94,25 +95,47 @@ document.addEventListener('DOMContentLoaded', () => {
         totalCompletedTasksSpan.textContent = employee.total_completed_tasks;
 
         employeeTasksList.innerHTML = '<li class="no-tasks"><i class="fas fa-spinner fa-spin"></i> Loading tasks...</li>';
+        await fetchEmployeeTasks(employeeId);
+
+        employeeDetailsModal.style.display = 'flex';
+    }
+
+    async function fetchEmployeeTasks(employeeId, after = null) {
         try {
-            const response = await fetch(`/employees/${employeeId}/tasks`);
+            const params = new URLSearchParams({ limit: TASK_PAGE_SIZE });
+            if (after) {
+                params.set('after', after);
+            }
+            const response = await fetch(`/employees/${employeeId}/tasks?${params.toString()}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            const tasks = await response.json();
-            renderEmployeeTasks(tasks);
+            const page = await response.json();
+            renderEmployeeTasks(page.items, Boolean(after));
+
+            if (page.next_cursor) {
+                const loadMoreItem = document.createElement('li');
+                loadMoreItem.classList.add('no-tasks', 'load-more-tasks');
+                loadMoreItem.innerHTML = '<i class="fas fa-chevron-down"></i> Load more tasks';
+                loadMoreItem.style.cursor = 'pointer';
+                loadMoreItem.addEventListener('click', () => {
+                    loadMoreItem.remove();
+                    fetchEmployeeTasks(employeeId, page.next_cursor);
+                });
+                employeeTasksList.appendChild(loadMoreItem);
+            }
         } catch (error) {
             console.error('Error fetching employee tasks:', error);
             employeeTasksList.innerHTML = '<li class="no-tasks"><i class="fas fa-exclamation-circle"></i> Failed to load tasks.</li>';
         }
-
-        employeeDetailsModal.style.display = 'flex';
     }
 
-    function renderEmployeeTasks(tasks) {
-        employeeTasksList.innerHTML = '';
+    function renderEmployeeTasks(tasks, append = false) {
+        if (!append) {
+            employeeTasksList.innerHTML = '';
+        }
 
-        if (tasks.length === 0) {
+        if (tasks.length === 0 && !append) {
             employeeTasksList.innerHTML = '<li class="no-tasks"><i class="fas fa-clipboard-list"></i> No tasks assigned yet.</li>';
             return;
         }
@@ -190,7 +213,7 @@ document.addEventListener('DOMContentLoaded', () => {
             const addedEmployee = await response.json();
             console.log('New employee added:', addedEmployee);
 
-            await fetchEmployees();
+            addEmployee(addedEmployee);
 
             addEmployeeModal.style.display = 'none';
             addEmployeeForm.reset();
@@ -202,5 +225,20 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
+    function addEmployee(employee) {
+        if (employees.some(e => e.id === employee.id)) return;
+        employees.push(employee);
+        renderEmployees();
+    }
+
+    live.on('employee.created', addEmployee);
+    ['task.created', 'task.assigned', 'task.status', 'task.deleted'].forEach(type => {
+        live.on(type, data => {
+            live.applyTaskCounts(employees, type, data);
+            renderEmployees();
+        });
+    });
+    live.on('reset', fetchEmployees);
+
     fetchEmployees();
 });
\ No newline at end of file
@@ -22,6 +22,7 @@ document.addEventListener('DOMContentLoaded', async () => {
     const newEventTimeInput = document.getElementById('newEventTime');
     const newEventCategorySelect = document.getElementById('newEventCategory');
     const newEventDescriptionInput = document.getElementById('newEventDescription');
+    const newEventRecurrenceSelect = document.getElementById('newEventRecurrence');
     const saveNewEventBtn = document.getElementById('saveNewEventBtn');
     const cancelAddEventBtn = document.querySelector('.cancel-add-event-btn');
 
@@ -29,15 +30,24 @@ document.addEventListener('DOMContentLoaded', async () => {
     let currentYear = new Date().getFullYear();
     let allEvents = [];
 
-    async function fetchEvents() {
+    // Occurrences of a repeating event share its id.
+    function occurrenceKey(event) {
+        return `${event.id}@${event.starts_at}`;
+    }
+
+    function toISODate(date) {
+        return `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}-${String(date.getDate()).padStart(2, '0')}`;
+    }
+
+    async function fetchEvents(query) {
         try {
-            const response = await fetch('/api/events');
+            const response = await fetch(`/api/events?${query}`);
             if (!response.ok) {
                 const errorText = await response.text();
                 throw new Error(`HTTP error! status: ${response.status} - ${errorText}`);
             }
             const events = await response.json();
-            return events;
+            return Array.isArray(events) ? events : events.items;
         } catch (error) {
             console.error("Error fetching events:", error);
             return [];
@@ -86,7 +96,7 @@ document.addEventListener('DOMContentLoaded', async () => {
         sortedEvents.forEach(event => {
             const eventItem = document.createElement('div');
             eventItem.classList.add('event-item');
-            eventItem.dataset.eventId = event.id;
+            eventItem.dataset.eventId = occurrenceKey(event);
 
             const eventDate = new Date(event.date);
             const dateString = eventDate.toLocaleDateString('en-US', { day: 'numeric', month: 'short' });
@@ -146,7 +156,7 @@ document.addEventListener('DOMContentLoaded', async () => {
                 const eventSpan = document.createElement('span');
                 eventSpan.classList.add('day-event', event.category);
                 eventSpan.textContent = event.title;
-                eventSpan.dataset.eventId = event.id;
+                eventSpan.dataset.eventId = occurrenceKey(event);
                 dayElement.appendChild(eventSpan);
             });
 
@@ -155,7 +165,7 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
 
     function showEventDetailPopup(eventId, events) {
-        const event = events.find(e => e.id == eventId);
+        const event = events.find(e => occurrenceKey(e) === eventId);
         if (!event) {
             console.error("Event not found with ID:", eventId);
             return;
@@ -163,7 +173,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
         popupEventTitle.textContent = event.title;
         popupEventDate.textContent = new Date(event.date).toLocaleDateString('en-US', { weekday: 'long', year: 'numeric', month: 'long', day: 'numeric' });
-        popupEventTime.textContent = event.time;
+        popupEventTime.textContent = event.recurrence ? `${event.time} (repeats ${event.recurrence.frequency})` : event.time;
         popupEventCategory.textContent = event.category.charAt(0).toUpperCase() + event.category.slice(1);
         popupEventDescription.textContent = event.description;
         popupEventCategory.className = '';
@@ -174,9 +184,19 @@ document.addEventListener('DOMContentLoaded', async () => {
     }
 
     async function refreshEventsAndUI() {
-        allEvents = await fetchEvents();
-        renderNearestEvents(allEvents);
-        renderCalendar(currentMonth, currentYear, allEvents);
+        const monthStart = toISODate(new Date(currentYear, currentMonth, 1));
+        const monthEnd = toISODate(new Date(currentYear, currentMonth + 1, 0));
+        const [monthEvents, upcomingEvents] = await Promise.all([
+            fetchEvents(`start=${monthStart}&end=${monthEnd}`),
+            fetchEvents(`start=${toISODate(new Date())}&limit=5`)
+        ]);
+
+        const eventsById = new Map();
+        monthEvents.concat(upcomingEvents).forEach(event => eventsById.set(occurrenceKey(event), event));
+        allEvents = Array.from(eventsById.values());
+
+        renderNearestEvents(upcomingEvents);
+        renderCalendar(currentMonth, currentYear, monthEvents);
     }
 
     prevMonthBtn.addEventListener('click', async () => {
@@ -238,6 +258,7 @@ document.addEventListener('DOMContentLoaded', async () => {
             time: newEventTimeInput.value,
             category: newEventCategorySelect.value,
             description: newEventDescriptionInput.value,
+            recurrence: newEventRecurrenceSelect.value || null,
         };
 
         if (newEventData.title && newEventData.date && newEventData.time && newEventData.category) {
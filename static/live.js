@@ -0,0 +1,63 @@
+// Shared connection to the server's /stream change feed. Pages register
+// handlers with live.on(type, handler) and patch their local state instead
+// of re-fetching whole lists after every change.
+window.live = (() => {
+    const handlers = {};
+    const source = window.EventSource ? new EventSource('/stream') : null;
+
+    function dispatch(type, message) {
+        const data = message.data ? JSON.parse(message.data) : {};
+        (handlers[type] || []).forEach(handler => {
+            try {
+                handler(data);
+            } catch (error) {
+                console.error(`Error handling ${type} event:`, error);
+            }
+        });
+    }
+
+    function on(type, handler) {
+        if (!source) return;
+        if (!handlers[type]) {
+            handlers[type] = [];
+            source.addEventListener(type, message => dispatch(type, message));
+        }
+        handlers[type].push(handler);
+    }
+
+    function isConnected() {
+        return Boolean(source) && source.readyState === EventSource.OPEN;
+    }
+
+    // Keeps total_pending_tasks / total_completed_tasks on a list of
+    // /employees rows in step with task events.
+    function applyTaskCounts(employees, type, data) {
+        const byId = {};
+        employees.forEach(employee => { byId[employee.id] = employee; });
+
+        function adjust(employeeId, status, delta) {
+            const employee = byId[employeeId];
+            if (!employee) return;
+            const key = status === 'complete' ? 'total_completed_tasks' : 'total_pending_tasks';
+            employee[key] = Math.max(0, (employee[key] || 0) + delta);
+        }
+
+        if (type === 'task.created') {
+            adjust(data.assigned_employee_id, data.status, 1);
+        } else if (type === 'task.assigned') {
+            data.tasks.forEach(change => {
+                adjust(change.previous_employee_id, change.status, -1);
+                adjust(change.assigned_employee_id, change.status, 1);
+            });
+        } else if (type === 'task.status') {
+            data.tasks.forEach(change => {
+                adjust(change.assigned_employee_id, change.previous_status, -1);
+                adjust(change.assigned_employee_id, change.status, 1);
+            });
+        } else if (type === 'task.deleted') {
+            data.tasks.forEach(change => adjust(change.assigned_employee_id, change.status, -1));
+        }
+    }
+
+    return { enabled: Boolean(source), on, isConnected, applyTaskCounts };
+})();
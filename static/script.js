@@ -77,8 +77,12 @@ document.addEventListener('DOMContentLoaded', () => {
                 `;
                 meetingTasksColumn.appendChild(taskDiv);
 
-                if (task.ai_assignee) {
-                    const assigneeEmployee = employees.find(emp => emp.name === task.ai_assignee);
+                if (task.assigned_employee_id || task.ai_assignee) {
+                    // The server matches AI names like "J. Doe" to employees;
+                    // fall back to an exact name match for unresolved ones.
+                    const assigneeEmployee = task.assigned_employee_id
+                        ? employees.find(emp => emp.id === task.assigned_employee_id)
+                        : employees.find(emp => emp.name === task.ai_assignee);
                     if (assigneeEmployee) {
                         const dropZone = taskDiv.querySelector('.drop-zone');
                         const employeeItem = availableEmployeesList.querySelector(`.employee-item[data-id="${assigneeEmployee.id}"]`);
@@ -367,6 +371,99 @@ document.addEventListener('DOMContentLoaded', () => {
         togglePlaceholder(availableEmployeesList, false);
     }
 
+    const jobStageLabels = {
+        queued: 'Waiting in queue...',
+        transcribing: 'Transcribing recording...',
+        analysing: 'Extracting tasks...',
+        persisting: 'Saving tasks...',
+        emailing: 'Notifying assignees...'
+    };
+
+    const jobWatchers = {};
+
+    live.on('job.progress', data => {
+        const watcher = jobWatchers[data.id];
+        if (watcher) watcher(data);
+    });
+
+    // Buffers job.progress events for one job so none are missed between
+    // two calls to next().
+    function watchJob(jobId) {
+        const queue = [];
+        let waiting = null;
+        jobWatchers[jobId] = data => {
+            if (waiting) {
+                waiting(data);
+            } else {
+                queue.push(data);
+            }
+        };
+        return {
+            next(timeoutMs) {
+                if (queue.length) return Promise.resolve(queue.shift());
+                return new Promise(resolve => {
+                    const timer = setTimeout(() => {
+                        waiting = null;
+                        resolve(null);
+                    }, timeoutMs);
+                    waiting = data => {
+                        clearTimeout(timer);
+                        waiting = null;
+                        resolve(data);
+                    };
+                });
+            },
+            close() {
+                delete jobWatchers[jobId];
+            }
+        };
+    }
+
+    async function fetchJob(statusUrl) {
+        const response = await fetch(statusUrl);
+        if (!response.ok) {
+            const errorData = await response.json();
+            throw new Error(errorData.message || 'Failed to fetch job status');
+        }
+        return response.json();
+    }
+
+    async function pollJob(statusUrl) {
+        const updates = watchJob(statusUrl.split('/').pop());
+        let tasksFound = 0;
+        try {
+            let job = await fetchJob(statusUrl);
+            while (true) {
+                if (job.stage === 'done') {
+                    // Progress events don't carry the task list.
+                    return job.tasks ? job : await fetchJob(statusUrl);
+                }
+                if (job.stage === 'failed') {
+                    throw new Error(job.error || 'Processing failed');
+                }
+
+                if (job.tasks) {
+                    tasksFound = job.tasks.length;
+                } else if (job.tasks_found != null) {
+                    tasksFound = job.tasks_found;
+                }
+                let statusText = jobStageLabels[job.stage] || 'Processing...';
+                if (tasksFound > 0) {
+                    statusText += ` (${tasksFound} tasks found so far)`;
+                }
+                uploadStatusParagraph.textContent = statusText;
+                progressBarFill.style.width = `${Math.round(job.progress * 100)}%`;
+
+                // With the change feed connected the server pushes every
+                // stage change; the slow re-check only covers a dropped
+                // connection. Without it, fall back to polling.
+                job = (await updates.next(live.isConnected() ? 15000 : 1500)) || await fetchJob(statusUrl);
+            }
+        } finally {
+            updates.close();
+        }
+    }
+
     async function handleFileUpload(file) {
         if (!file) return;
 
@@ -396,9 +493,11 @@ document.addEventListener('DOMContentLoaded', () => {
         const formData = new FormData();
         formData.append('file', file);
         formData.append('fileType', selectedType);
+        const addToCalendar = document.getElementById('addToCalendar');
+        formData.append('createEvent', addToCalendar && addToCalendar.checked ? '1' : '0');
 
         try {
-            const response = await fetch('/', {
+            const response = await fetch('/auto_assign', {
                 method: 'POST',
                 body: formData
             });
@@ -411,16 +510,18 @@ document.addEventListener('DOMContentLoaded', () => {
             const data = await response.json();
             console.log('Backend Response:', data);
 
-            uploadedFile = file;
             fileInfoParagraph.textContent = `Uploaded: ${data.filename}`;
-            uploadStatusParagraph.textContent = 'Upload successful!';
+            const job = await pollJob(data.status_url);
+
+            uploadedFile = file;
+            uploadStatusParagraph.textContent = 'Processing complete!';
             progressBarFill.style.width = '100%';
             progressBarFill.style.backgroundColor = 'var(--success-green)';
             if (step1NextButton) {
                 step1NextButton.disabled = false;
             }
 
-            window.uploadedTasks = data.tasks;
+            window.uploadedTasks = job.tasks;
             window.availableEmployees = await fetchEmployees();
 
         } catch (error) {
@@ -12,19 +12,44 @@ document.addEventListener('DOMContentLoaded', () => {
     const deadlineFilter = document.getElementById('deadline-filter');
     const clearFiltersBtn = document.getElementById('clear-filters-btn');
     const noTasksMessage = tasksGrid.querySelector('.no-tasks-message');
+    const loadMoreBtn = document.getElementById('load-more-btn');
+    const PAGE_SIZE = 50;
 
 
     let allTasks = [];
     let allEmployees = [];
+    let nextCursor = null;
 
-    async function fetchTasks() {
+    function buildTaskQuery() {
+        const params = new URLSearchParams({ limit: PAGE_SIZE });
+        if (statusFilter.value !== 'all') {
+            params.set('status', statusFilter.value);
+        }
+        if (employeeFilter.value !== 'all' && employeeFilter.value !== '') {
+            params.set('assigned_employee_id', employeeFilter.value);
+        }
+        if (deadlineFilter.value) {
+            params.set('deadline_from', deadlineFilter.value);
+            params.set('deadline_to', deadlineFilter.value);
+        }
+        return params;
+    }
+
+    async function fetchTasks(append = false) {
         try {
-            const response = await fetch('/tasks');
+            const params = buildTaskQuery();
+            if (append && nextCursor) {
+                params.set('after', nextCursor);
+            }
+            const response = await fetch(`/tasks?${params.toString()}`);
             if (!response.ok) {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
-            allTasks = await response.json();
-            console.log('Fetched tasks:', allTasks);
+            const page = await response.json();
+            allTasks = append ? allTasks.concat(page.items) : page.items;
+            nextCursor = page.next_cursor;
+            loadMoreBtn.style.display = nextCursor ? 'block' : 'none';
+            console.log('Fetched tasks:', page.items);
             renderTasks();
             updateTaskCount();
         } catch (error) {
@@ -214,7 +239,7 @@ document.addEventListener('DOMContentLoaded', () => {
 
             addNewTaskModal.style.display = 'none';
             addNewTaskForm.reset();
-            await fetchTasks();
+            upsertTask(addedTask);
 
             alert('Task added successfully!');
         } catch (error) {
@@ -262,27 +287,105 @@ document.addEventListener('DOMContentLoaded', () => {
             button.classList.remove('pending', 'complete');
             button.classList.add(updatedTask.status);
 
-            const taskIndex = allTasks.findIndex(t => t.id == taskId);
-            if (taskIndex !== -1) {
-                allTasks[taskIndex].status = updatedTask.status;
-            }
-            renderTasks();
+            applyTaskChanges([{ id: updatedTask.id, status: updatedTask.status }]);
             } catch (error) {
             console.error('Error updating task status:', error);
             alert(`Failed to update task status: ${error.message}`);
         }
     }
 
-    statusFilter.addEventListener('change', renderTasks);
-    employeeFilter.addEventListener('change', renderTasks);
-    deadlineFilter.addEventListener('change', renderTasks);
+    statusFilter.addEventListener('change', () => fetchTasks());
+    employeeFilter.addEventListener('change', () => fetchTasks());
+    deadlineFilter.addEventListener('change', () => fetchTasks());
+    loadMoreBtn.addEventListener('click', () => fetchTasks(true));
     
     clearFiltersBtn.addEventListener('click', () => {
         statusFilter.value = 'all';
         employeeFilter.value = 'all';
         deadlineFilter.value = '';
+        fetchTasks();
+    });
+
+    function matchesFilters(task) {
+        if (statusFilter.value !== 'all' && task.status !== statusFilter.value) return false;
+        if (employeeFilter.value !== 'all' && employeeFilter.value !== '' && task.assigned_employee_id != employeeFilter.value) return false;
+        if (deadlineFilter.value && !(task.deadline && task.deadline.startsWith(deadlineFilter.value))) return false;
+        return true;
+    }
+
+    // New tasks have the highest ids, so they belong at the end of the list;
+    // while more pages remain they will arrive with "Load more" instead.
+    function upsertTask(task) {
+        const index = allTasks.findIndex(t => t.id === task.id);
+        if (index !== -1) {
+            allTasks[index] = task;
+        } else if (nextCursor || !matchesFilters(task)) {
+            return;
+        } else {
+            allTasks.push(task);
+        }
+        renderTasks();
+    }
+
+    let refreshTimer = null;
+
+    function scheduleRefresh() {
+        clearTimeout(refreshTimer);
+        refreshTimer = setTimeout(() => fetchTasks(), 500);
+    }
+
+    // Change events only carry the fields that changed. Tasks already on the
+    // page are patched in place; a task that has moved into the current
+    // filter is not, so the list is re-read once.
+    function applyTaskChanges(changes) {
+        let missing = false;
+        changes.forEach(change => {
+            const task = allTasks.find(t => t.id === change.id);
+            if (task) {
+                Object.assign(task, change);
+                if ('assigned_employee_id' in change) {
+                    const employee = allEmployees.find(emp => emp.id === change.assigned_employee_id);
+                    task.assigned_employee_name = employee ? employee.name : null;
+                }
+            } else if (matchesFilters(Object.assign({ deadline: deadlineFilter.value }, change))) {
+                missing = true;
+            }
+        });
+        if (missing) {
+            scheduleRefresh();
+        } else {
+            renderTasks();
+        }
+    }
+
+    live.on('task.created', upsertTask);
+    live.on('task.updated', upsertTask);
+    live.on('task.deleted', data => {
+        const deletedIds = new Set(data.tasks.map(change => change.id));
+        allTasks = allTasks.filter(task => !deletedIds.has(task.id));
         renderTasks();
     });
+    live.on('task.assigned', data => applyTaskChanges(data.tasks.map(change => ({
+        id: change.id,
+        assigned_employee_id: change.assigned_employee_id,
+        status: change.status
+    }))));
+    live.on('task.status', data => applyTaskChanges(data.tasks.map(change => ({
+        id: change.id,
+        status: change.status,
+        assigned_employee_id: change.assigned_employee_id
+    }))));
+    live.on('employee.created', employee => {
+        if (allEmployees.some(e => e.id === employee.id)) return;
+        const selectedEmployee = employeeFilter.value;
+        allEmployees.push(employee);
+        populateEmployeeFilters();
+        populateAssigneeDropdown(taskAssigneeSelect);
+        employeeFilter.value = selectedEmployee;
+    });
+    live.on('reset', () => {
+        fetchEmployees().then(() => fetchTasks());
+    });
 
     async function initializeTasksPage() {
         await fetchEmployees();
@@ -0,0 +1,245 @@
+import queue
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from difflib import SequenceMatcher
+
+SPEAKER_TURN = re.compile(r'^\s*[A-Z][\w .\'-]{0,40}:\s')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def estimate_tokens(text):
+    return len(text.split()) * 4 // 3 + 1
+
+
+def split_units(text):
+    paragraphs = [p.strip() for p in re.split(r'\n\s*\n', text) if p.strip()]
+    units = []
+    for paragraph in paragraphs:
+        lines = paragraph.splitlines()
+        if len(lines) > 1 and any(SPEAKER_TURN.match(line) for line in lines):
+            turn = []
+            for line in lines:
+                if SPEAKER_TURN.match(line) and turn:
+                    units.append('\n'.join(turn))
+                    turn = []
+                turn.append(line)
+            units.append('\n'.join(turn))
+        else:
+            units.append(paragraph)
+    return units
+
+
+def split_oversized(unit, max_tokens):
+    words_per_piece = max(1, (max_tokens - 1) * 3 // 4)
+    pieces = []
+    current = []
+    for sentence in SENTENCE_END.split(unit):
+        words = sentence.split()
+        for start in range(0, len(words), words_per_piece):
+            fragment = words[start:start + words_per_piece]
+            if current and len(current) + len(fragment) > words_per_piece:
+                pieces.append(' '.join(current))
+                current = []
+            current.extend(fragment)
+    if current:
+        pieces.append(' '.join(current))
+    return pieces
+
+
+def iter_chunks(pieces, max_tokens=1500):
+    current = []
+    current_tokens = 0
+    for piece in pieces:
+        for unit in split_units(piece):
+            unit_tokens = estimate_tokens(unit)
+            parts = [unit] if unit_tokens <= max_tokens else split_oversized(unit, max_tokens)
+            for part in parts:
+                part_tokens = estimate_tokens(part)
+                if current and current_tokens + part_tokens > max_tokens:
+                    yield '\n\n'.join(current)
+                    current = []
+                    current_tokens = 0
+                current.append(part)
+                current_tokens += part_tokens
+    if current:
+        yield '\n\n'.join(current)
+
+
+def split_transcript(text, max_tokens=1500):
+    return list(iter_chunks([text], max_tokens)) or [text]
+
+
+def normalise_description(description):
+    return re.findall(r'\w+', (description or '').lower())
+
+
+def is_near_duplicate(a, b, threshold=0.85):
+    a = normalise_description(a.get('description'))
+    b = normalise_description(b.get('description'))
+    if not a or not b:
+        return False
+    return a == b or SequenceMatcher(None, a, b, autojunk=False).ratio() >= threshold
+
+
+def merge_into(existing, duplicate):
+    quotes = list(existing.get('source_quotes') or [])
+    for quote in duplicate.get('source_quotes') or []:
+        if quote not in quotes:
+            quotes.append(quote)
+    existing['source_quotes'] = quotes
+    if not existing.get('deadline') and duplicate.get('deadline'):
+        existing['deadline'] = duplicate['deadline']
+    if (duplicate.get('assignee') and
+            (duplicate.get('assignee_confidence') or 0) > (existing.get('assignee_confidence') or 0)):
+        existing['assignee'] = duplicate['assignee']
+        existing['assignee_confidence'] = duplicate.get('assignee_confidence')
+
+
+class OrderedTaskMerger:
+    def __init__(self, on_task=None, threshold=0.85):
+        self.on_task = on_task
+        self.threshold = threshold
+        self.tasks = []
+        self._pending = defaultdict(list)
+        self._finished = set()
+        self._frontier = 0
+        self._lock = threading.Lock()
+
+    def add(self, chunk_index, task):
+        with self._lock:
+            if chunk_index == self._frontier:
+                self._accept(task)
+            else:
+                self._pending[chunk_index].append(task)
+
+    def finish_chunk(self, chunk_index):
+        with self._lock:
+            self._finished.add(chunk_index)
+            while self._frontier in self._finished:
+                self._frontier += 1
+                for task in self._pending.pop(self._frontier, []):
+                    self._accept(task)
+
+    def _accept(self, task):
+        if not isinstance(task, dict):
+            return
+        for existing in self.tasks:
+            if is_near_duplicate(existing, task, self.threshold):
+                merge_into(existing, task)
+                return
+        task = dict(task)
+        task['id'] = f"T{len(self.tasks) + 1}"
+        self.tasks.append(task)
+        if self.on_task is not None:
+            self.on_task(dict(task))
+
+
+def extract_tasks_from_chunks(chunks, analyse_chunk, parallelism=2, on_task=None, threshold=0.85):
+    chunks = iter(chunks)
+    first = next(chunks, None)
+    second = next(chunks, None)
+    if first is None:
+        return {'tasks': []}
+
+    # on_task is always called on this thread, so callers can use their own
+    # database session in it; workers only queue accepted tasks.
+    accepted = queue.SimpleQueue()
+    merger = OrderedTaskMerger(on_task=accepted.put, threshold=threshold)
+
+    def deliver():
+        while True:
+            try:
+                task = accepted.get_nowait()
+            except queue.Empty:
+                return
+            if on_task is not None:
+                on_task(task)
+
+    def run_chunk(index, chunk, on_chunk_task=None):
+        streamed = []
+
+        def collect(task):
+            streamed.append(task)
+            merger.add(index, task)
+            if on_chunk_task is not None:
+                on_chunk_task()
+
+        result = analyse_chunk(chunk, collect)
+        for task in result.get('tasks', [])[len(streamed):]:
+            merger.add(index, task)
+        merger.finish_chunk(index)
+
+    if second is None:
+        run_chunk(0, first, deliver)
+        deliver()
+        return {'tasks': merger.tasks}
+
+    parallelism = max(1, parallelism)
+    print(f"Analysing transcript in chunks, {parallelism} at a time")
+    count = 0
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        running = set()
+        for chunk in [first, second]:
+            running.add(executor.submit(run_chunk, count, chunk))
+            count += 1
+        for chunk in chunks:
+            while len(running) >= parallelism * 2:
+                done, running = wait(running, timeout=0.05, return_when=FIRST_COMPLETED)
+                deliver()
+                for future in done:
+                    future.result()
+            running.add(executor.submit(run_chunk, count, chunk))
+            count += 1
+            deliver()
+        while running:
+            done, running = wait(running, timeout=0.05, return_when=FIRST_COMPLETED)
+            deliver()
+            for future in done:
+                future.result()
+    deliver()
+    print(f"Analysed {count} chunks")
+    return {'tasks': merger.tasks}
+
+
+def extract_tasks_map_reduce(text, analyse_chunk, max_tokens=1500, parallelism=2, on_task=None, threshold=0.85):
+    return extract_tasks_from_chunks(
+        split_transcript(text, max_tokens),
+        analyse_chunk,
+        parallelism=parallelism,
+        on_task=on_task,
+        threshold=threshold
+    )
+
+
+def match_tasks(previous, current, threshold=0.6, quote_bonus=0.25):
+    # Pairs tasks from an earlier analysis with the ones a new analysis
+    # found, best matches first, so re-analysing a meeting can update tasks
+    # in place. A reworded task still matches when it cites the same quote.
+    def quotes(task):
+        return {quote for quote in task.get('source_quotes') or [] if isinstance(quote, str)}
+
+    current_words = [normalise_description(task.get('description')) for task in current]
+    current_quotes = [quotes(task) for task in current]
+    scored = []
+    for i, task in enumerate(previous):
+        words = normalise_description(task.get('description'))
+        task_quotes = quotes(task)
+        for j, other in enumerate(current_words):
+            if not words or not other:
+                continue
+            score = 1.0 if words == other else SequenceMatcher(None, words, other, autojunk=False).ratio()
+            if task_quotes & current_quotes[j]:
+                score += quote_bonus
+            if score >= threshold:
+                scored.append((-score, i, j))
+
+    pairs = []
+    used_previous, used_current = set(), set()
+    for _, i, j in sorted(scored):
+        if i not in used_previous and j not in used_current:
+            used_previous.add(i)
+            used_current.add(j)
+            pairs.append((i, j))
+    return pairs
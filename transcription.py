@@ -0,0 +1,182 @@
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+_spawn_lock = threading.Lock()
+
+_worker_model = None
+
+
+def _init_worker(model_name, threads):
+    global _worker_model
+    import torch
+    import whisper
+    torch.set_num_threads(threads)
+    _worker_model = whisper.load_model(model_name, device="cpu")
+
+
+def _transcribe_segment(audio):
+    result = _worker_model.transcribe(audio, fp16=False)
+    return result.get('text', '').strip()
+
+
+@contextmanager
+def _spawning_without_main():
+    # A spawned process re-runs the parent's __main__ script before it
+    # unpickles anything. Under `python app.py` that would rebuild the Flask
+    # app, database engine and job queues in every worker; the workers only
+    # need this module, which must not import app.
+    main = sys.modules['__main__']
+    with _spawn_lock:
+        sys.modules['__main__'] = types.ModuleType('__main__')
+        try:
+            yield
+        finally:
+            sys.modules['__main__'] = main
+
+
+def frame_energies(audio, frame_samples):
+    usable = len(audio) - (len(audio) % frame_samples)
+    frames = audio[:usable].reshape(-1, frame_samples)
+    return np.sqrt(np.mean(frames ** 2, axis=1))
+
+
+def split_on_silence(audio, segment_seconds=60, overlap_seconds=2, search_seconds=5, frame_ms=30):
+    total = len(audio)
+    segment_samples = int(segment_seconds * SAMPLE_RATE)
+    if total <= segment_samples:
+        return [(0, total)]
+
+    frame_samples = int(SAMPLE_RATE * frame_ms / 1000)
+    energies = frame_energies(audio, frame_samples)
+    search_frames = int(search_seconds * 1000 / frame_ms)
+    overlap_samples = int(overlap_seconds * SAMPLE_RATE)
+
+    cuts = []
+    target = segment_samples
+    while target < total - segment_samples // 4:
+        centre = target // frame_samples
+        lo = max(0, centre - search_frames)
+        hi = min(len(energies), centre + search_frames + 1)
+        if hi > lo:
+            quietest = lo + int(np.argmin(energies[lo:hi]))
+            cut = quietest * frame_samples + frame_samples // 2
+        else:
+            cut = target
+        cuts.append(cut)
+        target = cut + segment_samples
+
+    bounds = []
+    start = 0
+    for cut in cuts + [total]:
+        bounds.append((max(0, start - overlap_samples), cut))
+        start = cut
+    return bounds
+
+
+def _normalise_word(word):
+    return re.sub(r'[^\w]', '', word.lower())
+
+
+def stitch_texts(texts, max_overlap_words=20):
+    words = []
+    for text in texts:
+        incoming = text.split()
+        if not incoming:
+            continue
+        if words:
+            limit = min(max_overlap_words, len(words), len(incoming))
+            tail = [_normalise_word(w) for w in words[-limit:]]
+            head = [_normalise_word(w) for w in incoming[:limit]]
+            for size in range(limit, 0, -1):
+                if tail[-size:] == head[:size]:
+                    incoming = incoming[size:]
+                    break
+        words.extend(incoming)
+    return ' '.join(words)
+
+
+class ChunkedTranscriber:
+    def __init__(self, model_name='base', workers=None, segment_seconds=60, overlap_seconds=2,
+                 min_chunked_seconds=120, local_transcribe=None):
+        self.model_name = model_name
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.segment_seconds = segment_seconds
+        self.overlap_seconds = overlap_seconds
+        self.min_chunked_seconds = min_chunked_seconds
+        self.local_transcribe = local_transcribe
+        self._pool = None
+        self._active = 0
+        self._last_used = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _acquire_pool(self):
+        # Spawned, not forked: the pool is started from a job thread while
+        # other threads may hold locks (torch/OpenMP among them) that a
+        # forked child would inherit locked. Workers load their own model.
+        with self._lock:
+            if self._pool is None:
+                threads = max(1, (os.cpu_count() or 1) // self.workers)
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(self.model_name, threads)
+                )
+            self._active += 1
+            return self._pool
+
+    def _release_pool(self):
+        with self._lock:
+            self._active -= 1
+            self._last_used = time.monotonic()
+
+    def transcribe(self, file_path):
+        import whisper
+        audio = whisper.load_audio(file_path)
+        return self.transcribe_array(audio)
+
+    def transcribe_array(self, audio):
+        duration = len(audio) / SAMPLE_RATE
+        if duration < self.min_chunked_seconds and self.local_transcribe is not None:
+            return self.local_transcribe(audio)
+
+        bounds = split_on_silence(audio, self.segment_seconds, self.overlap_seconds)
+        segments = [audio[start:end] for start, end in bounds]
+        print(f"Transcribing {duration:.0f}s of audio in {len(segments)} segments on {self.workers} workers")
+
+        pool = self._acquire_pool()
+        try:
+            # Worker processes are started as segments are submitted.
+            with _spawning_without_main():
+                results = pool.map(_transcribe_segment, segments)
+            texts = list(results)
+        finally:
+            self._release_pool()
+        return stitch_texts(texts)
+
+    def close_if_idle(self, idle_seconds):
+        # Each worker holds its own copy of the model; stop them once no
+        # recording has needed them for a while.
+        with self._lock:
+            if self._pool is None or self._active or time.monotonic() - self._last_used < idle_seconds:
+                return False
+            print(f"Stopping idle transcription workers for Whisper '{self.model_name}'")
+            self._pool.shutdown()
+            self._pool = None
+            return True
+
+    def close(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None